@@ -6,12 +6,102 @@ while preserving DAG dependencies and scrum-leader agent compatibility.
 """
 
 import json
+import mmap
+import os
 import re
-import subprocess
+import shutil
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
 from typing import Dict, Optional, List, Tuple
 
+
+_ORG_ID_RE = re.compile(r'^\s*:ID:\s+(\S+)')
+# Trailing ":tag:tag:" block of an org heading
+_TAG_SECTION_RE = re.compile(r'\s(:[\w@#%:-]+:)\s*$')
+
+# Heading tags that name a service
+_SERVICE_TAGS = (
+    "flash-arbitrage", "polygon-adapter", "market-data",
+    "execution", "strategies", "protocol", "codec",
+)
+_SERVICE_RE = re.compile(r':(' + '|'.join(map(re.escape, _SERVICE_TAGS)) + r')(?=:)')
+
+# Bytes that may continue a task ID, for boundary checks on raw file buffers
+_ID_CHARS = frozenset(b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-')
+
+
+# Per-task patterns embed an escaped task name, so compile each once and reuse
+@lru_cache(maxsize=512)
+def _heading_re(name: str) -> re.Pattern:
+    return re.compile(rf'\*+.*{re.escape(name)}')
+
+
+@lru_cache(maxsize=512)
+def _status_re(task_id: str) -> re.Pattern:
+    return re.compile(rf'(\*+\s+)(TODO|IN-PROGRESS|DONE|NEXT)(\s+\[#[A-Z]\]\s+.*{re.escape(task_id)})')
+
+
+def _find_bounded(buf, needle: bytes) -> int:
+    """Find needle in buf where it is not part of a longer ID or word.
+    
+    Plain substring search would let 'fix-x' match inside 'fix-xyz'.
+    """
+    size = len(buf)
+    start = buf.find(needle)
+    while start != -1:
+        end = start + len(needle)
+        if ((start == 0 or buf[start - 1] not in _ID_CHARS)
+                and (end == size or buf[end] not in _ID_CHARS)):
+            return start
+        start = buf.find(needle, start + 1)
+    return -1
+
+
+def _dump_json(data, pretty: bool = False) -> str:
+    """Serialize state compactly, or indented for human readers."""
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    """Replace a file's contents atomically.
+    
+    Same scheme as TaskParser._write_text_atomic: a uniquely named temp file
+    in the same directory is fsynced and renamed over the target, so a crash
+    leaves either the old or the new file and concurrent writers never share
+    a temp file. The target's permissions are kept; the temp file is removed
+    on failure. Raises OSError on failure.
+    """
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=path.parent,
+                                     suffix='.tmp', delete=False) as tmp:
+        try:
+            tmp.write(text)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    try:
+        if path.exists():
+            shutil.copymode(path, tmp.name)
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+
+def _write_json_atomic(path: Path, data, pretty: bool = False) -> None:
+    _write_text_atomic(path, _dump_json(data, pretty))
+
+
+def _org_heading_to_markdown(line: str, level: int) -> str:
+    """Swap an org heading's leading stars for markdown hashes."""
+    return "#" * min(level, 6) + line[level:]
+
+
 class OrgModeBridge:
     """Adapts org-mode tasks for cc-sessions compatibility."""
     
@@ -20,78 +110,164 @@ class OrgModeBridge:
         self.tasks_dir = self.project_root / ".claude" / "tasks"
         self.state_dir = self.project_root / ".claude" / "state"
         self.index_file = self.tasks_dir / "index.org"
+        self.task_index_file = self.state_dir / "task_index.json"
+        # task_id -> (org_file, line number), rebuilt per file when its mtime changes
+        self._index_cache: Optional[Dict[str, Tuple[str, int]]] = None
+        self._index_files: Dict[str, Dict] = {}
+        # current_task.json as (mtime_ns, parsed state) and (mtime_ns, text)
+        self._state_cache: Optional[Tuple[int, Dict]] = None
+        self._last_written: Optional[Tuple[int, str]] = None
+        # Lookups are memoized per org-file mtime snapshot
+        self._find_org_task_cached = lru_cache(maxsize=256)(self._find_org_task_uncached)
         
     def get_current_task(self) -> Optional[Dict]:
         """Read current task from cc-sessions state."""
         state_file = self.state_dir / "current_task.json"
-        if state_file.exists():
+        try:
+            mtime = state_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        
+        if self._state_cache is None or self._state_cache[0] != mtime:
             with open(state_file) as f:
-                return json.load(f)
-        return None
+                self._state_cache = (mtime, json.load(f))
+        return self._state_cache[1]
+    
+    def _project_org_files(self) -> List[str]:
+        """List project org files, sorted, without building Path objects."""
+        try:
+            with os.scandir(self.tasks_dir / "projects") as entries:
+                return sorted(
+                    entry.path for entry in entries
+                    if entry.name.endswith(".org") and entry.is_file(follow_symlinks=False)
+                )
+        except FileNotFoundError:
+            return []
+    
+    def _org_files(self) -> List[str]:
+        """List org files in lookup order: index.org first, then projects."""
+        files = [str(self.index_file)] if self.index_file.exists() else []
+        files.extend(self._project_org_files())
+        return files
+    
+    def _scan_org_ids(self, org_file: str) -> Dict[str, int]:
+        """Map every :ID: property in an org file to its line number."""
+        ids = {}
+        with open(org_file) as f:
+            for lineno, line in enumerate(f):
+                match = _ORG_ID_RE.match(line)
+                if match:
+                    ids.setdefault(match.group(1), lineno)
+        return ids
+    
+    def _org_files_signature(self) -> Tuple[Tuple[str, int], ...]:
+        """Snapshot (path, mtime) of every org file a lookup can read."""
+        return tuple((path, os.stat(path).st_mtime_ns) for path in self._org_files())
+    
+    def _load_task_index(self, mtimes: Dict[str, int]) -> Dict[str, Tuple[str, int]]:
+        """Return the task ID index, rescanning only org files that changed."""
+        if self._index_cache is None:
+            self._index_cache = {}
+            if self.task_index_file.exists():
+                try:
+                    with open(self.task_index_file) as f:
+                        self._index_files = json.load(f).get("files", {})
+                except (OSError, ValueError):
+                    self._index_files = {}
+        
+        changed = False
+        for path in list(self._index_files):
+            if path not in mtimes:
+                del self._index_files[path]
+                changed = True
+        for path, mtime in mtimes.items():
+            entry = self._index_files.get(path)
+            if entry is None or entry.get("mtime") != mtime:
+                self._index_files[path] = {"mtime": mtime, "ids": self._scan_org_ids(path)}
+                changed = True
+        
+        if changed or not self._index_cache:
+            index = {}
+            # Earlier files win on duplicate IDs, matching the lookup order
+            for path in mtimes:
+                for tid, lineno in self._index_files[path]["ids"].items():
+                    index.setdefault(tid, (path, lineno))
+            self._index_cache = index
+        
+        if changed:
+            self.state_dir.mkdir(exist_ok=True)
+            _write_json_atomic(self.task_index_file, {"files": self._index_files})
+        
+        return self._index_cache
     
     def find_org_task(self, task_name: str) -> Optional[Tuple[str, str]]:
-        """Find org-mode task by name, return (file_path, task_id)."""
-        # First check index.org
+        """Find org-mode task by name, return (file_path, task_id).
+        
+        Results are cached until any org file is added, removed or modified.
+        """
+        return self._find_org_task_cached(self._org_files_signature(), task_name)
+    
+    def _find_org_task_uncached(self, signature: Tuple[Tuple[str, int], ...],
+                                task_name: str) -> Optional[Tuple[str, str]]:
+        # Exact :ID: matches come straight from the index
+        indexed = self._load_task_index(dict(signature)).get(task_name)
+        if indexed and indexed[0] == str(self.index_file):
+            return (indexed[0], task_name)
+        
+        # First check index.org headings
         if self.index_file.exists():
+            heading_re = _heading_re(task_name)
             with open(self.index_file) as f:
-                content = f.read()
-                # Look for task ID in properties
-                id_pattern = rf':ID:\s+({re.escape(task_name)})'
-                match = re.search(id_pattern, content, re.MULTILINE)
-                if match:
-                    return (str(self.index_file), match.group(1))
-                
-                # Also check in headings
-                heading_pattern = rf'\*+.*{re.escape(task_name)}'
-                if re.search(heading_pattern, content):
-                    return (str(self.index_file), task_name)
+                for line in f:
+                    if heading_re.search(line):
+                        return (str(self.index_file), task_name)
+        
+        if indexed:
+            return (indexed[0], task_name)
         
         # Check project files
-        for org_file in self.tasks_dir.glob("projects/*.org"):
-            with open(org_file) as f:
-                content = f.read()
-                if task_name in content:
-                    return (str(org_file), task_name)
+        needle = task_name.encode()
+        for org_file in self._project_org_files():
+            with open(org_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    continue
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    if _find_bounded(buf, needle) != -1:
+                        return (org_file, task_name)
         
         return None
     
     def org_to_markdown_context(self, org_file: str, task_id: str) -> str:
         """Convert org-mode task to markdown format for cc-sessions agents."""
-        with open(org_file) as f:
-            lines = f.readlines()
-        
         markdown_content = []
         in_task = False
         task_level = 0
+        # Most recent heading seen, so the task heading is known when its :ID: appears
+        last_heading = None
+        last_level = 0
         
-        for line in lines:
-            # Detect task start
-            if f":ID:" in line and task_id in line:
-                in_task = True
-                # Find the heading above this ID
-                for i in range(len(lines)):
-                    if lines[i] == line:
-                        # Go backwards to find the heading
-                        for j in range(i-1, -1, -1):
-                            if lines[j].startswith("*"):
-                                task_level = lines[j].count("*")
-                                # Convert org heading to markdown
-                                heading = lines[j].replace("*", "#" * min(task_level, 6))
-                                markdown_content.append(heading)
-                                break
-                        break
-                continue
-            
-            if in_task:
+        with open(org_file) as f:
+            for line in f:
+                level = len(line) - len(line.lstrip("*")) if line.startswith("*") else 0
+                
+                if not in_task:
+                    if level:
+                        last_heading, last_level = line, level
+                    elif ":ID:" in line and task_id in line and last_heading:
+                        # Detect task start and convert the heading above it
+                        in_task = True
+                        task_level = last_level
+                        markdown_content.append(_org_heading_to_markdown(last_heading, last_level))
+                    continue
+                
                 # Stop at next task of same or higher level
-                if line.startswith("*" * task_level) and line != lines[0]:
+                if level and level <= task_level:
                     break
                 
                 # Convert org-mode syntax to markdown
-                if line.startswith("*"):
+                if level:
                     # Convert heading
-                    level = line.count("*")
-                    line = line.replace("*", "#" * min(level, 6))
+                    line = _org_heading_to_markdown(line, level)
                 elif line.strip().startswith("- [ ]"):
                     # Checkbox remains the same
                     pass
@@ -115,9 +291,6 @@ class OrgModeBridge:
         if not org_file:
             return False
         
-        with open(org_file) as f:
-            content = f.read()
-        
         # Map cc-sessions status to org-mode
         status_map = {
             "pending": "TODO",
@@ -127,21 +300,47 @@ class OrgModeBridge:
         
         org_status = status_map.get(new_status, "TODO")
         
-        # Update the task status
-        pattern = rf'(\*+\s+)(TODO|IN-PROGRESS|DONE|NEXT)(\s+\[#[A-Z]\]\s+.*{re.escape(task_id)})'
+        # Update the task status, streaming into a temp file beside the original
+        status_re = _status_re(task_id)
         replacement = rf'\1{org_status}\3'
+        changed = False
         
-        new_content = re.sub(pattern, replacement, content)
+        org_path = Path(org_file)
+        with open(org_path) as src, tempfile.NamedTemporaryFile(
+                'w', dir=org_path.parent, prefix=f".{org_path.name}.", delete=False) as dst:
+            try:
+                for line in src:
+                    new_line, count = status_re.subn(replacement, line)
+                    # Only matched lines need comparing; the status may already be set
+                    if count and new_line != line:
+                        changed = True
+                    dst.write(new_line)
+            except BaseException:
+                # Don't leave the partial copy next to the org file
+                dst.close()
+                os.unlink(dst.name)
+                raise
         
-        if new_content != content:
-            with open(org_file, 'w') as f:
-                f.write(new_content)
-            return True
+        try:
+            if changed:
+                shutil.copymode(org_path, dst.name)
+                os.replace(dst.name, org_path)
+                return True
+        except BaseException:
+            os.unlink(dst.name)
+            raise
         
+        os.unlink(dst.name)
         return False
     
-    def sync_to_sessions_state(self, task_name: str, branch: str = None) -> Dict:
-        """Create/update cc-sessions state from org-mode task."""
+    def sync_to_sessions_state(self, task_name: str, branch: str = None,
+                               pretty: bool = False) -> Dict:
+        """Create/update cc-sessions state from org-mode task.
+        
+        The state file is written compactly unless pretty is set.
+        """
+        from datetime import datetime
+        
         org_file, task_id = self.find_org_task(task_name) or (None, None)
         
         if not branch:
@@ -162,10 +361,26 @@ class OrgModeBridge:
             "org_task_id": task_id
         }
         
-        # Save to cc-sessions state
-        self.state_dir.mkdir(exist_ok=True)
-        with open(self.state_dir / "current_task.json", 'w') as f:
-            json.dump(state, f, indent=2)
+        # Save to cc-sessions state, skipping the write if nothing changed
+        state_file = self.state_dir / "current_task.json"
+        payload = _dump_json(state, pretty)
+        try:
+            mtime = state_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime is None:
+            current = None
+        elif self._last_written is not None and self._last_written[0] == mtime:
+            current = self._last_written[1]
+        else:
+            # Written by another process since we last looked
+            current = state_file.read_text()
+        if payload != current:
+            self.state_dir.mkdir(exist_ok=True)
+            _write_text_atomic(state_file, payload)
+            mtime = state_file.stat().st_mtime_ns
+        self._last_written = (mtime, payload)
+        self._state_cache = (mtime, state)
         
         return state
     
@@ -174,21 +389,27 @@ class OrgModeBridge:
         if not org_file:
             return []
         
+        # The task heading either contains the id itself or owns the
+        # :ID: property drawer that does; its trailing tags name services
+        heading = None
+        last_heading = None
         with open(org_file) as f:
-            content = f.read()
-        
-        # Look for tags in the task line
-        pattern = rf'\*+.*{re.escape(task_id)}.*:([\w:]+):'
-        match = re.search(pattern, content)
+            for line in f:
+                if line.startswith("*"):
+                    if task_id in line:
+                        heading = line
+                        break
+                    last_heading = line
+                    continue
+                match = _ORG_ID_RE.match(line)
+                if match and match.group(1) == task_id:
+                    heading = last_heading
+                    break
         
-        if match:
-            tags = match.group(1).split(":")
-            # Filter for service-related tags
-            services = [tag for tag in tags if tag in [
-                "flash-arbitrage", "polygon-adapter", "market-data",
-                "execution", "strategies", "protocol", "codec"
-            ]]
-            return services
+        if heading:
+            match = _TAG_SECTION_RE.search(heading)
+            if match:
+                return _SERVICE_RE.findall(match.group(1))
         
         return []
     
@@ -220,35 +441,38 @@ def main():
     
     bridge = OrgModeBridge()
     
-    if len(sys.argv) < 2:
-        print("Usage: org-mode-bridge.py <command> [args]")
+    pretty = "--pretty" in sys.argv
+    args = [arg for arg in sys.argv if arg != "--pretty"]
+    
+    if len(args) < 2:
+        print("Usage: org-mode-bridge.py <command> [args] [--pretty]")
         print("Commands:")
         print("  current - Show current task")
         print("  find <task> - Find org task")
-        print("  sync <task> [branch] - Sync to sessions state")
+        print("  sync <task> [branch] - Sync to sessions state (--pretty: indent state file)")
         print("  convert <task> - Convert to markdown")
         return
     
-    command = sys.argv[1]
+    command = args[1]
     
     if command == "current":
         task = bridge.get_current_task()
         print(json.dumps(task, indent=2) if task else "No current task")
     
-    elif command == "find" and len(sys.argv) > 2:
-        result = bridge.find_org_task(sys.argv[2])
+    elif command == "find" and len(args) > 2:
+        result = bridge.find_org_task(args[2])
         if result:
             print(f"Found: {result[0]} (ID: {result[1]})")
         else:
             print("Task not found")
     
-    elif command == "sync" and len(sys.argv) > 2:
-        branch = sys.argv[3] if len(sys.argv) > 3 else None
-        state = bridge.sync_to_sessions_state(sys.argv[2], branch)
+    elif command == "sync" and len(args) > 2:
+        branch = args[3] if len(args) > 3 else None
+        state = bridge.sync_to_sessions_state(args[2], branch, pretty)
         print(json.dumps(state, indent=2))
     
-    elif command == "convert" and len(sys.argv) > 2:
-        md_file = bridge.create_markdown_task_file(sys.argv[2])
+    elif command == "convert" and len(args) > 2:
+        md_file = bridge.create_markdown_task_file(args[2])
         if md_file:
             print(f"Created: {md_file}")
         else:
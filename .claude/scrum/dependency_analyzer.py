@@ -6,34 +6,113 @@ Advanced dependency analysis, visualization, and suggestion engine
 
 import sys
 import os
-import subprocess
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
 from collections import defaultdict, deque
-from yaml_parser import TaskParser
+from itertools import groupby
 import json
 
+# DOT node styling
+_STATUS_COLOR = {
+    'COMPLETE': 'lightgreen',
+    'DONE': 'lightgreen',
+    'IN_PROGRESS': 'yellow',
+    'BLOCKED': 'pink',
+}
+_PRIO_SHAPE = {
+    'CRITICAL': 'octagon',
+    'HIGH': 'diamond',
+}
+
+# Timeline sprint status markers
+_STATUS_EMOJI = {
+    'COMPLETE': '✅',
+    'IN_PROGRESS': '🔄',
+    'PARTIAL': '⚠️',
+    'TODO': '⏳',
+}
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Every 3-character substring of text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
 class DependencyAnalyzer:
     """Advanced dependency analysis for task system"""
     
     def __init__(self):
-        self.parser = TaskParser()
+        self._parser = None
         self.task_dir = Path(__file__).parent.parent / "tasks"
+        # Graph is reused across analyses until a task file changes
+        self._graph_cache: Optional[Tuple[Dict[str, List[str]], Dict[str, Dict]]] = None
+        self._graph_sig: Optional[Tuple] = None
+        # Scope lookup tables, rebuilt alongside the graph
+        self._scope_tasks: List[Tuple[str, str, str, List[str]]] = []
+        self._scope_grams: Dict[str, Set[int]] = {}
+        self._scope_items: Dict[str, Set[int]] = {}
+        # Integer-indexed view of the graph for the hot loops: node i is
+        # _node_ids[i], _succ[i] are its dependents, _deps[i] its dependencies
+        self._node_ids: List[str] = []
+        self._succ: List[List[int]] = []
+        self._deps: List[List[int]] = []
+        
+    @property
+    def parser(self):
+        """TaskParser, imported on first use so commands start without PyYAML"""
+        if self._parser is None:
+            from yaml_parser import TaskParser
+            self._parser = TaskParser()
+        return self._parser
+        
+    def _task_files_signature(self) -> Tuple:
+        """Snapshot (path, mtime) of every task file the parser reads"""
+        return tuple(sorted(
+            (str(task_file), task_file.stat().st_mtime_ns)
+            for task_file in self.task_dir.glob('sprint-*/*.md')
+        ))
         
     def build_dependency_graph(self) -> Tuple[Dict[str, List[str]], Dict[str, Dict]]:
         """
         Build complete dependency graph from all tasks
         
+        The result is cached and only rebuilt when a task file is added,
+        removed or modified.
+        
         Returns:
             Tuple of (adjacency list, task metadata map)
         """
+        signature = self._task_files_signature()
+        if self._graph_cache is not None and signature == self._graph_sig:
+            return self._graph_cache
+        
         all_tasks = self.parser.get_all_tasks()
         
         graph = defaultdict(list)
         task_map = {}
+        scope_tasks = []
+        scope_grams = defaultdict(set)
+        scope_items = defaultdict(set)
         
         for task in all_tasks:
             task_id = task['metadata'].get('task_id', '')
+            # Only string entries of a list scope can match a path; a null
+            # or malformed scope must not break the other commands
+            scope = task['metadata'].get('scope') or []
+            if not isinstance(scope, list):
+                scope = []
+            scope = [scope_item for scope_item in scope if isinstance(scope_item, str)]
+            
+            # Index the trigrams and exact text of each scope entry, by task
+            # position, so scope queries only check the tasks that can match
+            task_pos = len(scope_tasks)
+            scope_tasks.append((task_id, task['metadata'].get('status', 'TODO'),
+                                Path(task['filepath']).name, scope))
+            for scope_item in scope:
+                for gram in _trigrams(scope_item):
+                    scope_grams[gram].add(task_pos)
+                scope_items[scope_item].add(task_pos)
+            
             if not task_id:
                 continue
                 
@@ -50,7 +129,18 @@ class DependencyAnalyzer:
             # Build adjacency list from depends_on
             for dep in task['metadata'].get('depends_on', []):
                 graph[dep].append(task_id)
-                
+        
+        self._graph_cache = (graph, task_map)
+        self._graph_sig = signature
+        self._scope_tasks = scope_tasks
+        self._scope_grams = scope_grams
+        self._scope_items = scope_items
+        
+        node_index = {task_id: i for i, task_id in enumerate(task_map)}
+        self._node_ids = list(task_map)
+        self._succ = [[node_index[s] for s in graph.get(task_id, [])] for task_id in task_map]
+        self._deps = [[node_index[d] for d in info['depends_on'] if d in node_index]
+                      for info in task_map.values()]
         return graph, task_map
     
     def topological_sort(self) -> Tuple[bool, List[str], List[Tuple[str, str]]]:
@@ -60,44 +150,64 @@ class DependencyAnalyzer:
         Returns:
             Tuple of (has_cycle, execution_order, cycle_edges)
         """
-        graph, task_map = self.build_dependency_graph()
+        self.build_dependency_graph()
+        node_ids = self._node_ids
+        deps = self._deps
         
-        # Calculate in-degrees
-        in_degree = defaultdict(int)
-        all_nodes = set(task_map.keys())
-        
-        for node in all_nodes:
-            for neighbor in graph.get(node, []):
-                in_degree[neighbor] += 1
-        
-        # Find nodes with no dependencies
-        queue = deque([node for node in all_nodes if in_degree[node] == 0])
-        execution_order = []
-        
-        while queue:
-            node = queue.popleft()
-            execution_order.append(node)
-            
-            for neighbor in graph.get(node, []):
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
+        order, _ = self._kahn_order()
+        execution_order = [node_ids[i] for i in order]
         
         # Check for cycles
-        has_cycle = len(execution_order) < len(all_nodes)
+        has_cycle = len(order) < len(node_ids)
         
         # Find cycle edges if cycle exists
         cycle_edges = []
         if has_cycle:
             # Find nodes involved in cycles
-            remaining = all_nodes - set(execution_order)
-            for node in remaining:
-                for dep in task_map[node]['depends_on']:
+            remaining = set(range(len(node_ids))) - set(order)
+            for node in sorted(remaining):
+                for dep in deps[node]:
                     if dep in remaining:
-                        cycle_edges.append((node, dep))
+                        cycle_edges.append((node_ids[node], node_ids[dep]))
         
         return has_cycle, execution_order, cycle_edges
     
+    def _kahn_order(self) -> Tuple[List[int], List[int]]:
+        """
+        Kahn's algorithm over the integer graph
+        
+        Returns:
+            Tuple of (node order, per-node level); cyclic nodes are left out
+            of the order. A node's level is the length of the longest
+            dependency chain leading to it, so equal levels can run in parallel.
+        """
+        succ = self._succ
+        
+        # Calculate in-degrees
+        in_degree = [0] * len(succ)
+        for targets in succ:
+            for target in targets:
+                in_degree[target] += 1
+        
+        # Find nodes with no dependencies
+        queue = deque([node for node, degree in enumerate(in_degree) if degree == 0])
+        order = []
+        level = [0] * len(succ)
+        
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            next_level = level[node] + 1
+            
+            for target in succ[node]:
+                if level[target] < next_level:
+                    level[target] = next_level
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    queue.append(target)
+        
+        return order, level
+    
     def find_critical_path(self) -> List[str]:
         """
         Find the critical path through the dependency graph
@@ -106,42 +216,33 @@ class DependencyAnalyzer:
             List of task IDs forming the longest dependency chain
         """
         graph, task_map = self.build_dependency_graph()
+        _, execution_order, _ = self.topological_sort()
         
-        # Reverse graph for finding longest path
-        reverse_graph = defaultdict(list)
-        for node, neighbors in graph.items():
-            for neighbor in neighbors:
-                reverse_graph[neighbor].append(node)
-        
-        # Dynamic programming to find longest path
+        # Longest path over a DAG: walk the topological order backwards so
+        # every successor is settled before the tasks that depend on it
         longest_path = {}
         path_next = {}
         
-        def dfs(node):
-            if node in longest_path:
-                return longest_path[node]
-                
+        for node in reversed(execution_order):
             max_path = 0
             next_node = None
             
             for neighbor in graph.get(node, []):
-                neighbor_path = dfs(neighbor)
-                if neighbor_path >= max_path:
+                neighbor_path = longest_path.get(neighbor)
+                if neighbor_path is not None and neighbor_path >= max_path:
                     max_path = neighbor_path
                     next_node = neighbor
             
             longest_path[node] = max_path + 1
             if next_node:
                 path_next[node] = next_node
-            
-            return longest_path[node]
         
         # Find longest path from all nodes
         max_length = 0
         start_node = None
         
         for node in task_map.keys():
-            path_length = dfs(node)
+            path_length = longest_path.get(node, 0)
             if path_length > max_length:
                 max_length = path_length
                 start_node = node
@@ -162,25 +263,46 @@ class DependencyAnalyzer:
         Returns:
             List of bottleneck tasks sorted by impact
         """
-        graph, task_map = self.build_dependency_graph()
+        _, task_map = self.build_dependency_graph()
+        succ = self._succ
+        
+        # Transitive closure in one reverse-topological sweep: each task's
+        # dependents are the union of its successors' dependents, kept as
+        # int bitmasks indexed by task position
+        dependents = [None] * len(succ)
+        order, _ = self._kahn_order()
+        for node in reversed(order):
+            mask = 0
+            for target in succ[node]:
+                target_mask = dependents[target]
+                if target_mask is None:
+                    # Successor sits in or behind a cycle; fall back to BFS below
+                    break
+                mask |= target_mask | (1 << target)
+            else:
+                dependents[node] = mask
         
         bottlenecks = []
         
-        for task_id, task_info in task_map.items():
+        for node, (task_id, task_info) in enumerate(task_map.items()):
             # Count direct blocks
-            direct_blocks = len(graph.get(task_id, []))
+            direct_blocks = len(succ[node])
             
             # Count transitive blocks (all tasks that depend on this transitively)
-            visited = set()
-            queue = deque(graph.get(task_id, []))
-            
-            while queue:
-                node = queue.popleft()
-                if node not in visited:
-                    visited.add(node)
-                    queue.extend(graph.get(node, []))
-            
-            transitive_blocks = len(visited)
+            mask = dependents[node]
+            if mask is not None:
+                transitive_blocks = bin(mask).count('1')
+            else:
+                visited = set()
+                queue = deque(succ[node])
+                
+                while queue:
+                    target = queue.popleft()
+                    if target not in visited:
+                        visited.add(target)
+                        queue.extend(succ[target])
+                
+                transitive_blocks = len(visited)
             
             if direct_blocks > 0 or transitive_blocks > 0:
                 bottlenecks.append({
@@ -204,12 +326,15 @@ class DependencyAnalyzer:
         Returns:
             DOT format string
         """
-        graph, task_map = self.build_dependency_graph()
-        
-        dot_lines = ['digraph TaskDependencies {']
-        dot_lines.append('  rankdir=LR;')
-        dot_lines.append('  node [shape=box, style=rounded];')
-        dot_lines.append('')
+        _, task_map = self.build_dependency_graph()
+        return '\n'.join(self._iter_dot_lines(task_map))
+    
+    def _iter_dot_lines(self, task_map: Dict[str, Dict]):
+        """Yield DOT source lines for the task graph"""
+        yield 'digraph TaskDependencies {'
+        yield '  rankdir=LR;'
+        yield '  node [shape=box, style=rounded];'
+        yield ''
         
         # Group by sprint
         sprints = defaultdict(list)
@@ -219,45 +344,25 @@ class DependencyAnalyzer:
         # Add subgraphs for each sprint
         for sprint, tasks in sorted(sprints.items()):
             if sprint != 'unknown':
-                dot_lines.append(f'  subgraph "cluster_{sprint}" {{')
-                dot_lines.append(f'    label="{sprint}";')
-                dot_lines.append('    style=filled;')
-                dot_lines.append('    fillcolor=lightgrey;')
+                yield f'  subgraph "cluster_{sprint}" {{\n    label="{sprint}";\n    style=filled;\n    fillcolor=lightgrey;'
                 
                 for task_id in tasks:
                     info = task_map[task_id]
-                    
-                    # Color based on status
-                    color = 'white'
-                    if info['status'] == 'COMPLETE' or info['status'] == 'DONE':
-                        color = 'lightgreen'
-                    elif info['status'] == 'IN_PROGRESS':
-                        color = 'yellow'
-                    elif info['status'] == 'BLOCKED':
-                        color = 'pink'
-                    
-                    # Shape based on priority
-                    shape = 'box'
-                    if info['priority'] == 'CRITICAL':
-                        shape = 'octagon'
-                    elif info['priority'] == 'HIGH':
-                        shape = 'diamond'
-                    
-                    dot_lines.append(f'    "{task_id}" [fillcolor={color}, style=filled, shape={shape}];')
+                    # Color based on status, shape based on priority
+                    color = _STATUS_COLOR.get(info['status'], 'white')
+                    shape = _PRIO_SHAPE.get(info['priority'], 'box')
+                    yield f'    "{task_id}" [fillcolor={color}, style=filled, shape={shape}];'
                 
-                dot_lines.append('  }')
-                dot_lines.append('')
+                yield '  }\n'
         
         # Add edges
-        dot_lines.append('  // Dependencies')
+        yield '  // Dependencies'
         for task_id, info in task_map.items():
             for dep in info['depends_on']:
                 if dep in task_map:  # Only show edges for existing tasks
-                    dot_lines.append(f'  "{dep}" -> "{task_id}";')
-        
-        dot_lines.append('}')
+                    yield f'  "{dep}" -> "{task_id}";'
         
-        return '\n'.join(dot_lines)
+        yield '}'
     
     def suggest_parallelization(self) -> List[List[str]]:
         """
@@ -266,58 +371,66 @@ class DependencyAnalyzer:
         Returns:
             List of task groups that can be parallelized
         """
-        has_cycle, execution_order, _ = self.topological_sort()
+        _, task_map = self.build_dependency_graph()
+        node_ids = self._node_ids
         
-        if has_cycle:
+        order, level = self._kahn_order()
+        if len(order) < len(node_ids):
             return []
         
-        graph, task_map = self.build_dependency_graph()
-        
-        # Calculate levels for each task
-        levels = {}
-        
-        for task_id in execution_order:
-            # Find max level of dependencies
-            max_dep_level = -1
-            for dep in task_map[task_id]['depends_on']:
-                if dep in levels:
-                    max_dep_level = max(max_dep_level, levels[dep])
-            
-            levels[task_id] = max_dep_level + 1
-        
-        # Group by level (tasks at same level can be parallel)
-        parallel_groups = defaultdict(list)
-        for task_id, level in levels.items():
-            # Only include TODO tasks
-            if task_map[task_id]['status'] == 'TODO':
-                parallel_groups[level].append(task_id)
+        # Group by level (tasks at same level can be parallel), keeping
+        # execution order within each level; only include TODO tasks
+        todo = [node for node in order if task_map[node_ids[node]]['status'] == 'TODO']
+        todo.sort(key=level.__getitem__)
         
-        # Return non-empty groups
-        return [group for group in parallel_groups.values() if group]
+        return [
+            [node_ids[node] for node in group]
+            for _, group in groupby(todo, key=level.__getitem__)
+        ]
     
     def analyze_scope_impact(self, file_pattern: str) -> List[Dict]:
         """
         Find all tasks that modify files matching a pattern
         
+        A scope entry matches when the pattern is a substring of it or it
+        is a substring of the pattern. The scope index only narrows down
+        which tasks to check; each candidate is checked with that rule.
+        
         Args:
             file_pattern: File path or pattern to search for
             
         Returns:
             List of tasks affecting the specified files
         """
-        all_tasks = self.parser.get_all_tasks()
-        affected_tasks = []
+        self.build_dependency_graph()
+        scope_tasks = self._scope_tasks
         
-        for task in all_tasks:
-            task_id = task['metadata'].get('task_id', '')
-            scope = task['metadata'].get('scope', [])
+        if len(file_pattern) < 3:
+            # Too short to have a trigram: check every task
+            candidates = range(len(scope_tasks))
+        else:
+            # Entries containing the pattern hold all of its trigrams
+            grams = self._scope_grams
+            postings = sorted((grams.get(gram, set()) for gram in _trigrams(file_pattern)), key=len)
+            found = set(postings[0]).intersection(*postings[1:])
             
+            # Entries contained in the pattern are one of its substrings
+            items = self._scope_items
+            n = len(file_pattern)
+            for i in range(n):
+                for j in range(i + 1, n + 1):
+                    found.update(items.get(file_pattern[i:j], ()))
+            candidates = sorted(found)
+        
+        affected_tasks = []
+        for task_pos in candidates:
+            task_id, status, filename, scope = scope_tasks[task_pos]
             for scope_item in scope:
                 if file_pattern in scope_item or scope_item in file_pattern:
                     affected_tasks.append({
                         'task_id': task_id,
-                        'status': task['metadata'].get('status', 'TODO'),
-                        'file': Path(task['filepath']).name,
+                        'status': status,
+                        'file': filename,
                         'scope_match': scope_item
                     })
                     break
@@ -340,24 +453,25 @@ class DependencyAnalyzer:
         # Group tasks by sprint and calculate sprint dependencies
         sprint_tasks = defaultdict(list)
         sprint_deps = defaultdict(set)
+        sprint_succ = defaultdict(list)
         
         for task_id in execution_order:
             if task_id in task_map:
                 sprint = task_map[task_id]['sprint']
                 sprint_tasks[sprint].append(task_id)
                 
-                # Add sprint dependencies
+                # Add sprint dependencies, and the reverse edge for Kahn below
                 for dep in task_map[task_id]['depends_on']:
                     if dep in task_map:
                         dep_sprint = task_map[dep]['sprint']
-                        if dep_sprint != sprint:
+                        if dep_sprint != sprint and dep_sprint not in sprint_deps[sprint]:
                             sprint_deps[sprint].add(dep_sprint)
+                            sprint_succ[dep_sprint].append(sprint)
         
         # Calculate sprint phases using topological sort on sprints
         sprint_in_degree = defaultdict(int)
         for sprint, deps in sprint_deps.items():
-            for dep in deps:
-                sprint_in_degree[sprint] += 1
+            sprint_in_degree[sprint] = len(deps)
         
         sprint_queue = deque([s for s in sprint_tasks.keys() if sprint_in_degree[s] == 0])
         sprint_phases = []
@@ -385,11 +499,10 @@ class DependencyAnalyzer:
             
             # Add next phase
             for sprint in phase_sprints:
-                for next_sprint in sprint_tasks.keys():
-                    if sprint in sprint_deps[next_sprint]:
-                        sprint_in_degree[next_sprint] -= 1
-                        if sprint_in_degree[next_sprint] == 0:
-                            sprint_queue.append(next_sprint)
+                for next_sprint in sprint_succ[sprint]:
+                    sprint_in_degree[next_sprint] -= 1
+                    if sprint_in_degree[next_sprint] == 0:
+                        sprint_queue.append(next_sprint)
         
         return sprint_phases
     
@@ -458,8 +571,7 @@ def main():
         for phase in timeline:
             print(f"\nPhase {phase['phase']}:")
             for sprint in phase['sprints']:
-                status_emoji = {'COMPLETE': '✅', 'IN_PROGRESS': '🔄', 
-                               'PARTIAL': '⚠️', 'TODO': '⏳'}.get(sprint['status'], '❓')
+                status_emoji = _STATUS_EMOJI.get(sprint['status'], '❓')
                 print(f"  {status_emoji} {sprint['name']} ({sprint['task_count']} tasks)")
                 
     elif command == 'tsort':
@@ -8,10 +8,75 @@ import yaml
 import sys
 import os
 import re
+import json
+import mmap
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from yaml_parser import TaskParser
 
+# Scope extraction patterns used by analyze_task_scope; bytes patterns so
+# they can run directly over an mmap of the task file. _SCOPE_FUSED finds
+# backticked code paths and Cargo.toml mentions in a single pass; the
+# "Files to Modify" section is walked line by line.
+_SCOPE_FUSED = re.compile(
+    rb'(?P<code>`(?:libs|services_v2|relays|network|protocol_v2|tests)/[\w/._-]+`)'
+    rb'|(?P<cargo>Cargo\.toml)'
+)
+_FILES_SECTION = b'### Files to Modify'
+_FILE_LINE_RE = re.compile(rb'[`"]?([\w/._-]+\.(?:rs|toml|md|py|sh))[`"]?')
+
+# Sprint documents that are not tasks
+_NON_TASK_FILES = frozenset({'SPRINT_PLAN.md', 'README.md', 'TEST_RESULTS.md'})
+
+# Files smaller than this are read outright; mmap setup costs more than it saves
+_MMAP_MIN_SIZE = 4096
+
+# Chunk size the migrated pre-check reads while looking for the closing ---
+_FRONTMATTER_PEEK = 4096
+
+# A depends_on key in raw frontmatter; a null value still needs migrating
+_DEPENDS_ON_RE = re.compile(rb'^depends_on\s*:[ \t]*(?P<value>[^\n]*)(?P<rest>\n[^\n]*)?', re.MULTILINE)
+_NULL_VALUES = frozenset({b'', b'~', b'null', b'Null', b'NULL'})
+
+# Read buffer for whole-file text reads; covers a typical task in one read
+_READ_BUFFER = 65536
+
+# Keys migrate_task adds; spliced into the frontmatter when none exist yet
+_MIGRATION_KEYS = ('depends_on', 'blocks', 'scope')
+_MIGRATION_KEY_RE = re.compile(r'^(?:depends_on|blocks|scope)\s*:', re.MULTILINE)
+
+# Where plan-migration writes its pending decisions by default
+_DEFAULT_PLAN_FILE = 'migrate-plan.json'
+
+# Per-sprint record of the last migration run: newest task mtime, task
+# count and whether every task ended up migrated
+_MIGRATION_MANIFEST = '.migration_cache.json'
+
+# Task-level dependencies within a sprint, keyed by (sprint, filename token).
+# Tokens are tried in order and the first one found in the filename wins.
+_INTRA_SPRINT_TOKENS = {
+    'sprint-010': ('CODEC-001', 'CODEC-002', 'CODEC-003', 'CODEC-004', 'CODEC-005'),  # Codec separation
+    'sprint-007': ('TASK-001', 'TASK-002', 'TASK-003', 'TASK-004', 'TASK-005', 'TASK-006'),  # Generic relay
+}
+_INTRA_SPRINT_DEPS = {
+    ('sprint-010', 'CODEC-002'): ('CODEC-001',),
+    ('sprint-010', 'CODEC-003'): ('CODEC-002',),
+    ('sprint-010', 'CODEC-004'): ('CODEC-002',),
+    ('sprint-010', 'CODEC-005'): ('CODEC-003', 'CODEC-004'),
+    ('sprint-007', 'TASK-002'): ('S007-T001',),
+    ('sprint-007', 'TASK-003'): ('S007-T002',),
+    ('sprint-007', 'TASK-004'): ('S007-T002', 'S007-T003'),
+    ('sprint-007', 'TASK-005'): ('S007-T004',),
+    ('sprint-007', 'TASK-006'): ('S007-T004',),
+}
+
+# Tasks known to block others, keyed by task_id
+_TASK_BLOCKS = {
+    'CODEC-001': ('S006-T001', 'S007-T001'),  # Blocks macros and relay work
+    'CODEC-002': ('S006-T001', 'S007-T001'),
+    'S010-T005': ('S011-T001',),  # Integration testing blocks control script work
+}
+
 class TaskMigrator:
     """Migrate existing tasks to new format with dependencies and scope"""
     
@@ -19,6 +84,10 @@ class TaskMigrator:
         self.parser = TaskParser()
         self.task_dir = Path(__file__).parent.parent / "tasks"
         
+        # Parsed task files: path -> (mtime_ns, task); a migration parses
+        # each file from both migrate_task and suggest_task_dependencies
+        self._parsed_cache: Dict[str, Tuple[int, Dict]] = {}
+        
         # Known dependency patterns from meta sprint
         self.known_dependencies = {
             'sprint-010': [],  # Depends on sprint-013 completion
@@ -32,6 +101,16 @@ class TaskMigrator:
             'sprint-012': ['sprint-005', 'sprint-004']  # Final documentation
         }
         
+    def _parse_cached(self, filepath: str) -> Dict:
+        """Parse a task file, reusing the result while its mtime is unchanged"""
+        mtime = os.stat(filepath).st_mtime_ns
+        cached = self._parsed_cache.get(filepath)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        task = self.parser.parse_task_file(filepath, content_needed=True)
+        self._parsed_cache[filepath] = (mtime, task)
+        return task
+    
     def analyze_task_scope(self, filepath: str) -> List[str]:
         """
         Analyze a task file to extract likely file modifications
@@ -40,40 +119,54 @@ class TaskMigrator:
             filepath: Path to task file
             
         Returns:
-            List of file paths/patterns that task likely modifies
+            Sorted list of file paths/patterns that task likely modifies
         """
-        with open(filepath, 'r') as f:
-            content = f.read()
-            
-        scope = []
-        
-        # Look for "Files to Modify" section
-        files_section = re.search(r'### Files to Modify.*?\n(.*?)(?:\n###|\n##|\Z)', 
-                                  content, re.DOTALL)
-        if files_section:
-            lines = files_section.group(1).strip().split('\n')
-            for line in lines:
+        with open(filepath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _MMAP_MIN_SIZE:
+                return self._extract_scope(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return self._extract_scope(content)
+    
+    def _extract_scope(self, content) -> List[str]:
+        """Run the scope patterns over raw file bytes (bytes or mmap)"""
+        scope = set()
+        cargo_seen = False
+        
+        # Look for "Files to Modify" section: every line up to the next heading
+        start = content.find(_FILES_SECTION)
+        if start != -1:
+            pos = content.find(b'\n', start) + 1
+            while pos:
+                end = content.find(b'\n', pos)
+                line = content[pos:end] if end != -1 else content[pos:]
+                if line.startswith(b'##'):
+                    break
                 # Extract file paths from markdown lists
-                match = re.search(r'[`"]?([\w/._-]+\.(?:rs|toml|md|py|sh))[`"]?', line)
+                match = _FILE_LINE_RE.search(line)
                 if match:
-                    scope.append(match.group(1))
+                    scope.add(match.group(1).decode())
+                pos = end + 1
         
-        # Look for explicit file paths in backticks
-        code_paths = re.findall(r'`((?:libs|services_v2|relays|network|protocol_v2|tests)/[\w/._-]+)`', 
-                                content)
-        scope.extend(code_paths)
+        # Explicit file paths in backticks and Cargo.toml mentions
+        for match in _SCOPE_FUSED.finditer(content):
+            if match.lastgroup == 'code':
+                path = match.group('code')
+                scope.add(path[1:-1].decode())
+                cargo_seen = cargo_seen or b'Cargo.toml' in path
+            else:
+                cargo_seen = True
         
         # Look for Cargo.toml modifications
-        if 'Cargo.toml' in content:
-            if 'libs/' in content:
-                scope.append('libs/*/Cargo.toml')
-            elif 'services_v2/' in content:
-                scope.append('services_v2/*/Cargo.toml')
+        if cargo_seen:
+            if content.find(b'libs/') != -1:
+                scope.add('libs/*/Cargo.toml')
+            elif content.find(b'services_v2/') != -1:
+                scope.add('services_v2/*/Cargo.toml')
             else:
-                scope.append('Cargo.toml')
+                scope.add('Cargo.toml')
         
-        # Remove duplicates and return
-        return list(set(scope))
+        return sorted(scope)
     
     def suggest_task_dependencies(self, task_file: str, sprint_name: str) -> Tuple[List[str], List[str]]:
         """
@@ -91,79 +184,157 @@ class TaskMigrator:
         
         # Extract task ID
         task_id = None
-        task_data = self.parser.parse_task_file(task_file)
+        task_data = self._parse_cached(task_file)
         if 'error' not in task_data:
             task_id = task_data['metadata'].get('task_id', '')
         
         # Apply known sprint-level dependencies
         sprint_deps = self.known_dependencies.get(sprint_name, [])
         
-        # For task-level dependencies within a sprint
-        if sprint_name == 'sprint-010':  # Codec separation
-            if 'CODEC-001' in task_file:
-                pass  # No dependencies, foundational task
-            elif 'CODEC-002' in task_file:
-                depends_on.append('CODEC-001')
-            elif 'CODEC-003' in task_file:
-                depends_on.append('CODEC-002')
-            elif 'CODEC-004' in task_file:
-                depends_on.append('CODEC-002')
-            elif 'CODEC-005' in task_file:
-                depends_on.extend(['CODEC-003', 'CODEC-004'])
-                
-        elif sprint_name == 'sprint-007':  # Generic relay
-            if 'TASK-001' in task_file:
-                pass  # Design task, no deps
-            elif 'TASK-002' in task_file:
-                depends_on.append('S007-T001')
-            elif 'TASK-003' in task_file:
-                depends_on.append('S007-T002')
-            elif 'TASK-004' in task_file:
-                depends_on.extend(['S007-T002', 'S007-T003'])
-            elif 'TASK-005' in task_file or 'TASK-006' in task_file:
-                depends_on.append('S007-T004')
+        # For task-level dependencies within a sprint; the first token found
+        # in the filename decides, as foundational tasks have no entry
+        filename = os.path.basename(task_file)
+        token = next((t for t in _INTRA_SPRINT_TOKENS.get(sprint_name, ()) if t in filename), None)
+        depends_on.extend(_INTRA_SPRINT_DEPS.get((sprint_name, token), ()))
                 
         # Determine what this task blocks
-        if task_id:
-            if task_id in ['CODEC-001', 'CODEC-002']:
-                blocks.extend(['S006-T001', 'S007-T001'])  # Blocks macros and relay work
-            elif task_id == 'S010-T005':  # Integration testing
-                blocks.append('S011-T001')  # Blocks control script work
+        if task_id and isinstance(task_id, str):
+            blocks.extend(_TASK_BLOCKS.get(task_id, ()))
                 
         return depends_on, blocks
     
-    def migrate_task(self, filepath: str, interactive: bool = True) -> bool:
+    def _is_already_migrated_fast(self, filepath: str) -> Optional[bool]:
+        """
+        Check the raw frontmatter for a depends_on key without parsing YAML
+        
+        Reads only as far as the closing delimiter, however long the
+        frontmatter is. A key with a null value (depends_on: null) does not
+        count as migrated.
+        
+        Returns:
+            True if the key is set, False if the frontmatter lacks it (or it
+            is null), None if the file has no complete frontmatter
+        """
+        with open(filepath, 'rb') as f:
+            head = f.read(_FRONTMATTER_PEEK)
+            if not head.startswith(b'---'):
+                return None
+            # Same closing delimiter the parser looks for
+            end = head.find(b'---', 3)
+            while end == -1:
+                chunk = f.read(_FRONTMATTER_PEEK)
+                if not chunk:
+                    return None
+                start = max(3, len(head) - 2)
+                head += chunk
+                end = head.find(b'---', start)
+                
+        frontmatter = head[3:end]
+        for match in _DEPENDS_ON_RE.finditer(frontmatter):
+            value = match.group('value').split(b' #', 1)[0].strip()
+            if value.startswith(b'#'):
+                value = b''
+            if value not in _NULL_VALUES:
+                return True
+            # An empty value followed by a block sequence is still a list
+            rest = match.group('rest')
+            if not value and rest and rest[1:2] in (b' ', b'\t', b'-'):
+                return True
+        return False
+    
+    def _inject_frontmatter_keys(self, filepath: str, new_keys: Dict[str, List[str]]) -> Optional[bool]:
+        """
+        Append new list-valued keys to the frontmatter without a YAML dump
+        
+        Leaves the existing frontmatter untouched (comments, quoting, key
+        order) and writes the file atomically.
+        
+        Args:
+            filepath: Path to task file
+            new_keys: Keys to add, mapped to lists of strings
+            
+        Returns:
+            True if written, False on write error, None if the frontmatter
+            cannot be spliced (a key already exists or the layout is unusual)
+        """
+        # surrogateescape round-trips any non-UTF-8 bytes untouched
+        with open(filepath, 'r', encoding='utf-8', errors='surrogateescape',
+                  buffering=_READ_BUFFER) as f:
+            text = f.read()
+            
+        if not text.startswith('---'):
+            return None
+        close = text.find('---', 3)
+        if close == -1 or text[close - 1] != '\n' or _MIGRATION_KEY_RE.search(text, 3, close):
+            return None
+            
+        # JSON lists of strings are valid YAML flow sequences
+        lines = ''.join(f"{key}: {json.dumps(values)}\n" for key, values in new_keys.items())
+        
+        try:
+            self.parser._write_text_atomic(filepath, text[:close] + lines + text[close:],
+                                           errors='surrogateescape')
+            return True
+        except OSError as e:
+            print(f"Error writing file: {e}", file=sys.stderr)
+            return False
+    
+    def _load_for_migration(self, filepath: str) -> Tuple[Optional[Dict], bool]:
+        """
+        Parse a task file if it still needs migrating
+        
+        Returns:
+            Tuple of (parsed task or None, ok). (None, True) means the file
+            is already migrated; (None, False) means it could not be parsed.
+        """
+        filename = os.path.basename(filepath)
+        
+        # Skip if already migrated; decided from the raw frontmatter since
+        # the parser defaults depends_on to an empty list
+        if self._is_already_migrated_fast(filepath):
+            print(f"✓ {filename} already migrated")
+            return None, True
+            
+        task = self._parse_cached(filepath)
+        if 'error' in task:
+            print(f"Error parsing {filepath}: {task['error']}")
+            return None, False
+            
+        return task, True
+    
+    def migrate_task(self, filepath: str, interactive: bool = True,
+                     suggestions: Optional[Tuple[List[str], List[str], List[str]]] = None) -> bool:
         """
         Migrate a single task file to new format
         
         Args:
             filepath: Path to task file
             interactive: Whether to prompt for confirmation
+            suggestions: Pre-approved (depends_on, blocks, scope) from a
+                migration plan; skips analysis and prompting
             
         Returns:
             True if migration successful
         """
-        task = self.parser.parse_task_file(filepath)
-        if 'error' in task:
-            print(f"Error parsing {filepath}: {task['error']}")
-            return False
+        task, ok = self._load_for_migration(filepath)
+        if task is None:
+            return ok
             
         metadata = task['metadata']
         filename = os.path.basename(filepath)
         sprint_name = Path(filepath).parent.name
         
-        # Skip if already migrated
-        if metadata.get('depends_on') is not None:
-            print(f"✓ {filename} already migrated")
-            return True
-            
         print(f"\n📋 Migrating: {filename} ({sprint_name})")
         
-        # Analyze scope
-        suggested_scope = self.analyze_task_scope(filepath)
-        
-        # Suggest dependencies
-        suggested_deps, suggested_blocks = self.suggest_task_dependencies(filepath, sprint_name)
+        if suggestions is not None:
+            suggested_deps, suggested_blocks, suggested_scope = suggestions
+            interactive = False
+        else:
+            # Analyze scope
+            suggested_scope = self.analyze_task_scope(filepath)
+            
+            # Suggest dependencies
+            suggested_deps, suggested_blocks = self.suggest_task_dependencies(filepath, sprint_name)
         
         # Add new fields
         metadata['depends_on'] = metadata.get('depends_on', [])
@@ -206,8 +377,14 @@ class TaskMigrator:
             metadata['blocks'] = suggested_blocks
             metadata['scope'] = suggested_scope
         
-        # Write back to file
-        if self.parser._write_task_file(filepath, metadata, task['content']):
+        # Write back to file, splicing in the new keys where possible
+        written = self._inject_frontmatter_keys(
+            filepath, {key: metadata[key] for key in _MIGRATION_KEYS}
+        )
+        if written is None:
+            written = self.parser._write_task_file(filepath, metadata, task['content'])
+        self._parsed_cache.pop(filepath, None)
+        if written:
             print(f"  ✓ Migrated successfully")
             return True
         else:
@@ -225,26 +402,143 @@ class TaskMigrator:
         Returns:
             Number of tasks migrated
         """
-        sprint_dir = self.task_dir / sprint_name
-        if not sprint_dir.exists():
-            print(f"Sprint directory not found: {sprint_name}")
+        entries = self._sprint_task_entries(sprint_name)
+        if entries is None:
+            return 0
+            
+        # Nothing changed since a run that left every task migrated
+        manifest_path = self.task_dir / sprint_name / _MIGRATION_MANIFEST
+        fingerprint = self._sprint_fingerprint(entries)
+        manifest = self._read_manifest(manifest_path)
+        if manifest is not None and manifest.get('all_migrated') and \
+                (manifest.get('max_mtime_ns'), manifest.get('file_count')) == fingerprint:
+            print(f"\n✓ {sprint_name} already migrated (unchanged since last run)")
             return 0
             
         print(f"\n🚀 Migrating sprint: {sprint_name}")
         print("=" * 40)
         
         migrated = 0
-        for task_file in sorted(sprint_dir.glob('*.md')):
-            # Skip non-task files
-            if task_file.name in ['SPRINT_PLAN.md', 'README.md', 'TEST_RESULTS.md']:
+        all_migrated = True
+        for task_path, _ in entries:
+            if self.migrate_task(task_path, interactive):
+                migrated += 1
+            else:
+                all_migrated = False
+                
+        # Record the post-migration state; migrated files have new mtimes
+        entries = self._sprint_task_entries(sprint_name)
+        if entries is not None:
+            max_mtime_ns, file_count = self._sprint_fingerprint(entries)
+            manifest = {
+                'max_mtime_ns': max_mtime_ns,
+                'file_count': file_count,
+                'all_migrated': all_migrated
+            }
+            try:
+                self.parser._write_text_atomic(str(manifest_path), json.dumps(manifest) + '\n')
+            except OSError as e:
+                print(f"Warning: could not write {manifest_path}: {e}", file=sys.stderr)
+                
+        print(f"\n✅ Migrated {migrated} tasks in {sprint_name}")
+        return migrated
+    
+    def _sprint_task_entries(self, sprint_name: str) -> Optional[List[Tuple[str, int]]]:
+        """
+        Sorted (path, mtime_ns) of the task files in a sprint
+        
+        Returns:
+            List of entries, or None if the sprint directory is missing
+        """
+        sprint_dir = self.task_dir / sprint_name
+        if not sprint_dir.exists():
+            print(f"Sprint directory not found: {sprint_name}")
+            return None
+            
+        with os.scandir(sprint_dir) as it:
+            task_files = sorted(
+                (entry.name, entry.path, entry.stat().st_mtime_ns) for entry in it
+                if entry.name.endswith('.md')
+                # Skip non-task files
+                and entry.name not in _NON_TASK_FILES
+                and 'rename_me' not in entry.name
+                and 'template' not in entry.name.lower()
+                and entry.is_file()
+            )
+        return [(os.path.abspath(path), mtime) for _, path, mtime in task_files]
+    
+    def _sprint_task_files(self, sprint_name: str) -> Optional[List[str]]:
+        """Sorted task file paths in a sprint, or None if the sprint is missing"""
+        entries = self._sprint_task_entries(sprint_name)
+        return None if entries is None else [path for path, _ in entries]
+    
+    @staticmethod
+    def _sprint_fingerprint(entries: List[Tuple[str, int]]) -> Tuple[int, int]:
+        """(newest mtime_ns, file count) of a sprint's task files"""
+        return max((mtime for _, mtime in entries), default=0), len(entries)
+    
+    @staticmethod
+    def _read_manifest(manifest_path: Path) -> Optional[Dict]:
+        """Load a sprint's migration manifest, or None if absent or unreadable"""
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return manifest if isinstance(manifest, dict) else None
+    
+    def plan_migration(self, sprint_name: str) -> List[Dict]:
+        """
+        Collect migration suggestions for a sprint without writing anything
+        
+        Args:
+            sprint_name: Name of sprint directory
+            
+        Returns:
+            Plan entries with the suggestions and an 'accept' flag to edit
+        """
+        plan = []
+        for task_path in self._sprint_task_files(sprint_name) or []:
+            task, _ = self._load_for_migration(task_path)
+            if task is None:
                 continue
-            if 'rename_me' in task_file.name or 'template' in task_file.name.lower():
+            suggested_deps, suggested_blocks = self.suggest_task_dependencies(task_path, sprint_name)
+            plan.append({
+                'file': task_path,
+                'suggested_deps': suggested_deps,
+                'suggested_blocks': suggested_blocks,
+                'suggested_scope': self.analyze_task_scope(task_path),
+                'accept': True
+            })
+        return plan
+    
+    def apply_migration(self, plan_file: str) -> int:
+        """
+        Apply an edited migration plan; entries with accept: false are skipped
+        
+        Args:
+            plan_file: Path to a plan written by plan-migration
+            
+        Returns:
+            Number of tasks migrated
+        """
+        with open(plan_file, 'r', encoding='utf-8') as f:
+            plan = json.load(f)
+            
+        migrated = 0
+        for entry in plan:
+            if not entry.get('accept', True):
+                print(f"  Skipped {os.path.basename(entry['file'])}")
                 continue
-                
-            if self.migrate_task(str(task_file), interactive):
+            suggestions = (
+                entry.get('suggested_deps', []),
+                entry.get('suggested_blocks', []),
+                entry.get('suggested_scope', []),
+            )
+            if self.migrate_task(entry['file'], suggestions=suggestions):
                 migrated += 1
                 
-        print(f"\n✅ Migrated {migrated} tasks in {sprint_name}")
+        print(f"\n✅ Applied {migrated} of {len(plan)} planned migrations")
         return migrated
     
     def migrate_critical_sprints(self):
@@ -274,11 +568,18 @@ def main():
     """CLI interface for task migration"""
     migrator = TaskMigrator()
     
+    # --oneshot: legacy mode, prompt for each task of a sprint in turn
+    oneshot = '--oneshot' in sys.argv
+    if oneshot:
+        sys.argv.remove('--oneshot')
+    
     if len(sys.argv) < 2:
         print("Usage: migrate_tasks.py <command> [args]")
         print("Commands:")
         print("  task <file>        - Migrate a single task interactively")
-        print("  sprint <name>      - Migrate all tasks in a sprint")
+        print("  sprint <name>      - Write a migration plan for a sprint (--oneshot: prompt per task)")
+        print("  plan-migration <name> [plan.json] - Write suggestions for review")
+        print("  apply-migration <plan.json>       - Apply accepted entries of a plan")
         print("  critical           - Migrate critical sprints (010, 006, 007, 011, 009, 014)")
         print("  all                - Migrate all sprints")
         sys.exit(1)
@@ -288,9 +589,22 @@ def main():
     if command == 'task' and len(sys.argv) > 2:
         migrator.migrate_task(sys.argv[2], interactive=True)
         
-    elif command == 'sprint' and len(sys.argv) > 2:
+    elif command == 'sprint' and len(sys.argv) > 2 and oneshot:
         migrator.migrate_sprint(sys.argv[2], interactive=True)
         
+    elif command in ('sprint', 'plan-migration') and len(sys.argv) > 2:
+        plan_file = sys.argv[3] if command == 'plan-migration' and len(sys.argv) > 3 else _DEFAULT_PLAN_FILE
+        plan = migrator.plan_migration(sys.argv[2])
+        with open(plan_file, 'w', encoding='utf-8') as f:
+            json.dump(plan, f, indent=2)
+            f.write('\n')
+        print(f"\n📝 Wrote {len(plan)} pending migrations to {plan_file}")
+        print(f"   Set \"accept\": false to skip an entry, then run:")
+        print(f"   migrate_tasks.py apply-migration {plan_file}")
+        
+    elif command == 'apply-migration' and len(sys.argv) > 2:
+        migrator.apply_migration(sys.argv[2])
+        
     elif command == 'critical':
         migrator.migrate_critical_sprints()
         
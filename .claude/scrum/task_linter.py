@@ -7,11 +7,123 @@ Validates task metadata to ensure data integrity
 import sys
 import os
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from enum import IntEnum
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from yaml_parser import TaskParser
 import json
 
+class LintCode(IntEnum):
+    """Machine-readable kind of a lint error or warning"""
+    # Errors
+    FILE_NOT_FOUND = 1
+    PARSE_ERROR = 2
+    MISSING_TASK_ID = 3
+    MISSING_STATUS = 4
+    MISSING_PRIORITY = 5
+    INVALID_TASK_ID = 6
+    INVALID_STATUS = 7
+    MISSING_DEPENDS = 8
+    STATUS_WITHOUT_DEPENDS = 9
+    SELF_DEPENDENCY = 10
+    INVALID_DEP_FORMAT = 11
+    INVALID_SCOPE_FORMAT = 12
+    # Warnings
+    TEMPLATE_FILE = 101
+    TASK_ID_NOT_IN_FILENAME = 102
+    INVALID_PRIORITY = 103
+    MISSING_BLOCKS = 104
+    MISSING_SCOPE = 105
+    COMPLETED_WITHOUT_SCOPE = 106
+    DUPLICATE_DEPENDS = 107
+    SUSPICIOUS_DEP_FORMAT = 108
+    UNKNOWN_DEPENDENCY = 109
+    UNKNOWN_BLOCKED_TASK = 110
+    SCOPE_CONFLICT = 111
+
+
+# Report categories for generate_report
+_MISSING_DEPENDENCY_CODES = frozenset({LintCode.MISSING_DEPENDS, LintCode.STATUS_WITHOUT_DEPENDS})
+_INVALID_STATUS_CODES = frozenset({LintCode.MISSING_STATUS, LintCode.INVALID_STATUS})
+_INVALID_FORMAT_CODES = frozenset({
+    LintCode.MISSING_TASK_ID, LintCode.INVALID_TASK_ID,
+    LintCode.INVALID_DEP_FORMAT, LintCode.INVALID_SCOPE_FORMAT
+})
+_MISSING_SCOPE_CODES = frozenset({LintCode.MISSING_SCOPE, LintCode.COMPLETED_WITHOUT_SCOPE})
+
+_MISSING_FIELD_CODES = {
+    'task_id': LintCode.MISSING_TASK_ID,
+    'status': LintCode.MISSING_STATUS,
+    'priority': LintCode.MISSING_PRIORITY,
+}
+
+_TASK_ID_RE = re.compile(r'^[A-Z]+-\d+$|^S\d{3}-T\d{3}$')
+_DEP_FORMAT_RE = re.compile(r'^[A-Z0-9-]+$')
+
+# Validation rules
+_REQUIRED_FIELDS = ('task_id', 'status', 'priority')
+_STATUS_ORDER = ('TODO', 'IN_PROGRESS', 'COMPLETE', 'DONE', 'BLOCKED')
+_PRIORITY_ORDER = ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW')
+_VALID_STATUSES = frozenset(_STATUS_ORDER)
+_VALID_PRIORITIES = frozenset(_PRIORITY_ORDER)
+_VALID_STATUSES_MSG = ', '.join(_STATUS_ORDER)
+_VALID_PRIORITIES_MSG = ', '.join(_PRIORITY_ORDER)
+
+# Documentation files that live alongside tasks but carry no task metadata
+_NON_TASK_FILES = frozenset({
+    'SPRINT_PLAN.md', 'README.md', 'TEST_RESULTS.md', 'STATUS.md',
+    'REMAINING_ISSUES.md', 'EXECUTION_TRACKER.md', 'dependencies.md',
+    'task-breakdown.md', 'COMPLETION_REPORT.md', 'GITHUB_ISSUES.md',
+    'POST_REVIEW_FIXES.md', 'TODO_AUDIT.md', 'ARCHIVED.md'
+})
+
+
+def _iter_md_files(root: str):
+    """
+    Recursively yield (name, path) for every markdown file under root
+    
+    Uses os.scandir so file type comes from the directory listing rather
+    than a stat per entry. Directories whose path contains 'archive' are
+    pruned, matching the file-level archive filter in lint_directory.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.name.endswith('.md'):
+                    if entry.is_file():
+                        yield entry.name, entry.path
+                elif entry.is_dir() and 'archive' not in entry.path:
+                    stack.append(entry.path)
+
+# Below this many files a process pool costs more than it saves
+_PARALLEL_MIN_FILES = 64
+_PARALLEL_CHUNKSIZE = 32
+
+# Per-worker lint state, set up once by _init_lint_worker
+_worker_state = None
+
+
+def _init_lint_worker(all_tasks: Optional[List[Dict]]):
+    """Process pool initializer: share the task list and scope index with a worker"""
+    global _worker_state
+    linter = TaskLinter()
+    index = linter._build_scope_index(all_tasks) if all_tasks is not None else None
+    _worker_state = (linter, all_tasks, index)
+
+
+def _lint_one(filepath: str, strict: bool) -> Tuple[bool, List[Tuple[LintCode, str]], List[Tuple[LintCode, str]]]:
+    """Lint a single file inside a pool worker"""
+    linter, all_tasks, index = _worker_state
+    return linter.lint_task(filepath, strict, _all_tasks=all_tasks, _index=index)
+
+
 class TaskLinter:
     """Validate task files for metadata completeness and correctness"""
     
@@ -20,45 +132,53 @@ class TaskLinter:
         self.task_dir = Path(__file__).parent.parent / "tasks"
         
         # Validation rules
-        self.required_fields = ['task_id', 'status', 'priority']
-        self.valid_statuses = ['TODO', 'IN_PROGRESS', 'COMPLETE', 'DONE', 'BLOCKED']
-        self.valid_priorities = ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']
-        self.task_id_pattern = re.compile(r'^[A-Z]+-\d+$|^S\d{3}-T\d{3}$')
+        self.required_fields = _REQUIRED_FIELDS
+        self.valid_statuses = _VALID_STATUSES
+        self.valid_priorities = _VALID_PRIORITIES
+        self.task_id_pattern = _TASK_ID_RE
+        
+        # All parsed tasks, held only for the duration of a report run
+        self._all_tasks_cache: Optional[List[Dict]] = None
         
-    def lint_task(self, filepath: str, strict: bool = False) -> Tuple[bool, List[str], List[str]]:
+    def _get_all_tasks_cached(self) -> List[Dict]:
+        """Return the report-run task list, or scan the task tree"""
+        if self._all_tasks_cache is not None:
+            return self._all_tasks_cache
+        return self.parser.get_all_tasks()
+        
+    def lint_task(self, filepath: str, strict: bool = False,
+                  _all_tasks: Optional[List[Dict]] = None,
+                  _index: Optional[Tuple[Dict, Dict]] = None) -> Tuple[bool, List[Tuple[LintCode, str]], List[Tuple[LintCode, str]]]:
         """
         Lint a single task file
         
         Args:
             filepath: Path to task file
             strict: Whether to enforce strict validation rules
+            _all_tasks: Parsed task list, shared across a report run
+            _index: Prebuilt _build_scope_index() result, shared across a report run
             
         Returns:
-            Tuple of (is_valid, errors, warnings)
+            Tuple of (is_valid, errors, warnings); errors and warnings are
+            lists of (LintCode, message) pairs
         """
         errors = []
         warnings = []
         
         # Check file exists
         if not os.path.exists(filepath):
-            errors.append(f"File not found: {filepath}")
+            errors.append((LintCode.FILE_NOT_FOUND, f"File not found: {filepath}"))
             return False, errors, warnings
             
         # Skip non-task files
         filename = os.path.basename(filepath)
-        non_task_files = [
-            'SPRINT_PLAN.md', 'README.md', 'TEST_RESULTS.md', 'STATUS.md',
-            'REMAINING_ISSUES.md', 'EXECUTION_TRACKER.md', 'dependencies.md',
-            'task-breakdown.md', 'COMPLETION_REPORT.md', 'GITHUB_ISSUES.md',
-            'POST_REVIEW_FIXES.md', 'TODO_AUDIT.md', 'ARCHIVED.md'
-        ]
         
         # Skip MVP files and other documentation
-        if filename in non_task_files or filename.startswith('MVP-'):
+        if filename in _NON_TASK_FILES or filename.startswith('MVP-'):
             return True, [], []  # These files don't need task metadata
         if 'rename_me' in filename or 'template' in filename.lower():
             if strict:
-                warnings.append(f"Template file found: {filename}")
+                warnings.append((LintCode.TEMPLATE_FILE, f"Template file found: {filename}"))
             return True, [], warnings
             
         # Parse task file
@@ -66,35 +186,39 @@ class TaskLinter:
         
         # Check for parsing errors
         if 'error' in task:
-            errors.append(f"Parsing error: {task['error']}")
+            errors.append((LintCode.PARSE_ERROR, f"Parsing error: {task['error']}"))
             return False, errors, warnings
             
         metadata = task['metadata']
         
         # 1. Check required fields
-        for field in self.required_fields:
+        for field in _REQUIRED_FIELDS:
             if field not in metadata or metadata[field] is None or metadata[field] == '':
-                errors.append(f"Missing required field: {field}")
+                errors.append((_MISSING_FIELD_CODES[field], f"Missing required field: {field}"))
                 
         # 2. Validate task_id format
         task_id = metadata.get('task_id', '')
         if task_id:
             if not self.task_id_pattern.match(task_id):
-                errors.append(f"Invalid task_id format: {task_id} (expected SXXX-TXXX or PREFIX-NNN)")
+                errors.append((LintCode.INVALID_TASK_ID,
+                               f"Invalid task_id format: {task_id} (expected SXXX-TXXX or PREFIX-NNN)"))
                 
             # Check if task_id matches filename pattern
             if task_id not in filename:
-                warnings.append(f"Task ID '{task_id}' not found in filename '{filename}'")
+                warnings.append((LintCode.TASK_ID_NOT_IN_FILENAME,
+                                 f"Task ID '{task_id}' not found in filename '{filename}'"))
                 
         # 3. Validate status
         status = metadata.get('status', '')
-        if status and status not in self.valid_statuses:
-            errors.append(f"Invalid status: {status} (must be one of {', '.join(self.valid_statuses)})")
+        if status and (not isinstance(status, str) or status not in _VALID_STATUSES):
+            errors.append((LintCode.INVALID_STATUS,
+                           f"Invalid status: {status} (must be one of {_VALID_STATUSES_MSG})"))
             
         # 4. Validate priority
         priority = metadata.get('priority', '')
-        if priority and priority not in self.valid_priorities:
-            warnings.append(f"Invalid priority: {priority} (should be one of {', '.join(self.valid_priorities)})")
+        if priority and (not isinstance(priority, str) or priority not in _VALID_PRIORITIES):
+            warnings.append((LintCode.INVALID_PRIORITY,
+                             f"Invalid priority: {priority} (should be one of {_VALID_PRIORITIES_MSG})"))
             
         # 5. Check dependencies logic
         depends_on = metadata.get('depends_on', [])
@@ -103,71 +227,174 @@ class TaskLinter:
         
         # Ensure these fields exist (even if empty)
         if 'depends_on' not in metadata:
-            errors.append("Missing 'depends_on' field (use empty list [] if no dependencies)")
+            errors.append((LintCode.MISSING_DEPENDS,
+                           "Missing 'depends_on' field (use empty list [] if no dependencies)"))
         if 'blocks' not in metadata:
-            warnings.append("Missing 'blocks' field (use empty list [] if nothing blocked)")
+            warnings.append((LintCode.MISSING_BLOCKS,
+                             "Missing 'blocks' field (use empty list [] if nothing blocked)"))
         if 'scope' not in metadata:
-            warnings.append("Missing 'scope' field (use empty list [] if no file modifications)")
+            warnings.append((LintCode.MISSING_SCOPE,
+                             "Missing 'scope' field (use empty list [] if no file modifications)"))
             
         # 6. Status-specific validation
         if status == 'IN_PROGRESS' or status == 'COMPLETE' or status == 'DONE':
             # Check if dependencies were considered
             if 'depends_on' not in metadata:
-                errors.append(f"Task with status {status} must have 'depends_on' field (use [] for root tasks)")
+                errors.append((LintCode.STATUS_WITHOUT_DEPENDS,
+                               f"Task with status {status} must have 'depends_on' field (use [] for root tasks)"))
                 
             # Warn if no scope defined for completed work
             if status in ['COMPLETE', 'DONE'] and not scope:
-                warnings.append(f"Completed task has no scope defined - what files were modified?")
+                warnings.append((LintCode.COMPLETED_WITHOUT_SCOPE,
+                                 f"Completed task has no scope defined - what files were modified?"))
                 
         # 7. Check for circular self-dependency
         if task_id and task_id in depends_on:
-            errors.append(f"Circular dependency: task depends on itself")
+            errors.append((LintCode.SELF_DEPENDENCY, f"Circular dependency: task depends on itself"))
             
         # 8. Check for duplicate dependencies
         if len(depends_on) != len(set(depends_on)):
-            warnings.append("Duplicate entries in depends_on list")
+            warnings.append((LintCode.DUPLICATE_DEPENDS, "Duplicate entries in depends_on list"))
             
         # 9. Validate dependency format
         for dep in depends_on:
             if not isinstance(dep, str):
-                errors.append(f"Invalid dependency format: {dep} (must be string)")
-            elif not re.match(r'^[A-Z0-9-]+$', dep):
-                warnings.append(f"Suspicious dependency format: {dep}")
+                errors.append((LintCode.INVALID_DEP_FORMAT, f"Invalid dependency format: {dep} (must be string)"))
+            elif not _DEP_FORMAT_RE.match(dep):
+                warnings.append((LintCode.SUSPICIOUS_DEP_FORMAT, f"Suspicious dependency format: {dep}"))
                 
         # 10. Check scope format
         for scope_item in scope:
             if not isinstance(scope_item, str):
-                errors.append(f"Invalid scope format: {scope_item} (must be string)")
+                errors.append((LintCode.INVALID_SCOPE_FORMAT, f"Invalid scope format: {scope_item} (must be string)"))
                 
         # 11. Cross-reference validation (if strict mode)
         if strict:
             # Check if dependencies actually exist
-            all_tasks = self.parser.get_all_tasks()
+            all_tasks = _all_tasks if _all_tasks is not None else self._get_all_tasks_cached()
             existing_task_ids = {t['metadata'].get('task_id', '') for t in all_tasks}
             
             for dep in depends_on:
                 if dep and dep not in existing_task_ids:
-                    warnings.append(f"Dependency '{dep}' not found in project")
+                    warnings.append((LintCode.UNKNOWN_DEPENDENCY, f"Dependency '{dep}' not found in project"))
                     
             for blocked in blocks:
                 if blocked and blocked not in existing_task_ids:
-                    warnings.append(f"Blocked task '{blocked}' not found in project")
+                    warnings.append((LintCode.UNKNOWN_BLOCKED_TASK, f"Blocked task '{blocked}' not found in project"))
                     
             # Check for scope conflicts without dependencies
             if scope:
                 conflicts = self._check_scope_conflicts_without_deps(
-                    task_id, scope, depends_on, all_tasks
+                    task_id, scope, depends_on, all_tasks, _index
                 )
                 for conflict in conflicts:
-                    warnings.append(f"Task '{conflict}' modifies same files but no dependency defined")
+                    warnings.append((LintCode.SCOPE_CONFLICT,
+                                  f"Task '{conflict}' modifies same files but no dependency defined"))
                     
         # Determine overall validity
         is_valid = len(errors) == 0
         
         return is_valid, errors, warnings
     
+    def _build_scope_index(self, all_tasks: List[Dict]) -> Tuple[Dict[str, List[int]], Dict[int, Tuple]]:
+        """
+        Build an inverted scope index over all tasks
+        
+        Returns:
+            Tuple of (scope path -> task positions in all_tasks,
+                      task position -> (task_id, depends_on set, blocks set))
+        """
+        index = {}
+        relations = {}
+        
+        for pos, task in enumerate(all_tasks):
+            metadata = task['metadata']
+            task_id = metadata.get('task_id', '')
+            if not task_id:
+                continue
+            
+            relations[pos] = (
+                task_id,
+                {d for d in metadata.get('depends_on', []) if isinstance(d, str)},
+                {b for b in metadata.get('blocks', []) if isinstance(b, str)},
+            )
+            for scope_item in set(s for s in metadata.get('scope', []) if isinstance(s, str)):
+                index.setdefault(scope_item, []).append(pos)
+                
+        return index, relations
+    
+    def topological_order(self, all_tasks: List[Dict]) -> Tuple[List[str], List[str]]:
+        """
+        Order tasks so every task follows the tasks it depends on (Kahn's algorithm)
+        
+        Edges come from depends_on (dependency -> task) and blocks
+        (task -> blocked task). References to unknown task IDs are ignored;
+        those are reported by lint_task instead.
+        
+        Args:
+            all_tasks: Parsed tasks as returned by TaskParser.get_all_tasks()
+            
+        Returns:
+            Tuple of (execution order, task IDs caught in a dependency cycle)
+        """
+        graph = {}
+        for task in all_tasks:
+            task_id = task['metadata'].get('task_id')
+            if task_id and isinstance(task_id, str):
+                graph.setdefault(task_id, set())
+                
+        preds = {task_id: set() for task_id in graph}
+        for task in all_tasks:
+            metadata = task['metadata']
+            task_id = metadata.get('task_id')
+            if task_id not in graph:
+                continue
+            depends_on = metadata.get('depends_on') or []
+            blocks = metadata.get('blocks') or []
+            for dep in depends_on if isinstance(depends_on, list) else ():
+                if dep in graph and dep != task_id:
+                    graph[dep].add(task_id)
+                    preds[task_id].add(dep)
+            for blocked in blocks if isinstance(blocks, list) else ():
+                if blocked in graph and blocked != task_id:
+                    graph[task_id].add(blocked)
+                    preds[blocked].add(task_id)
+                    
+        in_degree = {task_id: len(p) for task_id, p in preds.items()}
+        queue = deque(sorted(t for t, d in in_degree.items() if d == 0))
+        order = []
+        
+        while queue:
+            task_id = queue.popleft()
+            order.append(task_id)
+            for succ in sorted(graph[task_id]):
+                in_degree[succ] -= 1
+                if in_degree[succ] == 0:
+                    queue.append(succ)
+                    
+        if len(order) == len(graph):
+            return order, []
+            
+        # Whatever is left sits on or downstream of a cycle. Peel off the
+        # tasks that nothing else in the remainder depends on, so only the
+        # cycles themselves (and tasks chained between them) are reported.
+        remaining = {t for t, d in in_degree.items() if d > 0}
+        out_degree = {t: len(graph[t] & remaining) for t in remaining}
+        sinks = deque(t for t, d in out_degree.items() if d == 0)
+        while sinks:
+            task_id = sinks.popleft()
+            remaining.discard(task_id)
+            for pred in preds[task_id]:
+                if pred in remaining:
+                    out_degree[pred] -= 1
+                    if out_degree[pred] == 0:
+                        sinks.append(pred)
+                        
+        return order, sorted(remaining)
+    
     def _check_scope_conflicts_without_deps(
-        self, task_id: str, scope: List[str], depends_on: List[str], all_tasks: List[Dict]
+        self, task_id: str, scope: List[str], depends_on: List[str], all_tasks: List[Dict],
+        _index: Optional[Tuple[Dict, Dict]] = None
     ) -> List[str]:
         """
         Find tasks with overlapping scope but no dependency relationship
@@ -175,41 +402,74 @@ class TaskLinter:
         Returns:
             List of conflicting task IDs
         """
+        index, relations = _index if _index is not None else self._build_scope_index(all_tasks)
+        
+        # Only tasks sharing at least one scope entry can conflict
+        candidates = set()
+        for scope_item in scope:
+            if isinstance(scope_item, str):
+                candidates.update(index.get(scope_item, ()))
+        
         conflicts = []
         
-        for task in all_tasks:
-            other_id = task['metadata'].get('task_id', '')
-            if not other_id or other_id == task_id:
+        for pos in sorted(candidates):
+            other_id, other_deps, other_blocks = relations[pos]
+            if other_id == task_id:
                 continue
                 
-            other_scope = set(task['metadata'].get('scope', []))
-            our_scope = set(scope)
+            # Check if there's a dependency relationship
+            has_relationship = (
+                other_id in depends_on or
+                task_id in other_deps or
+                task_id in other_blocks or
+                other_id in other_blocks
+            )
             
-            # Check for overlap
-            if our_scope.intersection(other_scope):
-                # Check if there's a dependency relationship
-                other_deps = task['metadata'].get('depends_on', [])
-                other_blocks = task['metadata'].get('blocks', [])
-                
-                has_relationship = (
-                    other_id in depends_on or
-                    task_id in other_deps or
-                    task_id in task['metadata'].get('blocks', []) or
-                    other_id in task['metadata'].get('blocks', [])
-                )
+            if not has_relationship:
+                conflicts.append(other_id)
                 
-                if not has_relationship:
-                    conflicts.append(other_id)
-                    
         return conflicts
     
-    def lint_directory(self, directory: str, strict: bool = False) -> Tuple[int, int, int]:
+    def _lint_many(self, paths: List[str], strict: bool, all_tasks: Optional[List[Dict]],
+                   index: Optional[Tuple[Dict, Dict]] = None, jobs: Optional[int] = None):
+        """
+        Lint paths in order, fanning out to a process pool when worthwhile
+        
+        Args:
+            paths: Task files to lint
+            strict: Whether to enforce strict validation
+            all_tasks: Task list for strict cross-reference checks
+            index: Prebuilt scope index for the sequential path
+            jobs: Worker processes (default: os.cpu_count(); 1 disables the pool)
+            
+        Returns:
+            Iterator of lint_task results, in the order of paths
+        """
+        jobs = jobs or os.cpu_count() or 1
+        if jobs <= 1 or len(paths) < _PARALLEL_MIN_FILES:
+            if strict and index is None and all_tasks is not None:
+                index = self._build_scope_index(all_tasks)
+            return (
+                self.lint_task(path, strict, _all_tasks=all_tasks, _index=index)
+                for path in paths
+            )
+            
+        def results():
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_lint_worker,
+                                     initargs=(all_tasks if strict else None,)) as ex:
+                yield from ex.map(_lint_one, paths, [strict] * len(paths),
+                                  chunksize=_PARALLEL_CHUNKSIZE)
+        return results()
+    
+    def lint_directory(self, directory: str, strict: bool = False,
+                       jobs: Optional[int] = None) -> Tuple[int, int, int]:
         """
         Lint all task files in a directory
         
         Args:
             directory: Directory path to lint
             strict: Whether to enforce strict validation
+            jobs: Worker processes for linting (1 lints in-process)
             
         Returns:
             Tuple of (total_files, files_with_errors, files_with_warnings)
@@ -223,36 +483,37 @@ class TaskLinter:
         error_count = 0
         warning_count = 0
         
-        # Find all markdown files
-        for md_file in dir_path.glob('**/*.md'):
-            # Skip archive directory
-            if 'archive' in str(md_file):
-                continue
-                
+        # Find all markdown files, skipping the archive directory
+        files = [(name, path) for name, path in _iter_md_files(str(dir_path))
+                 if 'archive' not in path]
+        all_tasks = self._get_all_tasks_cached() if strict else None
+        results = self._lint_many([path for _, path in files], strict, all_tasks, jobs=jobs)
+        
+        for (name, path), (is_valid, errors, warnings) in zip(files, results):
             total += 1
-            is_valid, errors, warnings = self.lint_task(str(md_file), strict)
             
             if errors:
                 error_count += 1
-                print(f"\n❌ {md_file.name}:")
-                for error in errors:
+                print(f"\n❌ {name}:")
+                for _, error in errors:
                     print(f"   ERROR: {error}")
                     
             if warnings:
                 warning_count += 1
                 if not errors:  # Only print filename once
-                    print(f"\n⚠️  {md_file.name}:")
-                for warning in warnings:
+                    print(f"\n⚠️  {name}:")
+                for _, warning in warnings:
                     print(f"   WARN: {warning}")
                     
         return total, error_count, warning_count
     
-    def generate_report(self, directory: str = None) -> Dict:
+    def generate_report(self, directory: str = None, jobs: Optional[int] = None) -> Dict:
         """
         Generate comprehensive linting report for all tasks
         
         Args:
             directory: Directory to lint (default: all tasks)
+            jobs: Worker processes for linting (1 lints in-process)
             
         Returns:
             Dictionary with linting statistics
@@ -261,7 +522,36 @@ class TaskLinter:
             directory = str(self.task_dir)
             
         all_tasks = self.parser.get_all_tasks()
+        self._all_tasks_cache = all_tasks
+        try:
+            return self._build_report(all_tasks, jobs)
+        finally:
+            self._all_tasks_cache = None
+    
+    def quick_check(self) -> bool:
+        """
+        Fail-fast health check for CI
+        
+        Stops at the first task with a lint error. Strict mode only adds
+        warnings, so the cross-reference and scope-conflict checks are
+        skipped. The outcome matches a full report with tasks_with_errors == 0
+        and dependency_cycles == 0: a dependency cycle fails both.
+        
+        Returns:
+            True if no task has errors and the dependency graph is acyclic
+        """
+        all_tasks = self.parser.get_all_tasks()
         
+        for task in all_tasks:
+            _, errors, _ = self.lint_task(task['filepath'])
+            if errors:
+                return False
+                
+        _, cycle_tasks = self.topological_order(all_tasks)
+        return not cycle_tasks
+    
+    def _build_report(self, all_tasks: List[Dict], jobs: Optional[int] = None) -> Dict:
+        """Lint every task in all_tasks and aggregate the results"""
         report = {
             'total_tasks': len(all_tasks),
             'valid_tasks': 0,
@@ -271,13 +561,16 @@ class TaskLinter:
             'missing_scope': 0,
             'invalid_status': 0,
             'invalid_format': 0,
+            'dependency_cycles': 0,
             'error_details': [],
             'warning_details': []
         }
         
-        for task in all_tasks:
-            is_valid, errors, warnings = self.lint_task(task['filepath'], strict=True)
-            
+        results = self._lint_many(
+            [task['filepath'] for task in all_tasks], True, all_tasks, jobs=jobs
+        )
+        
+        for task, (is_valid, errors, warnings) in zip(all_tasks, results):
             if is_valid and not errors:
                 report['valid_tasks'] += 1
             else:
@@ -287,12 +580,12 @@ class TaskLinter:
                 report['tasks_with_warnings'] += 1
                 
             # Categorize issues
-            for error in errors:
-                if 'depends_on' in error:
+            for code, error in errors:
+                if code in _MISSING_DEPENDENCY_CODES:
                     report['missing_dependencies'] += 1
-                elif 'status' in error:
+                elif code in _INVALID_STATUS_CODES:
                     report['invalid_status'] += 1
-                elif 'format' in error or 'task_id' in error:
+                elif code in _INVALID_FORMAT_CODES:
                     report['invalid_format'] += 1
                     
                 report['error_details'].append({
@@ -300,8 +593,8 @@ class TaskLinter:
                     'error': error
                 })
                 
-            for warning in warnings:
-                if 'scope' in warning:
+            for code, warning in warnings:
+                if code in _MISSING_SCOPE_CODES:
                     report['missing_scope'] += 1
                     
                 report['warning_details'].append({
@@ -309,6 +602,19 @@ class TaskLinter:
                     'warning': warning
                 })
                 
+        # Cross-task consistency: the depends_on/blocks graph must be acyclic
+        _, cycle_tasks = self.topological_order(all_tasks)
+        report['dependency_cycles'] = len(cycle_tasks)
+        if cycle_tasks:
+            files = {}
+            for task in all_tasks:
+                files.setdefault(task['metadata'].get('task_id'), Path(task['filepath']).name)
+            for task_id in cycle_tasks:
+                report['error_details'].append({
+                    'file': files[task_id],
+                    'error': f"Dependency cycle involving {task_id}"
+                })
+                
         report['health_score'] = round(
             (report['valid_tasks'] / report['total_tasks'] * 100) if report['total_tasks'] > 0 else 0,
             1
@@ -321,6 +627,17 @@ def main():
     """CLI interface for task linter"""
     linter = TaskLinter()
     
+    # --jobs N: worker processes for lint-dir/report (1 disables the pool)
+    jobs = None
+    if '--jobs' in sys.argv:
+        i = sys.argv.index('--jobs')
+        try:
+            jobs = int(sys.argv[i + 1])
+        except (IndexError, ValueError):
+            print("--jobs requires an integer")
+            sys.exit(1)
+        del sys.argv[i:i + 2]
+    
     if len(sys.argv) < 2:
         print("Usage: task_linter.py <command> [args]")
         print("Commands:")
@@ -329,6 +646,8 @@ def main():
         print("  lint-strict <file> - Lint with strict validation")
         print("  report           - Generate full linting report")
         print("  check            - Quick health check (exit code)")
+        print("Options:")
+        print("  --jobs N         - Worker processes for lint-dir/report (1 = no pool)")
         sys.exit(1)
         
     command = sys.argv[1]
@@ -339,12 +658,12 @@ def main():
         
         if errors:
             print(f"❌ Validation failed for {filepath}:")
-            for error in errors:
+            for _, error in errors:
                 print(f"  ERROR: {error}")
         
         if warnings:
             print(f"⚠️  Warnings for {filepath}:")
-            for warning in warnings:
+            for _, warning in warnings:
                 print(f"  WARN: {warning}")
                 
         if is_valid and not warnings:
@@ -354,7 +673,7 @@ def main():
         
     elif command == 'lint-dir' and len(sys.argv) > 2:
         directory = sys.argv[2]
-        total, errors, warnings = linter.lint_directory(directory)
+        total, errors, warnings = linter.lint_directory(directory, jobs=jobs)
         
         print(f"\n📊 Linting Summary:")
         print(f"  Total files: {total}")
@@ -375,9 +694,9 @@ def main():
         # In strict mode, warnings are treated as errors
         if errors or warnings:
             print(f"❌ Strict validation failed for {filepath}:")
-            for error in errors:
+            for _, error in errors:
                 print(f"  ERROR: {error}")
-            for warning in warnings:
+            for _, warning in warnings:
                 print(f"  STRICT: {warning}")
         else:
             print(f"✅ {filepath} passes strict validation")
@@ -385,7 +704,7 @@ def main():
         sys.exit(0 if is_valid and not warnings else 1)
         
     elif command == 'report':
-        report = linter.generate_report()
+        report = linter.generate_report(jobs=jobs)
         
         print("\n📋 Task Metadata Health Report")
         print("=" * 40)
@@ -399,16 +718,16 @@ def main():
         print(f"  Missing scope field: {report['missing_scope']}")
         print(f"  Invalid status: {report['invalid_status']}")
         print(f"  Invalid format: {report['invalid_format']}")
+        print(f"  Tasks in dependency cycles: {report['dependency_cycles']}")
         
         if report['health_score'] < 80:
             print(f"\n⚠️  Health score below 80% - run migrate_tasks.py to fix")
             
-        sys.exit(0 if report['health_score'] >= 95 else 1)
+        sys.exit(0 if report['health_score'] >= 95 and report['dependency_cycles'] == 0 else 1)
         
     elif command == 'check':
         # Quick check for CI - just return exit code
-        report = linter.generate_report()
-        sys.exit(0 if report['tasks_with_errors'] == 0 else 1)
+        sys.exit(0 if linter.quick_check() else 1)
         
     else:
         print(f"Unknown command: {command}")
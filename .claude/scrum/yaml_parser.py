@@ -8,9 +8,108 @@ import yaml
 import sys
 import os
 import json
+import mmap
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple
+from datetime import date, datetime
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is the fallback
+    orjson = None
+
+# libyaml-backed loader/dumper when PyYAML was built with it, else pure Python
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Task files are decoded as UTF-8 with undecodable bytes replaced (U+FFFD)
+# rather than raising. Files smaller than _MMAP_MIN_SIZE are read outright;
+# larger ones are mapped, so a frontmatter-only parse touches just the
+# pages up to the closing delimiter
+_MMAP_MIN_SIZE = 4096
+
+# Sprint documents that are not tasks
+_NON_TASK_FILES = frozenset({'SPRINT_PLAN.md', 'README.md', 'TEST_RESULTS.md'})
+
+# Metadata list fields holding task IDs or paths, compared across all tasks
+_INTERNED_LIST_FIELDS = ('depends_on', 'blocks', 'scope')
+
+# Dependency statuses that unblock dependents, and ready-task sort order
+_DONE_STATUSES = frozenset(('COMPLETE', 'DONE'))
+_PRIORITY_ORDER = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
+
+def _intern_meta(metadata: Dict[str, Any]) -> None:
+    """
+    Intern task IDs, statuses, dependency IDs and scope paths in place
+    
+    The same short strings are hashed and compared across every task when
+    checking dependencies and scope conflicts; interning makes equal
+    strings share one object, so those comparisons hit the identity check.
+    """
+    task_id = metadata.get('task_id')
+    if isinstance(task_id, str):
+        metadata['task_id'] = sys.intern(task_id)
+    status = metadata.get('status')
+    if isinstance(status, str):
+        metadata['status'] = sys.intern(status)
+    for field in _INTERNED_LIST_FIELDS:
+        values = metadata.get(field)
+        if isinstance(values, list):
+            metadata[field] = [sys.intern(v) if isinstance(v, str) else v for v in values]
+
+def _dumps(obj: Any) -> str:
+    """Format parsed task metadata for the CLI as indented JSON"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # YAML allows non-str mapping keys (e.g. `1:`), which orjson refuses
+            pass
+    return json.dumps(obj, indent=2)
+
+def _parse_cache_path() -> Optional[Path]:
+    """Location of the on-disk parse cache shared by CLI invocations"""
+    try:
+        base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    except RuntimeError:
+        return None
+    return Path(base) / 'torq' / 'task_parse.json'
+
+def _encode_cache_value(value: Any) -> Any:
+    """json.dumps default hook: YAML dates/timestamps as tagged objects"""
+    if isinstance(value, datetime):
+        return {'$datetime': value.isoformat()}
+    if isinstance(value, date):
+        return {'$date': value.isoformat()}
+    raise TypeError(f'{type(value).__name__} is not cacheable')
+
+def _decode_cache_value(obj: Dict[str, Any]) -> Any:
+    """json.load object hook reversing _encode_cache_value"""
+    if len(obj) == 1:
+        if '$date' in obj:
+            return date.fromisoformat(obj['$date'])
+        if '$datetime' in obj:
+            return datetime.fromisoformat(obj['$datetime'])
+    return obj
+
+# Process pool settings for get_all_tasks. libyaml parses a task's
+# frontmatter in well under a millisecond, so a pool only pays for its
+# startup on large batches of cache misses.
+_PARALLEL_MIN_FILES = 256
+_PARALLEL_CHUNKSIZE = 16
+
+_worker_parser = None
+
+def _parse_task_file_static(filepath: str) -> Dict[str, Any]:
+    """Pool worker: parse one task's frontmatter into a parse-cache entry"""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = TaskParser()
+    result = _worker_parser._parse_task_file_uncached(filepath, False)
+    return {k: result[k] for k in ('metadata', 'error') if k in result}
 
 class TaskParser:
     """Parse and manipulate task YAML frontmatter"""
@@ -18,29 +117,99 @@ class TaskParser:
     def __init__(self):
         self.task_dir = Path(__file__).parent.parent / "tasks"
         
-    def parse_task_file(self, filepath: str) -> Dict[str, Any]:
+        # Frontmatter-only parse results: abspath -> (mtime_ns, result)
+        self._parse_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._parse_cache_loaded = False
+        self._parse_cache_dirty = set()
+        
+    def parse_task_file(self, filepath: str, content_needed: bool = False,
+                        mtime: Optional[int] = None) -> Dict[str, Any]:
         """
         Parse a task markdown file and extract YAML frontmatter
         
+        Frontmatter-only results are cached by file mtime, so repeated
+        traversals cost an os.stat per file. Treat the returned metadata
+        values as read-only; top-level keys may be reassigned.
+        
         Args:
             filepath: Path to the task markdown file
+            content_needed: Also read the markdown body after the frontmatter.
+                Only needed by callers that write the file back; otherwise
+                reading stops at the closing delimiter and content is ''.
+            mtime: The file's st_mtime_ns if already known (e.g. from a
+                directory walk); saves the os.stat for the cache check
             
         Returns:
-            Dictionary containing task metadata and content
+            Dictionary containing task metadata and content. The file is
+            decoded as UTF-8; invalid bytes become U+FFFD instead of raising.
         """
-        with open(filepath, 'r') as f:
-            content = f.read()
+        if content_needed:
+            return self._parse_task_file_uncached(filepath, True)
             
-        # Split frontmatter and content
-        if not content.startswith('---'):
-            return {'error': 'No YAML frontmatter found'}
+        key = os.path.abspath(filepath)
+        if mtime is None:
+            try:
+                mtime = os.stat(filepath).st_mtime_ns
+            except OSError:
+                return self._parse_task_file_uncached(filepath, False)
             
-        parts = content.split('---', 2)
-        if len(parts) < 3:
+        cached = self._parse_cache.get(key)
+        if cached is None or cached[0] != mtime:
+            result = self._parse_task_file_uncached(filepath, False)
+            cached = (mtime, {k: result[k] for k in ('metadata', 'error') if k in result})
+            self._parse_cache[key] = cached
+            self._parse_cache_dirty.add(key)
+            
+        entry = cached[1]
+        if 'error' in entry:
+            return {'error': entry['error']}
+        return {
+            'metadata': dict(entry['metadata']),
+            'content': '',
+            'filepath': filepath,
+            'filename': os.path.basename(filepath)
+        }
+    
+    def _parse_task_file_uncached(self, filepath: str, content_needed: bool) -> Dict[str, Any]:
+        """Read and parse a task file; see parse_task_file"""
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+                return self._parse_task_bytes(filepath, f.read(), content_needed)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return self._parse_task_bytes(filepath, data, content_needed)
+    
+    def _parse_task_bytes(self, filepath: str, data, content_needed: bool) -> Dict[str, Any]:
+        """Parse raw task file bytes (bytes or mmap); see parse_task_file"""
+        # Split frontmatter and content: the frontmatter runs from the
+        # leading '---' to the next '---', wherever it falls on a line
+        if data[:3] != b'---':
+            return {'error': 'No YAML frontmatter found'}
+        end = data.find(b'---', 3)
+        if end == -1:
             return {'error': 'Invalid YAML frontmatter format'}
+        frontmatter = data[3:end]
+        if frontmatter[:2] in (b'\xff\xfe', b'\xfe\xff'):
+            # libyaml would take these bytes as a UTF-16 BOM
+            frontmatter = frontmatter.decode('utf-8', errors='replace')
+        
+        if content_needed:
+            content = data[end + 3:].decode('utf-8', errors='replace')
+            if '\r' in content:
+                # Same newlines a text-mode read would have produced
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+        else:
+            content = ''
             
         try:
-            metadata = yaml.safe_load(parts[1])
+            try:
+                # libyaml decodes the UTF-8 bytes itself
+                metadata = yaml.load(frontmatter, Loader=_Loader)
+            except yaml.YAMLError:
+                if isinstance(frontmatter, str):
+                    raise
+                # Retry as text: invalid bytes become U+FFFD, and errors
+                # report positions in the decoded frontmatter
+                metadata = yaml.load(frontmatter.decode('utf-8', errors='replace'), Loader=_Loader)
             if metadata is None:
                 metadata = {}
                 
@@ -50,10 +219,11 @@ class TaskParser:
             metadata.setdefault('scope', [])
             metadata.setdefault('status', 'TODO')
             metadata.setdefault('priority', 'MEDIUM')
+            _intern_meta(metadata)
             
             return {
                 'metadata': metadata,
-                'content': parts[2],
+                'content': content,
                 'filepath': filepath,
                 'filename': os.path.basename(filepath)
             }
@@ -71,7 +241,7 @@ class TaskParser:
         Returns:
             True if successful, False otherwise
         """
-        task = self.parse_task_file(filepath)
+        task = self.parse_task_file(filepath, content_needed=True)
         if 'error' in task:
             return False
             
@@ -84,7 +254,7 @@ class TaskParser:
     
     def add_dependency(self, filepath: str, depends_on: str) -> bool:
         """Add a dependency to a task"""
-        task = self.parse_task_file(filepath)
+        task = self.parse_task_file(filepath, content_needed=True)
         if 'error' in task:
             return False
             
@@ -95,7 +265,7 @@ class TaskParser:
     
     def add_scope(self, filepath: str, scope_path: str) -> bool:
         """Add a file/directory to task scope"""
-        task = self.parse_task_file(filepath)
+        task = self.parse_task_file(filepath, content_needed=True)
         if 'error' in task:
             return False
             
@@ -111,23 +281,137 @@ class TaskParser:
         Returns:
             List of task dictionaries with metadata
         """
+        if not self._parse_cache_loaded:
+            self._load_parse_cache()
+            
+        task_files = self._walk()
+        self._prefetch_parses([(path, mtime) for _, path, mtime in task_files])
+        
         tasks = []
+        for sprint_name, path, mtime in task_files:
+            task = self.parse_task_file(path, mtime=mtime)
+            if 'error' not in task:
+                task['sprint'] = sprint_name
+                tasks.append(task)
+                
+        if self._parse_cache_dirty:
+            self._save_parse_cache()
+        return tasks
+    
+    def _walk(self) -> List[Tuple[str, str, Optional[int]]]:
+        """
+        List task files in active sprint directories in one scandir pass
         
-        for sprint_dir in self.task_dir.glob('sprint-*'):
-            if sprint_dir.is_dir() and 'archive' not in sprint_dir.name:
-                for task_file in sprint_dir.glob('*.md'):
+        Returns:
+            (sprint name, path, st_mtime_ns) per task file; the mtime is
+            None if the file could not be stat'ed
+        """
+        try:
+            with os.scandir(self.task_dir) as it:
+                sprint_dirs = [
+                    entry for entry in it
+                    if entry.name.startswith('sprint-') and 'archive' not in entry.name and entry.is_dir()
+                ]
+        except OSError:
+            sprint_dirs = []
+            
+        task_files = []
+        for sprint_dir in sprint_dirs:
+            with os.scandir(sprint_dir.path) as it:
+                for entry in it:
+                    name = entry.name
                     # Skip non-task files
-                    if task_file.name in ['SPRINT_PLAN.md', 'README.md', 'TEST_RESULTS.md']:
+                    if not name.endswith('.md') or name in _NON_TASK_FILES:
                         continue
-                    if 'rename_me' in task_file.name or 'template' in task_file.name.lower():
+                    if 'rename_me' in name or 'template' in name.lower() or not entry.is_file():
                         continue
-                        
-                    task = self.parse_task_file(str(task_file))
-                    if 'error' not in task:
-                        task['sprint'] = sprint_dir.name
-                        tasks.append(task)
-                        
-        return tasks
+                    try:
+                        mtime = entry.stat().st_mtime_ns
+                    except OSError:
+                        mtime = None
+                    task_files.append((sprint_dir.name, entry.path, mtime))
+        return task_files
+    
+    def _prefetch_parses(self, files: List[Tuple[str, Optional[int]]]) -> None:
+        """
+        Parse cache misses in a process pool so parse_task_file hits the cache
+        
+        Small batches, and single-CPU machines, are left to the serial path;
+        starting workers costs more than it saves below _PARALLEL_MIN_FILES
+        misses.
+        """
+        workers = os.cpu_count() or 1
+        if workers < 2 or len(files) < _PARALLEL_MIN_FILES:
+            return
+            
+        misses = []
+        for path, mtime in files:
+            if mtime is None:
+                continue
+            cached = self._parse_cache.get(os.path.abspath(path))
+            if cached is None or cached[0] != mtime:
+                misses.append((path, mtime))
+                
+        if len(misses) < _PARALLEL_MIN_FILES:
+            return
+            
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            entries = ex.map(_parse_task_file_static, [path for path, _ in misses],
+                             chunksize=_PARALLEL_CHUNKSIZE)
+            for (path, mtime), entry in zip(misses, entries):
+                if 'metadata' in entry:
+                    _intern_meta(entry['metadata'])
+                key = os.path.abspath(path)
+                self._parse_cache[key] = (mtime, entry)
+                self._parse_cache_dirty.add(key)
+    
+    def _load_parse_cache(self) -> None:
+        """Merge the on-disk parse cache into memory (best effort)"""
+        self._parse_cache_loaded = True
+        path = _parse_cache_path()
+        if path is None:
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f, object_hook=_decode_cache_value)
+        except (OSError, ValueError):
+            return
+        if not isinstance(stored, dict):
+            return
+            
+        for key, item in stored.items():
+            if key in self._parse_cache or not isinstance(item, list) or len(item) != 2:
+                continue
+            mtime, entry = item
+            if isinstance(entry, dict) and isinstance(entry.get('metadata'), dict):
+                _intern_meta(entry['metadata'])
+            self._parse_cache[key] = (mtime, entry)
+    
+    def _save_parse_cache(self) -> None:
+        """Persist parse results for files that still exist (best effort)"""
+        dirty, self._parse_cache_dirty = self._parse_cache_dirty, set()
+        path = _parse_cache_path()
+        if path is None:
+            return
+            
+        items = []
+        for key, (mtime, entry) in self._parse_cache.items():
+            if not os.path.exists(key):
+                continue
+            try:
+                encoded = json.dumps([mtime, entry], default=_encode_cache_value)
+            except (TypeError, ValueError):
+                continue
+            # Skip fresh entries JSON would alter (e.g. non-string mapping keys)
+            if key in dirty and json.loads(encoded, object_hook=_decode_cache_value) != [mtime, entry]:
+                continue
+            items.append(f"{json.dumps(key)}:{encoded}")
+            
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_text_atomic(str(path), '{' + ','.join(items) + '}')
+        except OSError:
+            pass
     
     def find_ready_tasks(self) -> List[Dict[str, Any]]:
         """
@@ -138,35 +422,34 @@ class TaskParser:
         """
         all_tasks = self.get_all_tasks()
         
-        # Build a map of task_id to status
+        # Single pass: map task_id to status and collect TODO candidates
         task_status = {}
-        task_map = {}
+        todo_list = []
         for task in all_tasks:
-            task_id = task['metadata'].get('task_id', '')
+            metadata = task['metadata']
+            status = metadata['status']
+            task_id = metadata.get('task_id', '')
             if task_id:
-                task_status[task_id] = task['metadata']['status']
-                task_map[task_id] = task
+                task_status[task_id] = status
+            if status == 'TODO':
+                todo_list.append(task)
         
-        # Find ready tasks
-        ready_tasks = []
-        for task in all_tasks:
-            if task['metadata']['status'] != 'TODO':
-                continue
-                
-            # Check if all dependencies are complete
-            dependencies_satisfied = True
-            for dep_id in task['metadata'].get('depends_on', []):
-                dep_status = task_status.get(dep_id, 'UNKNOWN')
-                if dep_status not in ['COMPLETE', 'DONE']:
-                    dependencies_satisfied = False
-                    break
-                    
-            if dependencies_satisfied:
-                ready_tasks.append(task)
-        
-        # Sort by priority
-        priority_order = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
-        ready_tasks.sort(key=lambda t: priority_order.get(t['metadata'].get('priority', 'MEDIUM'), 99))
+        # Keep TODO tasks whose dependencies are all complete
+        status_of = task_status.get
+        ready_tasks = [
+            task for task in todo_list
+            if all(status_of(dep_id) in _DONE_STATUSES
+                   for dep_id in task['metadata'].get('depends_on', []))
+        ]
+        
+        # Sort by priority; the index keeps equal priorities in file order
+        priority_of = _PRIORITY_ORDER.get
+        decorated = [
+            (priority_of(task['metadata'].get('priority', 'MEDIUM'), 99), idx, task)
+            for idx, task in enumerate(ready_tasks)
+        ]
+        decorated.sort()
+        ready_tasks = [task for _, _, task in decorated]
         
         return ready_tasks
     
@@ -187,6 +470,9 @@ class TaskParser:
         conflicts = []
         all_tasks = self.get_all_tasks()
         
+        # One set for the target; each candidate's scope list is probed against it
+        target_scope = set(target_task['metadata']['scope'])
+        
         for task in all_tasks:
             # Only check in-progress tasks
             if task['metadata']['status'] != 'IN_PROGRESS':
@@ -195,10 +481,7 @@ class TaskParser:
                 continue
                 
             # Check for scope overlap
-            task_scope = set(task['metadata'].get('scope', []))
-            target_scope = set(target_task['metadata']['scope'])
-            
-            overlap = task_scope.intersection(target_scope)
+            overlap = target_scope.intersection(task['metadata'].get('scope', []))
             if overlap:
                 conflicts.append({
                     'task_id': task['metadata'].get('task_id', 'UNKNOWN'),
@@ -234,31 +517,30 @@ class TaskParser:
             if missing_deps:
                 missing[task_id] = missing_deps
         
-        # Check for cycles using DFS
+        # Check for cycles using an iterative three-color DFS
         def has_cycle(graph):
-            visited = set()
-            rec_stack = set()
+            GRAY, BLACK = 1, 2
+            color = {}
             
-            def visit(node):
-                if node in rec_stack:
-                    return True  # Cycle detected
-                if node in visited:
-                    return False
-                    
-                visited.add(node)
-                rec_stack.add(node)
-                
-                for neighbor in graph.get(node, []):
-                    if visit(neighbor):
-                        return True
-                        
-                rec_stack.remove(node)
-                return False
-            
-            for node in graph:
-                if node not in visited:
-                    if visit(node):
-                        return True
+            for root, deps in graph.items():
+                # Tasks without dependencies cannot start a cycle
+                if not deps or root in color:
+                    continue
+                color[root] = GRAY
+                stack = [(root, iter(deps))]
+                while stack:
+                    node, neighbors = stack[-1]
+                    for neighbor in neighbors:
+                        state = color.get(neighbor)
+                        if state == GRAY:
+                            return True  # Cycle detected
+                        if state is None:
+                            color[neighbor] = GRAY
+                            stack.append((neighbor, iter(graph.get(neighbor, ()))))
+                            break
+                    else:
+                        color[node] = BLACK
+                        stack.pop()
             return False
         
         has_cycles = has_cycle(dependencies)
@@ -273,16 +555,48 @@ class TaskParser:
     
     def _write_task_file(self, filepath: str, metadata: Dict, content: str) -> bool:
         """Write updated metadata and content back to task file"""
+        self._parse_cache.pop(os.path.abspath(filepath), None)
         try:
-            yaml_content = yaml.dump(metadata, default_flow_style=False, sort_keys=False)
+            yaml_content = yaml.dump(metadata, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
             full_content = f"---\n{yaml_content}---\n{content}"
             
-            with open(filepath, 'w') as f:
-                f.write(full_content)
+            self._write_text_atomic(filepath, full_content)
             return True
         except Exception as e:
             print(f"Error writing file: {e}", file=sys.stderr)
             return False
+            
+    def _write_text_atomic(self, filepath: str, text: str, errors: str = 'strict') -> None:
+        """
+        Replace a file's contents atomically
+        
+        Writes to a temp file in the same directory, fsyncs it and renames it
+        over the target, so a crash leaves either the old or the new file.
+        The target's permissions are kept. Raises OSError on failure.
+        
+        Args:
+            filepath: File to replace
+            text: New contents, encoded as UTF-8
+            errors: Encoding error handler (e.g. 'surrogateescape')
+        """
+        directory = os.path.dirname(filepath) or '.'
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', errors=errors, dir=directory,
+                                         suffix='.tmp', delete=False) as tmp:
+            try:
+                tmp.write(text)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            except BaseException:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+        try:
+            if os.path.exists(filepath):
+                shutil.copymode(filepath, tmp.name)
+            os.replace(tmp.name, filepath)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
 
 
 def main():
@@ -304,7 +618,7 @@ def main():
     
     if command == 'parse' and len(sys.argv) > 2:
         result = parser.parse_task_file(sys.argv[2])
-        print(json.dumps(result.get('metadata', result), indent=2))
+        print(_dumps(result.get('metadata', result)))
         
     elif command == 'status' and len(sys.argv) > 3:
         success = parser.update_task_status(sys.argv[2], sys.argv[3])
@@ -326,7 +640,7 @@ def main():
             
     elif command == 'validate':
         result = parser.validate_dependencies()
-        print(json.dumps(result, indent=2))
+        print(_dumps(result))
         
     elif command == 'add-dep' and len(sys.argv) > 3:
         success = parser.add_dependency(sys.argv[2], sys.argv[3])
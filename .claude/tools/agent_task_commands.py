@@ -6,16 +6,49 @@ Integration layer between AI agents and org-mode task management system.
 Provides high-level commands for dynamic task management.
 """
 
+import atexit
 import json
+import os
+import re
+import select
 import subprocess
 import sys
+import time
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is the fallback
+    orjson = None
 
 # Default task file location
 DEFAULT_TASK_FILE = Path(__file__).parent.parent / "tasks" / "active.org"
 
+# Reply terminators written by `org_tasks.sh serve` (see torq/serve)
+_SERVER_DONE = b"__TORQ_DONE__"
+_SERVER_FAILED = b"__TORQ_FAILED__"
+_COMMAND_TIMEOUT = 10
+
+# Commands that only read the task file; results are reused while its
+# mtime is unchanged
+_READ_ONLY_COMMANDS = frozenset(('parse', 'ready'))
+
+# Leading hour count of an EFFORT property such as "4h"
+_EFFORT_RE = re.compile(r'(\d+)')
+
+def _dumps(obj: Any) -> str:
+    """Pretty-print a command's result data, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits; json handles those
+            pass
+    return json.dumps(obj, indent=2)
+
 @dataclass
 class TaskCommand:
     """Result of a task management command"""
@@ -24,6 +57,36 @@ class TaskCommand:
     data: Optional[Dict] = None
     tasks: Optional[List[Dict]] = None
 
+@dataclass(frozen=True, slots=True)
+class TaskRec:
+    """The fields of one parsed task that commands filter on"""
+    id: str
+    heading: str
+    state: Optional[str]
+    priority: Optional[str]
+    is_goal: bool
+    is_actionable: bool
+    depends: str
+    effort_h: int
+    raw: Dict = field(compare=False, repr=False)  # Task JSON, as returned to callers
+    
+    @classmethod
+    def from_json(cls, task: Dict) -> 'TaskRec':
+        """Build a record from one task of the parse JSON"""
+        properties = task.get('properties') or {}
+        effort = _EFFORT_RE.match(properties.get('EFFORT', '') or '')
+        return cls(
+            id=task.get('id') or '',
+            heading=task.get('heading') or '',
+            state=task.get('state'),
+            priority=task.get('priority'),
+            is_goal=bool(task.get('is_goal')),
+            is_actionable=bool(task.get('is_actionable')),
+            depends=properties.get('DEPENDS', '') or '',
+            effort_h=int(effort.group(1)) if effort else 0,
+            raw=task,
+        )
+
 class AgentTaskManager:
     """AI Agent interface to org-mode task management"""
     
@@ -32,9 +95,133 @@ class AgentTaskManager:
         self.tools_dir = Path(__file__).parent
         self.org_script = self.tools_dir / "org_tasks.sh"
         self.priority_extractor = self.tools_dir / "simple_priority_demo.py"
+        self._server: Optional[subprocess.Popen] = None
+        self._server_unavailable = False
+        self._parse_cache: Dict[str, Tuple[int, TaskCommand]] = {}
+        self._task_index_for: Optional[Tuple[TaskCommand, Tuple]] = None
     
     def _run_org_command(self, command: str, *args) -> TaskCommand:
-        """Run org_tasks.sh command and return result"""
+        """
+        Run an org_tasks.sh command and return result
+        
+        Commands go to one long-lived `org_tasks.sh serve` process, so Emacs
+        and org-mode start once per manager rather than once per command.
+        If the server cannot be used, each command runs in its own process.
+        Successful parse/ready results are cached by the task file's mtime,
+        so methods that each need a parse share one.
+        """
+        cacheable = command in _READ_ONLY_COMMANDS and not args
+        mtime = None
+        if cacheable:
+            try:
+                mtime = os.stat(self.task_file).st_mtime_ns
+            except OSError:
+                pass
+            cached = self._parse_cache.get(command)
+            if mtime is not None and cached is not None and cached[0] == mtime:
+                return cached[1]
+        else:
+            # update/add rewrite the task file
+            self._parse_cache.clear()
+        
+        result = self._server_command(command, *args)
+        if result is None:
+            result = self._run_org_command_once(command, *args)
+        
+        if mtime is not None and result.success:
+            self._parse_cache[command] = (mtime, result)
+        return result
+    
+    def _server_command(self, command: str, *args) -> Optional[TaskCommand]:
+        """Send a command to the server; None if the server is unusable"""
+        server = self._start_server()
+        if server is None:
+            return None
+        
+        try:
+            server.stdin.write(json.dumps([command, *args]).encode() + b"\n")
+            server.stdin.flush()
+        except OSError:
+            self._stop_server()
+            return None
+        
+        # Read until the reply's terminator line; it is the last thing the
+        # server writes before waiting for the next command
+        fd = server.stdout.fileno()
+        deadline = time.monotonic() + _COMMAND_TIMEOUT
+        reply = b""
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                self._stop_server()
+                return TaskCommand(False, "Command timed out")
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                self._stop_server()
+                if not reply:
+                    # Server never came up (e.g. no Emacs); use one-shot mode
+                    self._server_unavailable = True
+                    return None
+                return TaskCommand(False, "Command error: task server exited")
+            reply += chunk
+            if not reply.endswith(b"\n"):
+                continue
+            start = reply.rfind(b"\n", 0, len(reply) - 1) + 1
+            status = reply[start:-1]
+            if status == _SERVER_DONE:
+                return self._command_result(command, reply[:start].decode(errors='replace'))
+            if status.startswith(_SERVER_FAILED):
+                message = status[len(_SERVER_FAILED):].decode(errors='replace').strip()
+                return TaskCommand(False, f"Command failed: {message}")
+    
+    def _start_server(self) -> Optional[subprocess.Popen]:
+        """Start `org_tasks.sh serve` on first use"""
+        if self._server is not None:
+            return self._server
+        if self._server_unavailable:
+            return None
+        try:
+            self._server = subprocess.Popen(
+                [str(self.org_script), "serve"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            self._server_unavailable = True
+            return None
+        atexit.register(self.close)
+        return self._server
+    
+    def _stop_server(self) -> None:
+        """Kill the server; the next command starts a fresh one"""
+        if self._server is not None:
+            self._server.kill()
+            self._server.wait()
+            self._server = None
+    
+    def close(self) -> None:
+        """Shut down the server process, if running"""
+        if self._server is not None:
+            try:
+                self._server.stdin.close()
+                self._server.wait(timeout=_COMMAND_TIMEOUT)
+            except (OSError, subprocess.TimeoutExpired):
+                self._server.kill()
+                self._server.wait()
+            self._server = None
+    
+    def _command_result(self, command: str, output: str) -> TaskCommand:
+        """Wrap command output, decoding JSON output where present"""
+        try:
+            data = json.loads(output)
+            return TaskCommand(True, f"{command} completed successfully", data)
+        except json.JSONDecodeError:
+            # Non-JSON output (like update confirmations)
+            return TaskCommand(True, output.strip())
+    
+    def _run_org_command_once(self, command: str, *args) -> TaskCommand:
+        """Run org_tasks.sh command in its own process and return result"""
         try:
             cmd = [str(self.org_script), command] + list(args)
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
@@ -42,19 +229,48 @@ class AgentTaskManager:
             if result.returncode != 0:
                 return TaskCommand(False, f"Command failed: {result.stderr.strip()}")
             
-            # Try to parse JSON output
-            try:
-                data = json.loads(result.stdout)
-                return TaskCommand(True, f"{command} completed successfully", data)
-            except json.JSONDecodeError:
-                # Non-JSON output (like update confirmations)
-                return TaskCommand(True, result.stdout.strip())
+            return self._command_result(command, result.stdout)
         
         except subprocess.TimeoutExpired:
             return TaskCommand(False, "Command timed out")
         except Exception as e:
             return TaskCommand(False, f"Command error: {str(e)}")
     
+    def _task_index(self, parsed: TaskCommand) -> Tuple[
+            Tuple[TaskRec, ...],
+            Dict[str, Tuple[List[TaskRec], List[TaskRec]]],
+            Dict[Optional[str], List[TaskRec]]]:
+        """
+        Records for a parse result, grouped the ways commands filter them
+        
+        Built once per parse result, in a single pass. Returns the records,
+        then actionable tasks by ID prefix (AUTH-001 -> AUTH) together with
+        the subset ready to start now (TODO/NEXT, no DEPENDS), then goals by
+        priority. All lists are in file order.
+        """
+        if self._task_index_for is not None and self._task_index_for[0] is parsed:
+            return self._task_index_for[1]
+        
+        records = tuple(TaskRec.from_json(task) for task in parsed.data.get('tasks', []))
+        by_prefix: Dict[str, Tuple[List[TaskRec], List[TaskRec]]] = {}
+        goals_by_priority: Dict[Optional[str], List[TaskRec]] = {}
+        for rec in records:
+            if rec.is_goal:
+                goals_by_priority.setdefault(rec.priority, []).append(rec)
+            if not rec.id or not rec.is_actionable:
+                continue
+            prefix = rec.id.split('-', 1)[0]
+            bucket = by_prefix.get(prefix)
+            if bucket is None:
+                bucket = by_prefix[prefix] = ([], [])
+            bucket[0].append(rec)
+            if rec.state in ('TODO', 'NEXT') and not rec.depends:
+                bucket[1].append(rec)
+        
+        index = (records, by_prefix, goals_by_priority)
+        self._task_index_for = (parsed, index)
+        return index
+    
     def next_tasks(self, limit: int = 5) -> TaskCommand:
         """Get next tasks ready for execution"""
         result = self._run_org_command("ready")
@@ -80,39 +296,27 @@ class AgentTaskManager:
         if not result.success or not result.data:
             return result
         
-        all_tasks = {t['id']: t for t in result.data.get('tasks', [])}
+        records, by_prefix, _ = self._task_index(result)
         
         # Find the goal
-        goal = all_tasks.get(goal_id)
+        goal = next((rec for rec in records if rec.id == goal_id), None)
         if not goal:
             return TaskCommand(False, f"Goal {goal_id} not found")
         
-        if not goal.get('is_goal'):
+        if not goal.is_goal:
             return TaskCommand(False, f"{goal_id} is not a goal")
         
         # Extract dependency tree (simplified logic for demo)
-        required_tasks = []
-        for task in all_tasks.values():
-            # Tasks belong to goal if ID starts with goal prefix
-            goal_prefix = goal_id.split('-')[0]  # AUTH-GOAL -> AUTH
-            if (task['id'].startswith(goal_prefix) and 
-                task.get('is_actionable')):
-                required_tasks.append(task)
-        
-        # Find ready tasks from this set
-        ready_tasks = []
-        for task in required_tasks:
-            if task.get('state') in ['TODO', 'NEXT']:
-                # Check dependencies (simplified)
-                depends = task.get('properties', {}).get('DEPENDS', '')
-                if not depends:  # No dependencies = ready
-                    ready_tasks.append(task)
+        # Tasks belong to goal if their ID prefix matches: AUTH-GOAL -> AUTH
+        required, ready = by_prefix.get(goal_id.split('-', 1)[0], ((), ()))
+        required_tasks = [rec.raw for rec in required]
+        ready_tasks = [rec.raw for rec in ready]
         
         return TaskCommand(
             True,
-            f"Goal {goal['heading']} requires {len(required_tasks)} tasks, {len(ready_tasks)} ready",
+            f"Goal {goal.heading} requires {len(required_tasks)} tasks, {len(ready_tasks)} ready",
             {
-                "goal": goal,
+                "goal": goal.raw,
                 "required_tasks": required_tasks,
                 "ready_tasks": ready_tasks,
                 "total_required": len(required_tasks),
@@ -121,52 +325,51 @@ class AgentTaskManager:
             required_tasks
         )
     
-    def priority_work_plan(self, priority: str) -> TaskCommand:
-        """Get complete work plan for specific priority"""
+    def priority_work_plan(self, priority: str, limit: Optional[int] = None) -> TaskCommand:
+        """
+        Get complete work plan for specific priority
+        
+        Args:
+            priority: Goal priority (A, B or C)
+            limit: Return at most this many ready tasks; counts still
+                cover all of them
+        """
         result = self._run_org_command("parse")
         
         if not result.success or not result.data:
             return result
         
-        all_tasks = result.data.get('tasks', [])
+        _, by_prefix, goals_by_priority = self._task_index(result)
         
         # Find priority goals
-        priority_goals = [t for t in all_tasks if t.get('is_goal') and t.get('priority') == priority]
+        priority_goals = goals_by_priority.get(priority, [])
         
         if not priority_goals:
             return TaskCommand(False, f"No Priority {priority} goals found")
         
         # Extract all required tasks for these goals
-        all_required = []
-        ready_now = []
-        
-        for goal in priority_goals:
-            goal_prefix = goal['id'].split('-')[0]
-            for task in all_tasks:
-                if (task['id'].startswith(goal_prefix) and 
-                    task.get('is_actionable')):
-                    all_required.append(task)
-                    
-                    # Check if ready
-                    if (task.get('state') in ['TODO', 'NEXT'] and
-                        not task.get('properties', {}).get('DEPENDS', '')):
-                        ready_now.append(task)
-        
-        total_effort = sum(
-            int(t.get('properties', {}).get('EFFORT', '0h').rstrip('h') or 0)
-            for t in all_required
-        )
+        buckets = [by_prefix.get(goal.id.split('-', 1)[0], ((), ())) for goal in priority_goals]
+        required_recs = list(chain.from_iterable(required for required, _ in buckets))
+        all_required = [rec.raw for rec in required_recs]
+        total_effort = sum([rec.effort_h for rec in required_recs])
+        
+        # Ready tasks are only materialised up to the limit
+        ready_count = sum(len(ready) for _, ready in buckets)
+        ready_recs = chain.from_iterable(ready for _, ready in buckets)
+        if limit is not None:
+            ready_recs = islice(ready_recs, limit)
+        ready_now = [rec.raw for rec in ready_recs]
         
         return TaskCommand(
             True,
-            f"Priority {priority}: {len(priority_goals)} goals, {len(all_required)} tasks, {len(ready_now)} ready",
+            f"Priority {priority}: {len(priority_goals)} goals, {len(all_required)} tasks, {ready_count} ready",
             {
                 "priority": priority,
-                "goals": priority_goals,
+                "goals": [goal.raw for goal in priority_goals],
                 "required_tasks": all_required,
                 "ready_tasks": ready_now,
                 "total_effort_hours": total_effort,
-                "can_parallelize": len(ready_now)
+                "can_parallelize": ready_count
             },
             all_required
         )
@@ -194,18 +397,17 @@ class AgentTaskManager:
             return result
         
         metadata = result.data.get('metadata', {})
-        tasks = result.data.get('tasks', [])
+        records, _, _ = self._task_index(result)
         
         # Calculate priority breakdown
         by_priority = {"A": 0, "B": 0, "C": 0, "None": 0}
-        actionable_tasks = []
-        
-        for task in tasks:
-            if task.get('is_actionable'):
-                actionable_tasks.append(task)
-                priority = task.get('priority', 'None')
-                if priority in by_priority:
-                    by_priority[priority] += 1
+        actionable_count = 0
+        
+        for rec in records:
+            if rec.is_actionable:
+                actionable_count += 1
+                if rec.priority in by_priority:
+                    by_priority[rec.priority] += 1
                 else:
                     by_priority['None'] += 1
         
@@ -218,7 +420,7 @@ class AgentTaskManager:
             "in_progress_count": metadata.get('in_progress_count', 0),
             "done_count": metadata.get('done_count', 0),
             "ready_count": ready_count,
-            "actionable_tasks": len(actionable_tasks),
+            "actionable_tasks": actionable_count,
             "priority_breakdown": by_priority,
             "can_parallelize": ready_count
         }
@@ -234,7 +436,7 @@ def main():
         print("Commands:")
         print("  next [limit]          - Get next ready tasks")
         print("  goal <goal-id>        - Get tasks for specific goal") 
-        print("  priority <A|B|C>      - Get priority work plan")
+        print("  priority <A|B|C> [limit] - Get priority work plan")
         print("  create <heading>      - Create new task")
         print("  update <id> <state>   - Update task status")
         print("  status                - Get overall status")
@@ -257,7 +459,8 @@ def main():
         if len(sys.argv) < 3:
             print("Error: priority command requires priority (A, B, or C)")
             sys.exit(1)
-        result = manager.priority_work_plan(sys.argv[2].upper())
+        limit = int(sys.argv[3]) if len(sys.argv) > 3 else None
+        result = manager.priority_work_plan(sys.argv[2].upper(), limit)
     
     elif command == "create":
         if len(sys.argv) < 3:
@@ -282,7 +485,7 @@ def main():
     if result.success:
         print(f"✅ {result.message}")
         if result.data:
-            print(json.dumps(result.data, indent=2))
+            print(_dumps(result.data))
     else:
         print(f"❌ {result.message}")
         sys.exit(1)
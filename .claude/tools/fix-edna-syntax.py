@@ -16,44 +16,67 @@ import re
 import sys
 from pathlib import Path
 
+# All three fixes as one alternation so the file is scanned once; the
+# children BLOCKER branch comes first so it is not taken by the ids branch
+_EDNA_FIXES = re.compile(
+    rb'(?P<bc>:BLOCKER:\s+children todo\?\(DONE\))'
+    rb'|(?P<tc>:TRIGGER:\s+children todo!\(NEXT\))'
+    rb'|:BLOCKER:\s+(?P<bi>.+?)\s+todo\?\(DONE\)'
+)
+
+def _replace_edna(match):
+    """Replacement for whichever _EDNA_FIXES branch matched."""
+    kind = match.lastgroup
+    if kind == 'bi':
+        # BLOCKER checks if the referenced task is DONE automatically
+        return b':BLOCKER:     ' + match.group('bi')
+    if kind == 'bc':
+        # org-edna automatically checks if children are done
+        return b':BLOCKER:     children'
+    # TRIGGER syntax is correct - todo!(NEXT) is an action
+    return b':TRIGGER:     children todo!(NEXT)'
+
+def _apply_edna_fixes(content):
+    """Apply _EDNA_FIXES until the text stops changing.
+    
+    One pass is not enough: a BLOCKER with several todo?(DONE) conditions
+    loses one per pass. Returns (content, number of replacements that
+    changed the text).
+    """
+    fixes = 0
+    
+    def replace(match):
+        nonlocal fixes
+        fixed = _replace_edna(match)
+        if fixed != match.group(0):
+            fixes += 1
+        return fixed
+        
+    while True:
+        fixed = _EDNA_FIXES.sub(replace, content)
+        if fixed == content:
+            return content, fixes
+        content = fixed
+
 def fix_edna_syntax(filepath):
     """Fix org-edna syntax errors."""
-    with open(filepath, 'r') as f:
+    # Bytes throughout: the patterns are ASCII, so active.org never needs
+    # to be decoded and re-encoded
+    with open(filepath, 'rb') as f:
         content = f.read()
     
     original = content
-    fixes = 0
-    
-    # Fix BLOCKER syntax - remove todo?(DONE) as it's implicit
-    # BLOCKER checks if the referenced task is DONE automatically
-    pattern = r':BLOCKER:\s+(.+?)\s+todo\?\(DONE\)'
-    while re.search(pattern, content):
-        content = re.sub(pattern, r':BLOCKER:     \1', content)
-        fixes += 1
-    
-    # Fix children BLOCKER - the syntax should be just "children"
-    # org-edna automatically checks if children are done
-    pattern = r':BLOCKER:\s+children todo\?\(DONE\)'
-    while re.search(pattern, content):
-        content = re.sub(pattern, r':BLOCKER:     children', content)
-        fixes += 1
-    
-    # TRIGGER syntax is correct - todo!(NEXT) is an action
-    # But fix children TRIGGER syntax
-    pattern = r':TRIGGER:\s+children todo!\(NEXT\)'
-    while re.search(pattern, content):
-        content = re.sub(pattern, r':TRIGGER:     children todo!(NEXT)', content)
-        fixes += 1
+    content, fixes = _apply_edna_fixes(content)
     
     if content != original:
         # Backup original
         backup_path = filepath.with_suffix('.org.bak')
-        with open(backup_path, 'w') as f:
+        with open(backup_path, 'wb') as f:
             f.write(original)
         print(f"✅ Backed up original to {backup_path}")
         
         # Write fixed content
-        with open(filepath, 'w') as f:
+        with open(filepath, 'wb') as f:
             f.write(content)
         print(f"✅ Fixed {fixes} syntax errors in {filepath}")
         
@@ -9,8 +9,40 @@ enabling automatic state transitions and bidirectional dependencies.
 import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import argparse
+from functools import lru_cache
+
+# Org heading ("** TODO Title :tag:") and property drawer line (":ID: value")
+_HEADING_RE = re.compile(r'^(\*+)\s+(\w+)\s+(.*?)(?:\s+:([\w:]+):)?$')
+_PROP_RE = re.compile(r'^\s*:([A-Z\-_]+):\s*(.*)$')
+
+# Heading keywords treated as TODO states
+_VALID_STATES = frozenset(('TODO', 'NEXT', 'IN-PROGRESS', 'DONE', 'CANCELLED'))
+
+def _write_text(filepath: Path, text: str) -> None:
+    """Write text as UTF-8 bytes; no text-layer newline translation."""
+    with open(filepath, 'wb') as f:
+        f.write(text.encode('utf-8'))
+
+@lru_cache(maxsize=None)
+def _pattern_templates(triggers_impl: bool, is_parent_goal: bool,
+                       follows_sibling: bool) -> Tuple[Tuple[str, str], ...]:
+    """Suggested edna properties for a task's pattern flags, as templates.
+    
+    {impl_id} and {prev_id} are filled in by detect_patterns. A goal's
+    children TRIGGER replaces the TDD one, and a goal's BLOCKER takes
+    precedence over the sequential one.
+    """
+    suggestions = {}
+    if triggers_impl:
+        suggestions['TRIGGER'] = "ids({impl_id}) todo!(NEXT)"
+    if is_parent_goal:
+        suggestions['BLOCKER'] = "children todo?(DONE)"
+        suggestions['TRIGGER'] = "children todo!(NEXT)"
+    if follows_sibling and 'BLOCKER' not in suggestions:
+        suggestions['BLOCKER'] = "ids({prev_id}) todo?(DONE)"
+    return tuple(suggestions.items())
 
 class OrgEdnaMigrator:
     """Convert org-mode dependencies to org-edna format."""
@@ -21,22 +53,39 @@ class OrgEdnaMigrator:
         self.conversions = []
         
     def parse_org_file(self, content: str) -> List[Dict]:
-        """Parse org file and extract task information."""
-        tasks = []
-        lines = content.split('\n')
+        """Parse org file, extract task information and fill the task map."""
+        return self.parse_org_lines(content.split('\n'))
+    
+    def parse_org_lines(self, lines: List[str]) -> List[Dict]:
+        """Parse an org file already split into lines; see parse_org_file."""
+        return list(self.iter_tasks(lines))
+    
+    def iter_tasks(self, lines: List[str]) -> Iterator[Dict]:
+        """Yield tasks one at a time as each closes at the next heading.
+        
+        A yielded task is already in the task map. Its props_end_line is
+        filled in later if its drawer's :END: comes after a child heading.
+        """
         current_task = None
+        match_heading = _HEADING_RE.match
+        match_prop = _PROP_RE.match
+        valid_states = _VALID_STATES
+        awaiting_end = []  # tasks not yet followed by an :END: line
         
         for i, line in enumerate(lines):
-            # Match org headings
-            heading_match = re.match(r'^(\*+)\s+(\w+)\s+(.*?)(?:\s+:([\w:]+):)?$', line)
+            # Match org headings; only lines starting with '*' can be one,
+            # so body text never reaches the regex
+            heading_match = match_heading(line) if line.startswith('*') else None
             if heading_match:
                 if current_task:
-                    tasks.append(current_task)
+                    self._map_task(current_task)
+                    yield current_task
                     
-                level = len(heading_match.group(1))
-                state = heading_match.group(2) if heading_match.group(2) in ['TODO', 'NEXT', 'IN-PROGRESS', 'DONE', 'CANCELLED'] else None
-                title = heading_match.group(3) if state else f"{heading_match.group(2)} {heading_match.group(3)}"
-                tags = heading_match.group(4) if heading_match.group(4) else ""
+                stars, keyword, rest, tags = heading_match.groups()
+                level = len(stars)
+                state = keyword if keyword in valid_states else None
+                title = rest if state else f"{keyword} {rest}"
+                tags = tags or ""
                 
                 current_task = {
                     'line_num': i,
@@ -47,9 +96,15 @@ class OrgEdnaMigrator:
                     'properties': {},
                     'full_heading': line
                 }
+                awaiting_end.append(current_task)
             # Match properties
-            elif current_task and line.strip().startswith(':'):
-                prop_match = re.match(r'^\s*:([A-Z\-_]+):\s*(.*)$', line)
+            elif current_task and line.lstrip().startswith(':'):
+                if line.strip() == ':END:':
+                    # End of the drawer that edits for these tasks go into
+                    for task in awaiting_end:
+                        task['props_end_line'] = i
+                    awaiting_end.clear()
+                prop_match = match_prop(line)
                 if prop_match:
                     prop_name = prop_match.group(1)
                     prop_value = prop_match.group(2)
@@ -59,24 +114,23 @@ class OrgEdnaMigrator:
                     }
         
         if current_task:
-            tasks.append(current_task)
-            
-        return tasks
+            self._map_task(current_task)
+            yield current_task
     
-    def build_task_map(self, tasks: List[Dict]) -> None:
-        """Build a map of task IDs to task info for quick lookup."""
-        for task in tasks:
-            if 'ID' in task['properties']:
-                task_id = task['properties']['ID']['value']
-                self.task_map[task_id] = task
+    def _map_task(self, task: Dict) -> None:
+        """Store a fully parsed task's ID (None if absent) and index it by ID."""
+        id_prop = task['properties'].get('ID')
+        task['id'] = id_prop['value'] if id_prop else None
+        if id_prop:
+            self.task_map[task['id']] = task
     
     def convert_simple_depends(self, task: Dict) -> Tuple[str, str]:
         """Convert simple :DEPENDS: to BLOCKER property."""
-        if 'DEPENDS' not in task['properties']:
+        depends = task['properties'].get('DEPENDS')
+        if depends is None:
             return None, None
             
-        depends_value = task['properties']['DEPENDS']['value']
-        dep_ids = depends_value.split()
+        dep_ids = depends['value'].split()
         
         # Build BLOCKER property
         if len(dep_ids) == 1:
@@ -87,7 +141,7 @@ class OrgEdnaMigrator:
         
         # For TDD pattern, also create TRIGGER on test tasks
         trigger = None
-        task_id = task['properties'].get('ID', {}).get('value', '')
+        task_id = task['id']
         
         # Check if this is an implementation task depending on a test task
         if task_id and '-TESTS' not in task_id:
@@ -101,57 +155,53 @@ class OrgEdnaMigrator:
                     
         return blocker, trigger
     
-    def detect_patterns(self, task: Dict, tasks: List[Dict]) -> Dict[str, str]:
-        """Detect common patterns and suggest edna properties."""
-        suggestions = {}
-        task_id = task['properties'].get('ID', {}).get('value', '')
+    def detect_patterns(self, task: Dict, prev: Optional[Dict],
+                        levels: Set[int]) -> Dict[str, str]:
+        """Detect common patterns and suggest edna properties.
+        
+        prev is the task just before this one in the file (None for the
+        first); levels holds every heading level present in the file.
+        """
+        task_id = task['id']
         
         # TDD Pattern: Test tasks should trigger implementation
+        impl_id = None
         if task_id and task_id.endswith('-TESTS'):
             impl_id = task_id.replace('-TESTS', '')
-            if impl_id in self.task_map:
-                suggestions['TRIGGER'] = f"ids({impl_id}) todo!(NEXT)"
         
         # Goal pattern: Parent tasks with children
-        if task['level'] == 1 and task['state'] == 'TODO':
-            # Check if has children
-            has_children = False
-            for other in tasks:
-                if other['level'] == task['level'] + 1:
-                    has_children = True
-                    break
-            
-            if has_children:
-                suggestions['BLOCKER'] = "children todo?(DONE)"
-                suggestions['TRIGGER'] = "children todo!(NEXT)"
+        is_parent_goal = (task['level'] == 1 and task['state'] == 'TODO' and
+                          task['level'] + 1 in levels)
         
         # Sequential pattern: Tasks at same level
-        task_idx = tasks.index(task)
-        if task_idx > 0 and tasks[task_idx - 1]['level'] == task['level']:
-            # Has previous sibling
-            if 'BLOCKER' not in suggestions:
-                prev_task = tasks[task_idx - 1]
-                if 'ID' in prev_task['properties']:
-                    prev_id = prev_task['properties']['ID']['value']
-                    suggestions['BLOCKER'] = f"ids({prev_id}) todo?(DONE)"
+        prev_id = None
+        if prev is not None and prev['level'] == task['level']:
+            prev_id = prev['id']
         
-        return suggestions
+        templates = _pattern_templates(impl_id is not None and impl_id in self.task_map,
+                                       is_parent_goal, prev_id is not None)
+        return {name: template.format(impl_id=impl_id, prev_id=prev_id)
+                for name, template in templates}
     
     def migrate_file(self, filepath: Path) -> str:
         """Migrate a single org file to org-edna format."""
-        with open(filepath, 'r') as f:
+        with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
             original_content = content
         
+        # One line list serves both parsing and editing
         lines = content.split('\n')
-        tasks = self.parse_org_file(content)
-        self.build_task_map(tasks)
+        tasks = self.parse_org_lines(lines)
         
         # Track changes
         changes = []
         triggers_to_add = {}  # task_id -> trigger property
         
         # First pass: collect conversions
+        # Patterns only look one task back, so the tasks are walked with a
+        # previous-task window rather than by index
+        levels = {task['level'] for task in tasks}
+        prev = None
         for task in tasks:
             if 'DEPENDS' in task['properties']:
                 blocker, trigger_info = self.convert_simple_depends(task)
@@ -168,13 +218,14 @@ class OrgEdnaMigrator:
                     triggers_to_add[test_id] = trigger
             
             # Add pattern-based suggestions
-            suggestions = self.detect_patterns(task, tasks)
+            suggestions = self.detect_patterns(task, prev, levels)
             for prop_name, prop_value in suggestions.items():
                 if prop_name not in task['properties']:
                     changes.append({
                         'task': task,
                         f'add_{prop_name.lower()}': prop_value
                     })
+            prev = task
         
         # Add triggers to test tasks
         for task_id, trigger in triggers_to_add.items():
@@ -185,49 +236,60 @@ class OrgEdnaMigrator:
                     'add_trigger': trigger
                 })
         
-        # Apply changes (from bottom to top to preserve line numbers)
+        # Apply changes bottom to top. Edits are collected against original
+        # line numbers and spliced in with one pass over the file instead
+        # of a list insert per line.
         changes.sort(key=lambda c: c['task']['line_num'], reverse=True)
+        insertions = {}  # line number -> new lines to emit before it
+        deletions = set()
         
         for change in changes:
             task = change['task']
-            props_end_line = task['line_num'] + 1
+            # First :END: after the heading, recorded while parsing
+            props_end_line = task.get('props_end_line')
             
-            # Find end of properties drawer
-            for i in range(task['line_num'] + 1, len(lines)):
-                if lines[i].strip() == ':END:':
-                    props_end_line = i
-                    break
+            new_lines = []
             
             # Remove DEPENDS if needed
             if change.get('remove_depends') and 'DEPENDS' in task['properties']:
-                dep_line = task['properties']['DEPENDS']['line_num']
-                if not self.dry_run:
-                    lines[dep_line] = ''  # Remove the line
+                deletions.add(task['properties']['DEPENDS']['line_num'])
                 print(f"  - Remove :DEPENDS: from {task['title']}")
             
             # Add BLOCKER
             if 'add_blocker' in change:
-                blocker_line = f"   :BLOCKER:     {change['add_blocker']}"
-                if not self.dry_run:
-                    lines.insert(props_end_line, blocker_line)
+                new_lines.append(f"   :BLOCKER:     {change['add_blocker']}")
                 print(f"  + Add :BLOCKER: to {task['title']}")
                 print(f"    {change['add_blocker']}")
             
-            # Add TRIGGER  
+            # Add TRIGGER (lands above the BLOCKER)
             if 'add_trigger' in change:
-                trigger_line = f"   :TRIGGER:     {change['add_trigger']}"
-                if not self.dry_run:
-                    lines.insert(props_end_line, trigger_line)
+                new_lines.insert(0, f"   :TRIGGER:     {change['add_trigger']}")
                 print(f"  + Add :TRIGGER: to {task['title']}")
                 print(f"    {change['add_trigger']}")
+            
+            if props_end_line is None:
+                # No drawer end below: directly under the heading, above
+                # lines from changes already applied
+                insertions.setdefault(task['line_num'] + 1, [])[:0] = new_lines
+            else:
+                # Just before :END:, below lines already added there
+                insertions.setdefault(props_end_line, []).extend(new_lines)
+        
+        if not self.dry_run and (insertions or deletions):
+            edited = []
+            for i, line in enumerate(lines):
+                if i in insertions:
+                    edited.extend(insertions[i])
+                if i not in deletions:
+                    # Only removed :DEPENDS: lines are dropped; blank lines stay
+                    edited.append(line)
+            edited.extend(insertions.get(len(lines), ()))
+            lines = edited
         
-        # Clean up empty lines
-        lines = [line for line in lines if line != '']
         new_content = '\n'.join(lines)
         
         if not self.dry_run and new_content != original_content:
-            with open(filepath, 'w') as f:
-                f.write(new_content)
+            _write_text(filepath, new_content)
             print(f"\n✅ Migrated {filepath}")
         elif self.dry_run:
             print(f"\n🔍 Dry run - no changes written to {filepath}")
@@ -236,7 +298,7 @@ class OrgEdnaMigrator:
     
     def add_edna_header(self, filepath: Path) -> None:
         """Add org-edna configuration to file header."""
-        with open(filepath, 'r') as f:
+        with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
         
         if '#+PROPERTY: TRIGGER' in content:
@@ -259,12 +321,10 @@ class OrgEdnaMigrator:
             ""
         ]
         
-        for config_line in reversed(edna_config):
-            lines.insert(insert_idx, config_line)
+        lines[insert_idx:insert_idx] = edna_config
         
         if not self.dry_run:
-            with open(filepath, 'w') as f:
-                f.write('\n'.join(lines))
+            _write_text(filepath, '\n'.join(lines))
             print("  + Added org-edna headers")
 
 def main():
@@ -6,17 +6,116 @@ This tool analyzes org-mode files with org-edna TRIGGER/BLOCKER properties
 to visualize dependencies and identify immediately actionable tasks.
 """
 
+import hashlib
+import io
+import mmap
+import os
+import pickle
 import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 import argparse
 from collections import defaultdict, deque
+from enum import IntEnum
+from operator import attrgetter
+
+class State(IntEnum):
+    """Task state, numbered so actionable states sort first, NEXT before TODO."""
+    NEXT = 0
+    TODO = 1
+    IN_PROGRESS = 2
+    DONE = 3
+    CANCELLED = 4
+
+# Org keyword for each State, for output; and the heading keywords treated
+# as task states, by their raw bytes
+_STATE_NAMES = ('NEXT', 'TODO', 'IN-PROGRESS', 'DONE', 'CANCELLED')
+_VALID_STATES = {name.encode(): State(i) for i, name in enumerate(_STATE_NAMES)}
+
+# Every task shares these interned priority letters
+_PRIORITIES = {p: sys.intern(p) for p in ('A', 'B', 'C')}
+
+# Property drawer entries the graph reads; others are skipped undecoded
+_GRAPH_PROPERTIES = frozenset((b'ID', b'BLOCKER', b'TRIGGER', b'DEPENDS', b'EFFORT', b'ASSIGNED'))
+
+# Every line the parser acts on, matched in one scan over the raw file and
+# told apart by lastgroup: a whole property drawer, drawer start/end,
+# property line or heading. [^\S\n] is ASCII whitespace other than a
+# newline, so no line token spans two lines; a CR before the newline is
+# left out of titles. The state keyword must not run on into a multi-byte
+# character.
+#
+# The scan stays inside the regex engine as much as it can: the shared
+# line-start test comes first, as a lookbehind (cheaper to reject on than
+# ^ in every branch), and a drawer that closes before any heading or
+# second :PROPERTIES: line is a single token (_DRAWER_PROP_RE picks out its
+# graph properties). Any other drawer falls through to the line tokens.
+_TOKEN_RE = re.compile(
+    rb'(?<![^\n])(?:'
+    rb'(?P<drawer>[^\S\n]*:PROPERTIES:[^\S\n]*\n'
+    rb'(?P<props>(?:(?![^\S\n]*:(?:PROPERTIES|END):[^\S\n]*$|\*+[^\S\n])[^\n]*\n)*?)'
+    rb'[^\S\n]*:END:[^\S\n]*$)'
+    rb'|(?P<prop_start>[^\S\n]*:PROPERTIES:[^\S\n]*$)'
+    rb'|(?P<prop_end>[^\S\n]*:END:[^\S\n]*$)'
+    rb'|(?P<prop>[^\S\n]*:(?P<pname>[A-Z\-_]+):[^\S\n]*(?P<pval>.*)$)'
+    rb'|(?P<head>(?P<stars>\*+)[^\S\n]+(?:(?P<state>\w+)(?![\w\x80-\xff]))?'
+    rb'[^\S\n]*(?P<title>.*?)(?:[^\S\n]+:(?P<tags>[\w:]+):)?\r?$))',
+    re.MULTILINE)
+
+# The graph property lines inside a drawer token, as (name, raw value)
+_DRAWER_PROP_RE = re.compile(
+    rb'^[^\S\n]*:(' + b'|'.join(sorted(_GRAPH_PROPERTIES)) + rb'):[^\S\n]*(.*)$', re.MULTILINE)
+
+# Org files smaller than this are read outright; larger ones are mmapped
+_MMAP_MIN_SIZE = 4096
+
+# Bumped whenever the cached graph layout changes
+_GRAPH_CACHE_VERSION = 2
+
+# A level-1 heading after the first line; when its keyword is a task state
+# it starts a new block for incremental parsing (see
+# OrgTaskGraph._parse_blocks). Spelling out the newline instead of using ^
+# gives the pattern a literal b'\n*' prefix, which the regex engine finds
+# with a fast substring search rather than trying every offset.
+_BLOCK_RE = re.compile(rb'\n\*[^\S\n]+(?P<state>\w+)(?![\w\x80-\xff])')
+
+# Graphviz styling: node fill by state (otherwise by actionability), node
+# shape by priority, and (style, color) by edge type
+_FILL_BY_STATE = {'DONE': 'green', 'NEXT': 'orange', 'IN-PROGRESS': 'yellow'}
+_SHAPE_BY_PRIORITY = {'A': 'octagon', 'B': 'hexagon'}
+_EDGE_STYLES = {'blocks': ('solid', 'red'), 'triggers': ('dashed', 'green'), 'parent': ('dotted', 'blue')}
+
+# "[#A] Title" priority cookie, and the IDs inside ids(...) edna finders
+_PRIO_RE = re.compile(r'\[#([A-C])\]\s*(.*)')
+_IDS_RE = re.compile(r'ids\(([^)]+)\)')
+
+# Next-action ordering by priority cookie; State orders NEXT before TODO
+_PRIORITY_ORDER = {'A': 0, 'B': 1, 'C': 2, None: 3}
+
+def _graph_cache_path(filepath: Path) -> Optional[Path]:
+    """Where the parsed graph of an org file is cached between CLI runs."""
+    try:
+        base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    except RuntimeError:
+        return None
+    key = hashlib.blake2b(str(Path(filepath).resolve()).encode(), digest_size=16).hexdigest()
+    return Path(base) / 'torq' / 'org-graph' / f'{key}.pkl'
+
+class _PlainUnpickler(pickle.Unpickler):
+    """Load graph caches, which hold only builtin containers and scalars."""
+    
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"{module}.{name} is not allowed in a graph cache")
 
 class TaskNode:
     """Represents a task in the dependency graph."""
     
-    def __init__(self, task_id: str, title: str, state: str, level: int):
+    __slots__ = ('id', 'title', 'state', 'level', 'blockers', 'triggers',
+                 'children', 'parent', 'priority', 'effort', 'assigned',
+                 'actionable', 'sort_key')
+    
+    def __init__(self, task_id: str, title: str, state: State, level: int):
         self.id = task_id
         self.title = title
         self.state = state
@@ -28,21 +127,23 @@ class TaskNode:
         self.priority = None
         self.effort = None
         self.assigned = None
+        self.actionable = False  # Set for the whole graph after parsing
+        self.sort_key = 0  # Packed priority and state, set with actionable
         
     def is_actionable(self, task_map: Dict[str, 'TaskNode']) -> bool:
         """Check if this task is actionable (all blockers are done)."""
-        if self.state not in ['TODO', 'NEXT']:
+        if self.state > State.TODO:
             return False
             
         for blocker_id in self.blockers:
             if blocker_id in task_map:
                 blocker = task_map[blocker_id]
-                if blocker.state not in ['DONE', 'CANCELLED']:
+                if blocker.state < State.DONE:
                     return False
         return True
         
     def __repr__(self):
-        return f"Task({self.id}: {self.title} [{self.state}])"
+        return f"Task({self.id}: {self.title} [{_STATE_NAMES[self.state]}])"
 
 class OrgTaskGraph:
     """Build and analyze task dependency graph from org files."""
@@ -50,70 +151,168 @@ class OrgTaskGraph:
     def __init__(self):
         self.tasks = {}  # ID -> TaskNode
         self.root_tasks = []  # Top-level task IDs
+        self._next_actions = []  # Actionable tasks, already in next-action order
         
     def parse_org_file(self, filepath: Path) -> None:
-        """Parse org file and build task graph."""
-        with open(filepath, 'r') as f:
-            content = f.read()
+        """Parse org file and build task graph.
+        
+        A graph built from a single file is cached on disk as one parsed
+        block per top-level task. While the file's mtime and size are
+        unchanged the cached blocks are used as they are; after an edit only
+        blocks whose bytes changed are tokenized again.
+        """
+        cache_path = None if self.tasks or self.root_tasks else _graph_cache_path(filepath)
+        cached = self._load_graph_cache(cache_path) if cache_path is not None else None
+        
+        with open(filepath, 'rb') as f:
+            st = os.fstat(f.fileno())
+            stamp = (st.st_mtime_ns, st.st_size)
+            if cached is not None and cached[0] == stamp:
+                _, layout, blocks = cached
+            else:
+                known = cached[2] if cached is not None else {}
+                if st.st_size < _MMAP_MIN_SIZE:
+                    layout, blocks = self._parse_blocks(f.read(), known)
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        layout, blocks = self._parse_blocks(data, known)
+                if cache_path is not None:
+                    self._save_graph_cache(cache_path, stamp, layout, blocks)
+                    
+        self._build_graph(layout, blocks)
+        
+    def _load_graph_cache(self, cache_path: Path) -> Optional[Tuple]:
+        """Read (stamp, layout, blocks) from a graph cache (best effort)."""
+        try:
+            with open(cache_path, 'rb') as f:
+                version, stamp, layout, blocks = _PlainUnpickler(f).load()
+            if version != _GRAPH_CACHE_VERSION or not all(key in blocks for key in layout):
+                return None
+            return tuple(stamp), layout, blocks
+        except Exception:
+            # Missing, outdated or corrupt cache: parse the whole file
+            return None
             
-        lines = content.split('\n')
+    def _save_graph_cache(self, cache_path: Path, stamp: Tuple[int, int],
+                          layout: List[Tuple], blocks: Dict[Tuple, Tuple]) -> None:
+        """Cache a file's parsed blocks as plain data (best effort)."""
+        data = pickle.dumps((_GRAPH_CACHE_VERSION, stamp, layout, blocks),
+                            protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+                
+    def _parse_blocks(self, content, known: Dict[Tuple, Tuple]) -> Tuple[List[Tuple], Dict[Tuple, Tuple]]:
+        """Split raw org bytes (bytes or mmap) into blocks and parse them.
+        
+        A block runs from one top-level task heading to the next; the text
+        before the first one is a block of its own. Such a heading resets
+        everything the tokenizer tracks except whether a property drawer is
+        open, so a block's parse depends only on its bytes and that flag,
+        which together form its key. Blocks already in known are reused.
+        
+        Returns:
+            (block keys in file order, key -> parsed block)
+        """
+        # The first block starts the file whether or not a heading does
+        bounds = [0]
+        bounds.extend(m.start() + 1 for m in _BLOCK_RE.finditer(content)
+                      if m.group('state') in _VALID_STATES)
+        bounds.append(len(content))
+        
+        layout = []
+        blocks = {}
+        in_properties = False
+        with memoryview(content) as view:
+            for start, end in zip(bounds, bounds[1:]):
+                digest = hashlib.blake2b(view[start:end], digest_size=16).digest()
+                key = (digest, in_properties)
+                block = blocks.get(key) or known.get(key)
+                if block is None:
+                    block = self._parse_block(content, start, end, in_properties)
+                blocks[key] = block
+                layout.append(key)
+                in_properties = block[2]
+                
+        return layout, blocks
+        
+    def _parse_block(self, content, start: int, end: int, in_properties: bool) -> Tuple:
+        """Tokenize content[start:end] into plain rows (see _parse_blocks).
+        
+        The buffer is never decoded as a whole: only the titles and property
+        values that end up on a TaskNode are. Until _build_graph places the
+        block in the file, a task without an ID is referred to by its line
+        number within the block, as an int.
+        
+        Returns:
+            (task rows, root references, in_properties at the end, line count)
+        """
         current_task = None
         task_stack = []  # Stack to track parent tasks
-        in_properties = False
+        entries = []  # (block line, task) in file order
+        roots = []
+        valid_states = _VALID_STATES
+        
+        # Line numbers are counted only up to the headings that need them
+        line_num = 0
+        line_pos = start
         
-        for i, line in enumerate(lines):
+        for m in _TOKEN_RE.finditer(content, start, end):
+            kind = m.lastgroup
+            
+            # Whole properties drawer
+            if kind == 'drawer':
+                in_properties = False
+                if current_task:
+                    for prop_name, prop_value in _DRAWER_PROP_RE.findall(
+                            content, m.start('props'), m.end('props')):
+                        self._set_property(current_task, prop_name, prop_value)
+                        
             # Check for properties drawer
-            if line.strip() == ':PROPERTIES:':
+            elif kind == 'prop_start':
                 in_properties = True
-                continue
-            elif line.strip() == ':END:':
+            elif kind == 'prop_end':
                 in_properties = False
-                continue
                 
             # Parse properties
-            if in_properties and current_task:
-                prop_match = re.match(r'^\s*:([A-Z\-_]+):\s*(.*)$', line)
-                if prop_match:
-                    prop_name = prop_match.group(1)
-                    prop_value = prop_match.group(2).strip()
-                    
-                    if prop_name == 'ID':
-                        current_task.id = prop_value
-                    elif prop_name == 'BLOCKER':
-                        self._parse_blocker(current_task, prop_value)
-                    elif prop_name == 'TRIGGER':
-                        self._parse_trigger(current_task, prop_value)
-                    elif prop_name == 'DEPENDS':  # Legacy support
-                        deps = prop_value.split()
-                        current_task.blockers.extend(deps)
-                    elif prop_name == 'EFFORT':
-                        current_task.effort = prop_value
-                    elif prop_name == 'ASSIGNED':
-                        current_task.assigned = prop_value
+            elif kind == 'prop':
+                if in_properties and current_task:
+                    prop_name = m.group('pname')
+                    if prop_name in _GRAPH_PROPERTIES:
+                        self._set_property(current_task, prop_name, m.group('pval'))
                         
             # Parse headings
-            heading_match = re.match(r'^(\*+)\s+(\w+)?\s*(.*?)(?:\s+:([\w:]+):)?$', line)
-            if heading_match:
-                level = len(heading_match.group(1))
-                state = heading_match.group(2) if heading_match.group(2) in ['TODO', 'NEXT', 'IN-PROGRESS', 'DONE', 'CANCELLED'] else None
-                
-                if not state:
+            else:
+                state = valid_states.get(m.group('state'))
+                if state is None:
                     # Not a task, might be a goal
                     continue
                     
-                title = heading_match.group(3) if state else f"{heading_match.group(2)} {heading_match.group(3)}"
-                tags = heading_match.group(4) if heading_match.group(4) else ""
+                level = len(m.group('stars'))
+                title = m.group('title').decode('utf-8')
                 
                 # Extract priority
-                priority_match = re.match(r'\[#([A-C])\]\s*(.*)', title)
+                priority_match = _PRIO_RE.match(title)
                 if priority_match:
-                    priority = priority_match.group(1)
+                    priority = _PRIORITIES[priority_match.group(1)]
                     title = priority_match.group(2)
                 else:
                     priority = None
                 
-                # Create task node
-                task = TaskNode(f"task_{i}", title, state, level)
+                heading_pos = m.start()
+                line_num += content[line_pos:heading_pos].count(b'\n')
+                line_pos = heading_pos
+                
+                # Create task node, with its line number as a temporary ID
+                task = TaskNode(line_num, title, state, level)
                 task.priority = priority
                 
                 # Update parent-child relationships
@@ -125,22 +324,75 @@ class OrgTaskGraph:
                     task.parent = parent.id
                     parent.children.append(task.id)
                 else:
-                    self.root_tasks.append(task.id)
+                    roots.append(task.id)
                     
                 task_stack.append(task)
                 current_task = task
+                entries.append((line_num, task))
                 
-                # Store task temporarily with line number as ID
-                if current_task.id == f"task_{i}":
-                    self.tasks[f"task_{i}"] = current_task
-                    
-        # Second pass: Update references with actual IDs
+        line_num += content[line_pos:end].count(b'\n')
+        rows = tuple((line, t.id, t.title, int(t.state), t.level, tuple(t.blockers),
+                      tuple(t.triggers), tuple(t.children), t.parent, t.priority,
+                      t.effort, t.assigned)
+                     for line, t in entries)
+        return rows, tuple(roots), in_properties, line_num
+        
+    def _set_property(self, task: TaskNode, prop_name: bytes, raw_value: bytes) -> None:
+        """Apply one of the _GRAPH_PROPERTIES to a task."""
+        prop_value = raw_value.decode('utf-8').strip()
+        
+        if prop_name == b'ID':
+            task.id = prop_value
+        elif prop_name == b'BLOCKER':
+            self._parse_blocker(task, prop_value)
+        elif prop_name == b'TRIGGER':
+            self._parse_trigger(task, prop_value)
+        elif prop_name == b'DEPENDS':  # Legacy support
+            deps = prop_value.split()
+            task.blockers.extend(deps)
+        elif prop_name == b'EFFORT':
+            task.effort = prop_value
+        elif prop_name == b'ASSIGNED':
+            task.assigned = prop_value
+            
+    def _build_graph(self, layout: List[Tuple], blocks: Dict[Tuple, Tuple]) -> None:
+        """Add parsed blocks to the graph, in file order, under final IDs."""
+        temp_tasks = []  # (line-number ID, task) in file order
+        base = 0  # File line of the block's first line
+        
+        def place(ref):
+            # Block-relative temporary ID -> file-wide one
+            return f"task_{base + ref}" if type(ref) is int else ref
+            
+        for key in layout:
+            rows, roots, _, line_count = blocks[key]
+            for (line, task_id, title, state, level, blockers, triggers, children,
+                 parent, priority, effort, assigned) in rows:
+                temp_id = f"task_{base + line}"
+                task = TaskNode(place(task_id), title, State(state), level)
+                task.blockers = list(blockers)
+                task.triggers = list(triggers)
+                task.children = [place(c) for c in children]
+                task.parent = place(parent)
+                task.priority = priority
+                task.effort = effort
+                task.assigned = assigned
+                temp_tasks.append((temp_id, task))
+            self.root_tasks.extend(place(r) for r in roots)
+            base += line_count
+            
+        # Second pass: Store tasks under their actual IDs. Tasks without an
+        # ID keep the temporary one and go in first, followed by the rest.
         id_map = {}
-        for temp_id, task in list(self.tasks.items()):
-            if task.id != temp_id:
+        renamed = []
+        for temp_id, task in temp_tasks:
+            if task.id == temp_id:
+                self.tasks[temp_id] = task
+            else:
                 id_map[temp_id] = task.id
-                self.tasks[task.id] = task
-                del self.tasks[temp_id]
+                renamed.append(task)
+        for task in renamed:
+            self.tasks[task.id] = task
                 
         # Update references
         for task in self.tasks.values():
@@ -151,11 +403,14 @@ class OrgTaskGraph:
             task.triggers = [id_map.get(t, t) for t in task.triggers]
             
         self.root_tasks = [id_map.get(r, r) for r in self.root_tasks]
+        
+        # States and blockers are final now
+        self._mark_actionable()
                 
     def _parse_blocker(self, task: TaskNode, blocker_str: str) -> None:
         """Parse BLOCKER property and extract dependencies."""
         # Extract IDs from ids() expressions
-        ids_matches = re.findall(r'ids\(([^)]+)\)', blocker_str)
+        ids_matches = _IDS_RE.findall(blocker_str)
         for ids_match in ids_matches:
             task_ids = ids_match.split()
             task.blockers.extend(task_ids)
@@ -163,68 +418,74 @@ class OrgTaskGraph:
     def _parse_trigger(self, task: TaskNode, trigger_str: str) -> None:
         """Parse TRIGGER property and extract triggered tasks."""
         # Extract IDs from ids() expressions
-        ids_matches = re.findall(r'ids\(([^)]+)\)', trigger_str)
+        ids_matches = _IDS_RE.findall(trigger_str)
         for ids_match in ids_matches:
             task_ids = ids_match.split()
             task.triggers.extend(task_ids)
             
-    def find_next_actions(self, project_id: str = None) -> List[TaskNode]:
-        """Find all actionable NEXT tasks, optionally filtered by project."""
+    def _mark_actionable(self) -> None:
+        """Set every task's actionable flag in one sweep over the graph.
+        
+        Same rule as TaskNode.is_actionable: a TODO/NEXT task whose known
+        blockers are all DONE or CANCELLED. The actionable tasks are sorted
+        into next-action order once here, so queries only filter.
+        """
+        tasks = self.tasks
+        done = {tid for tid, t in tasks.items() if t.state >= State.DONE}
         next_actions = []
+        for task in tasks.values():
+            task.actionable = (task.state <= State.TODO and
+                               all(b in done or b not in tasks for b in task.blockers))
+            if task.actionable:
+                # Priority above state in one int (actionable states are < 16)
+                task.sort_key = (_PRIORITY_ORDER.get(task.priority, 3) << 4) | task.state
+                next_actions.append(task)
+                
+        # Sort by priority, state, then title
+        next_actions.sort(key=attrgetter('sort_key', 'title'))
+        self._next_actions = next_actions
         
-        if project_id:
-            # Get all tasks in project tree
-            project_tasks = self._get_project_tree(project_id)
-        else:
-            project_tasks = set(self.tasks.keys())
+    def find_next_actions(self, project_id: str = None) -> List[TaskNode]:
+        """Find all actionable NEXT tasks, optionally filtered by project."""
+        if not project_id:
+            return list(self._next_actions)
             
-        for task_id in project_tasks:
-            if task_id in self.tasks:
-                task = self.tasks[task_id]
-                if task.is_actionable(self.tasks):
-                    next_actions.append(task)
-                    
-        # Sort by priority and state
-        priority_order = {'A': 0, 'B': 1, 'C': 2, None: 3}
-        state_order = {'NEXT': 0, 'TODO': 1}
-        
-        next_actions.sort(key=lambda t: (
-            priority_order.get(t.priority, 3),
-            state_order.get(t.state, 2),
-            t.title
-        ))
+        # Get all tasks in project tree
+        project_tasks = self._get_project_tree(project_id)
         
-        return next_actions
+        return [task for task in self._next_actions if task.id in project_tasks]
         
     def _get_project_tree(self, project_id: str) -> Set[str]:
         """Get all tasks in a project tree including dependencies."""
         if project_id not in self.tasks:
             return set()
             
+        tasks = self.tasks
         visited = set()
         queue = deque([project_id])
         
         while queue:
             task_id = queue.popleft()
-            if task_id in visited or task_id not in self.tasks:
+            # A task can be queued twice before its first visit
+            if task_id in visited:
                 continue
                 
             visited.add(task_id)
-            task = self.tasks[task_id]
-            
-            # Add children
-            queue.extend(task.children)
+            task = tasks[task_id]
             
-            # Add dependencies (blockers)
-            queue.extend(task.blockers)
-            
-            # Add triggered tasks
-            queue.extend(task.triggers)
+            # Queue only known, unvisited children, dependencies (blockers)
+            # and triggered tasks
+            for related in (task.children, task.blockers, task.triggers):
+                queue.extend(r for r in related if r not in visited and r in tasks)
             
         return visited
         
     def extract_task_graph(self, task_id: str) -> Dict:
-        """Extract dependency graph for a specific task."""
+        """Extract dependency graph for a specific task.
+        
+        Edges are (from, to, type) tuples, type being "blocks", "triggers"
+        or "parent".
+        """
         if task_id not in self.tasks:
             return {"error": f"Task {task_id} not found"}
             
@@ -249,94 +510,69 @@ class OrgTaskGraph:
             # Add node
             graph["nodes"][current_id] = {
                 "title": task.title,
-                "state": task.state,
+                "state": _STATE_NAMES[task.state],
                 "priority": task.priority,
                 "effort": task.effort,
-                "actionable": task.is_actionable(self.tasks)
+                "actionable": task.actionable
             }
             
             # Add edges and queue dependencies
             for blocker_id in task.blockers:
                 if blocker_id in self.tasks:
-                    graph["edges"].append({
-                        "from": blocker_id,
-                        "to": current_id,
-                        "type": "blocks"
-                    })
-                    queue.append(blocker_id)
+                    graph["edges"].append((blocker_id, current_id, "blocks"))
+                    if blocker_id not in visited:
+                        queue.append(blocker_id)
                     
             for trigger_id in task.triggers:
                 if trigger_id in self.tasks:
-                    graph["edges"].append({
-                        "from": current_id,
-                        "to": trigger_id,
-                        "type": "triggers"
-                    })
-                    queue.append(trigger_id)
+                    graph["edges"].append((current_id, trigger_id, "triggers"))
+                    if trigger_id not in visited:
+                        queue.append(trigger_id)
                     
             # Add children
             for child_id in task.children:
                 if child_id in self.tasks:
-                    graph["edges"].append({
-                        "from": current_id,
-                        "to": child_id,
-                        "type": "parent"
-                    })
-                    queue.append(child_id)
+                    graph["edges"].append((current_id, child_id, "parent"))
+                    if child_id not in visited:
+                        queue.append(child_id)
                     
         return graph
         
     def generate_graphviz(self, task_id: str = None) -> str:
         """Generate Graphviz DOT representation of task graph."""
-        dot = ["digraph TaskGraph {"]
-        dot.append('  rankdir=TB;')
-        dot.append('  node [shape=box, style=rounded];')
+        buf = io.StringIO()
+        write = buf.write
+        write('digraph TaskGraph {\n  rankdir=TB;\n  node [shape=box, style=rounded];\n')
         
         if task_id:
             graph = self.extract_task_graph(task_id)
-            nodes = graph["nodes"]
-            edges = graph["edges"]
             
             # Add nodes
-            for node_id, info in nodes.items():
-                color = "green" if info["state"] == "DONE" else \
-                       "orange" if info["state"] == "NEXT" else \
-                       "yellow" if info["state"] == "IN-PROGRESS" else \
-                       "lightblue" if info["actionable"] else "white"
-                       
-                shape = "octagon" if info["priority"] == "A" else \
-                       "hexagon" if info["priority"] == "B" else "box"
-                       
-                label = f"{node_id}\\n{info['title'][:30]}...\\n[{info['state']}]"
-                if info["effort"]:
-                    label += f"\\n{info['effort']}"
-                    
-                dot.append(f'  "{node_id}" [label="{label}", fillcolor={color}, style=filled, shape={shape}];')
+            for node_id, info in graph["nodes"].items():
+                state = info["state"]
+                color = _FILL_BY_STATE.get(state) or ("lightblue" if info["actionable"] else "white")
+                shape = _SHAPE_BY_PRIORITY.get(info["priority"], "box")
+                effort = f"\\n{info['effort']}" if info["effort"] else ""
+                write(f'  "{node_id}" [label="{node_id}\\n{info["title"][:30]}...\\n[{state}]{effort}", '
+                      f'fillcolor={color}, style=filled, shape={shape}];\n')
                 
             # Add edges
-            for edge in edges:
-                style = "solid" if edge["type"] == "blocks" else \
-                       "dashed" if edge["type"] == "triggers" else "dotted"
-                color = "red" if edge["type"] == "blocks" else \
-                       "green" if edge["type"] == "triggers" else "blue"
-                       
-                dot.append(f'  "{edge["from"]}" -> "{edge["to"]}" [style={style}, color={color}];')
+            for from_id, to_id, edge_type in graph["edges"]:
+                style, color = _EDGE_STYLES[edge_type]
+                write(f'  "{from_id}" -> "{to_id}" [style={style}, color={color}];\n')
         else:
             # Show all tasks
-            for task_id, task in self.tasks.items():
-                color = "green" if task.state == "DONE" else \
-                       "orange" if task.state == "NEXT" else \
-                       "yellow" if task.state == "IN-PROGRESS" else \
-                       "lightblue" if task.is_actionable(self.tasks) else "white"
-                       
-                dot.append(f'  "{task_id}" [label="{task.title[:30]}...", fillcolor={color}, style=filled];')
-                
+            tasks = self.tasks
+            for task_id, task in tasks.items():
+                color = _FILL_BY_STATE.get(_STATE_NAMES[task.state]) or \
+                       ("lightblue" if task.actionable else "white")
+                write(f'  "{task_id}" [label="{task.title[:30]}...", fillcolor={color}, style=filled];\n')
                 for blocker in task.blockers:
-                    if blocker in self.tasks:
-                        dot.append(f'  "{blocker}" -> "{task_id}" [color=red];')
+                    if blocker in tasks:
+                        write(f'  "{blocker}" -> "{task_id}" [color=red];\n')
                         
-        dot.append("}")
-        return "\n".join(dot)
+        write("}")
+        return buf.getvalue()
 
 def main():
     parser = argparse.ArgumentParser(description='Extract task graph and find NEXT actions')
@@ -369,7 +605,7 @@ def main():
                 effort = f"({task.effort})" if task.effort else ""
                 assigned = f"→ {task.assigned}" if task.assigned else ""
                 
-                print(f"\n{task.state:12} {priority:4} {task.id}")
+                print(f"\n{_STATE_NAMES[task.state]:12} {priority:4} {task.id}")
                 print(f"  📋 {task.title}")
                 print(f"  ⏱️  {effort} {assigned}")
                 
@@ -377,7 +613,7 @@ def main():
                     blocker_states = []
                     for b_id in task.blockers:
                         if b_id in graph.tasks:
-                            b_state = graph.tasks[b_id].state
+                            b_state = _STATE_NAMES[graph.tasks[b_id].state]
                             blocker_states.append(f"{b_id}[{b_state}]")
                     if any('[DONE]' not in s for s in blocker_states):
                         print(f"  ⚠️  Blocked by: {', '.join(blocker_states)}")
@@ -411,18 +647,18 @@ def main():
                 
             # Show dependencies
             print(f"\n🔗 Dependencies ({len(task_graph['edges'])} edges):")
-            blocks = [e for e in task_graph["edges"] if e["type"] == "blocks"]
-            triggers = [e for e in task_graph["edges"] if e["type"] == "triggers"]
+            blocks = [e for e in task_graph["edges"] if e[2] == "blocks"]
+            triggers = [e for e in task_graph["edges"] if e[2] == "triggers"]
             
             if blocks:
                 print("\n  Blocking relationships:")
-                for edge in blocks:
-                    print(f"    {edge['from']} → blocks → {edge['to']}")
+                for from_id, to_id, _ in blocks:
+                    print(f"    {from_id} → blocks → {to_id}")
                     
             if triggers:
                 print("\n  Trigger relationships:")
-                for edge in triggers:
-                    print(f"    {edge['from']} → triggers → {edge['to']}")
+                for from_id, to_id, _ in triggers:
+                    print(f"    {from_id} → triggers → {to_id}")
                     
     elif args.graph:
         # Generate Graphviz
@@ -437,14 +673,14 @@ def main():
         # Count by state
         state_counts = defaultdict(int)
         for task in graph.tasks.values():
-            state_counts[task.state] += 1
+            state_counts[_STATE_NAMES[task.state]] += 1
             
         print("\nBy State:")
         for state, count in sorted(state_counts.items()):
             print(f"  {state:12}: {count:3}")
             
         # Count actionable
-        actionable = [t for t in graph.tasks.values() if t.is_actionable(graph.tasks)]
+        actionable = [t for t in graph.tasks.values() if t.actionable]
         print(f"\n🎯 Actionable tasks: {len(actionable)}")
         
         # Show top actionable by priority
@@ -8,13 +8,15 @@ This demonstrates the power of DAG-based task management:
 - Generate parallel execution plans based on priority
 """
 
+import heapq
 import json
 import sys
-from typing import Dict, List, Set, Optional
+from array import array
+from typing import Dict, List, Set, Optional, Tuple
 from dataclasses import dataclass
 from collections import defaultdict, deque
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: str
     heading: str
@@ -39,6 +41,10 @@ class TaskGraph:
         self.tasks = {t.id: t for t in tasks}
         self.dependencies = self._build_dependency_graph()
         self.reverse_dependencies = self._build_reverse_dependencies()
+        # Flat (CSR) copy of the dependency graph over integer task indices
+        self._ids = list(self.tasks)
+        self._index = {task_id: i for i, task_id in enumerate(self._ids)}
+        self._dep_indptr, self._dep_indices = self._build_adjacency(self.dependencies)
     
     def _build_dependency_graph(self) -> Dict[str, Set[str]]:
         """Build forward dependency graph"""
@@ -61,27 +67,45 @@ class TaskGraph:
                 reverse_deps[dep_id].add(task_id)
         return reverse_deps
     
+    def _build_adjacency(self, graph: Dict[str, Set[str]]) -> Tuple[array, array]:
+        """Flatten a task graph into CSR arrays over task indices.
+        
+        Task i's neighbours are indices[indptr[i]:indptr[i + 1]], in the
+        graph's set iteration order.
+        """
+        index = self._index
+        indptr = array('l', [0])
+        indices = array('l')
+        for task_id in self._ids:
+            indices.extend(index[dep_id] for dep_id in graph.get(task_id, ()))
+            indptr.append(len(indices))
+        return indptr, indices
+    
     def extract_dependency_tree(self, target_id: str) -> Dict[str, Task]:
         """Extract all tasks needed to complete the target task"""
         if target_id not in self.tasks:
             return {}
         
-        visited = set()
+        ids = self._ids
+        indptr = self._dep_indptr
+        indices = self._dep_indices
+        visited = bytearray(len(ids))
         required_tasks = {}
+        stack = [self._index[target_id]]
         
-        def dfs(task_id: str):
-            if task_id in visited or task_id not in self.tasks:
-                return
+        while stack:
+            i = stack.pop()
+            if visited[i]:
+                continue
             
-            visited.add(task_id)
-            task = self.tasks[task_id]
-            required_tasks[task_id] = task
+            visited[i] = 1
+            task_id = ids[i]
+            required_tasks[task_id] = self.tasks[task_id]
             
-            # Recursively add all dependencies
-            for dep_id in self.dependencies.get(task_id, set()):
-                dfs(dep_id)
+            # Push dependencies reversed so they are visited in the same
+            # order a recursive walk would use
+            stack.extend(reversed(indices[indptr[i]:indptr[i + 1]]))
         
-        dfs(target_id)
         return required_tasks
     
     def get_priority_goals(self, priority: str) -> List[Task]:
@@ -124,23 +148,33 @@ class TaskGraph:
         # Tasks can run in parallel if they have no dependencies between them
         ready_tasks = [t for t in tasks if t.is_actionable and t.state in ['TODO', 'NEXT']]
         
-        # For now, simple grouping - tasks with no dependencies can start immediately
-        parallel_sets = []
-        current_set = []
+        ready_ids = {t.id for t in ready_tasks}
         
+        # Count the ready tasks each task still waits on; a task joins the
+        # set after the last one of them, so each set depends only on
+        # earlier sets
+        waiting = {}
+        dependents = defaultdict(list)
         for task in ready_tasks:
-            # Check if this task has dependencies on other ready tasks
-            has_deps_in_ready = any(
-                dep_id in [rt.id for rt in ready_tasks] 
-                for dep_id in task.depends
-            )
-            
-            if not has_deps_in_ready:
-                current_set.append(task.id)
+            deps = {dep_id for dep_id in task.depends if dep_id in ready_ids}
+            waiting[task.id] = len(deps)
+            for dep_id in deps:
+                dependents[dep_id].append(task.id)
+        
+        parallel_sets = []
+        current_set = [t.id for t in ready_tasks if not waiting[t.id]]
         
-        if current_set:
+        while current_set:
             parallel_sets.append(current_set)
+            next_set = []
+            for task_id in current_set:
+                for dependent_id in dependents[task_id]:
+                    waiting[dependent_id] -= 1
+                    if not waiting[dependent_id]:
+                        next_set.append(dependent_id)
+            current_set = next_set
         
+        # Tasks caught in a dependency cycle never become ready
         return parallel_sets
     
     def calculate_total_effort(self, tasks: List[Task]) -> str:
@@ -149,8 +183,17 @@ class TaskGraph:
         # For demo, return placeholder
         return f"{len(tasks)} tasks (effort calculation TBD)"
     
-    def get_ready_tasks(self, task_ids: List[str]) -> List[Task]:
-        """Get tasks that are ready to execute from given set"""
+    @staticmethod
+    def ready_order(task: Task) -> Tuple[str, str]:
+        """Sort key for ready tasks: priority (unset last), then ID"""
+        return (task.priority or 'Z', task.id)
+    
+    def get_ready_tasks(self, task_ids: List[str], ordered: bool = True) -> List[Task]:
+        """Get tasks that are ready to execute from given set
+        
+        With ordered=False the tasks come back unsorted, for callers that
+        only need a count or the first few (see ready_order).
+        """
         ready = []
         for task_id in task_ids:
             if task_id not in self.tasks:
@@ -169,7 +212,9 @@ class TaskGraph:
             if deps_complete:
                 ready.append(task)
         
-        return sorted(ready, key=lambda t: (t.priority or 'Z', t.id))
+        if ordered:
+            ready.sort(key=self.ready_order)
+        return ready
 
 def demo_priority_extraction():
     """Demo the priority-based dependency extraction"""
@@ -212,10 +257,10 @@ def demo_priority_extraction():
         
         # Show dependency tree for this goal
         tree_tasks = goal_info['required_tasks']
-        ready_tasks = graph.get_ready_tasks(list(tree_tasks.keys()))
+        ready_tasks = graph.get_ready_tasks(tree_tasks, ordered=False)
         
         print(f"     Ready to start: {len(ready_tasks)} tasks")
-        for task in ready_tasks[:3]:  # Show first 3
+        for task in heapq.nsmallest(3, ready_tasks, key=graph.ready_order):  # Show first 3
             print(f"       - {task.heading}")
     
     print(f"\n⚡ Parallel Execution Opportunities:")
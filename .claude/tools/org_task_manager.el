@@ -279,5 +279,41 @@
        (t
         (error "Unknown command: %s" command))))))
 
+;; Server mode: one Emacs process answers many commands
+(defconst torq/server-done "__TORQ_DONE__"
+  "Line written after the output of each successful server command.")
+
+(defconst torq/server-failed "__TORQ_FAILED__"
+  "Prefix of the line written, with the error message, after a failed command.")
+
+(defun torq/serve-release-buffers ()
+  "Kill file buffers so the next command reads files from disk again."
+  (dolist (buf (buffer-list))
+    (when (buffer-file-name buf)
+      (with-current-buffer buf
+        (set-buffer-modified-p nil))
+      (kill-buffer buf))))
+
+(defun torq/serve (file)
+  "Run commands against FILE, one per line of stdin, until end of input.
+Each line is a JSON array holding a `torq/cli-main' command and its
+arguments, without the file.  The command's output is followed by a line
+holding `torq/server-done', or `torq/server-failed' and the error."
+  (let (line)
+    (while (setq line (condition-case nil
+                          (read-from-minibuffer "")
+                        (error nil)))
+      (unless (string-empty-p line)
+        (condition-case err
+            (let* ((request (append (json-read-from-string line) nil))
+                   (torq/command-args (cons (car request) (cons file (cdr request)))))
+              (torq/cli-main)
+              (princ (format "\n%s\n" torq/server-done)))
+          (error
+           (princ (format "\n%s %s\n" torq/server-failed
+                          (replace-regexp-in-string
+                           "\n" " " (error-message-string err))))))
+        (torq/serve-release-buffers)))))
+
 (provide 'org_task_manager)
 ;;; org_task_manager.el ends here
\ No newline at end of file
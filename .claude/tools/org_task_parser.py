@@ -251,36 +251,44 @@ class OrgTaskParser:
         return len(validation_errors) == 0, validation_errors
     
     def _find_dependency_cycles(self) -> List[List[str]]:
-        """Detect circular dependencies using DFS"""
+        """Detect circular dependencies using an iterative DFS
+        
+        Reports the first cycle found from each DFS root, as the path from
+        the repeated task back to itself.
+        """
+        tasks = self.tasks
         cycles = []
         visited = set()
-        rec_stack = set()
         
-        def dfs(task_id: str, path: List[str]) -> bool:
-            visited.add(task_id)
-            rec_stack.add(task_id)
-            path.append(task_id)
+        for root_id in tasks:
+            if root_id in visited:
+                continue
             
-            task = self.tasks.get(task_id)
-            if task:
-                depends = task.properties.get('depends', '').split()
-                for dep_id in depends:
-                    if dep_id in self.tasks:
-                        if dep_id not in visited:
-                            if dfs(dep_id, path.copy()):
-                                return True
-                        elif dep_id in rec_stack:
-                            # Found cycle
-                            cycle_start = path.index(dep_id)
-                            cycles.append(path[cycle_start:] + [dep_id])
-                            return True
+            # The current DFS path, and for each task on it an iterator over
+            # the dependencies it has yet to explore
+            visited.add(root_id)
+            path = [root_id]
+            on_path = {root_id}
+            frames = [iter(tasks[root_id].properties.get('depends', '').split())]
             
-            rec_stack.remove(task_id)
-            return False
-        
-        for task_id in self.tasks:
-            if task_id not in visited:
-                dfs(task_id, [])
+            while frames:
+                dep_id = next(frames[-1], None)
+                if dep_id is None:
+                    # All dependencies explored: backtrack
+                    frames.pop()
+                    on_path.remove(path.pop())
+                elif dep_id not in tasks:
+                    continue
+                elif dep_id not in visited:
+                    visited.add(dep_id)
+                    path.append(dep_id)
+                    on_path.add(dep_id)
+                    frames.append(iter(tasks[dep_id].properties.get('depends', '').split()))
+                elif dep_id in on_path:
+                    # Found cycle; stop exploring from this root
+                    cycle_start = path.index(dep_id)
+                    cycles.append(path[cycle_start:] + [dep_id])
+                    break
         
         return cycles
     
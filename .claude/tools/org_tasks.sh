@@ -28,7 +28,7 @@ if [ ! -f "$ACTIVE_FILE" ]; then
 #+STARTUP: logdone
 
 EOF
-    echo "Created $ACTIVE_FILE"
+    echo "Created $ACTIVE_FILE" >&2
 fi
 
 # Function to run Emacs in batch mode
@@ -77,6 +77,15 @@ case "$1" in
         run_emacs add "$@"
         ;;
         
+    serve)
+        # Long-lived mode for AgentTaskManager: one JSON array command per
+        # stdin line, each reply terminated by a __TORQ_DONE__ or
+        # __TORQ_FAILED__ line
+        exec emacs --batch \
+             --load "$ORG_MANAGER_EL" \
+             --eval "(torq/serve \"$ACTIVE_FILE\")"
+        ;;
+        
     help|--help|-h)
         cat <<EOF
 Torq Org-mode Task Management CLI
@@ -88,6 +97,7 @@ Commands:
     ready, next     Get tasks ready for execution
     update          Update task state
     add             Add a new task
+    serve           Answer commands read from stdin (one Emacs process)
     help            Show this help message
 
 Examples:
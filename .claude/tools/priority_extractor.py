@@ -60,25 +60,23 @@ def build_dependency_graph(tasks: List[Dict]) -> Dict[str, Set[str]]:
     return dict(deps)
 
 def extract_dependency_tree(task_id: str, dependencies: Dict[str, Set[str]], all_tasks: Dict[str, Dict]) -> Set[str]:
-    """Extract all tasks needed to complete the target task (recursive DFS)"""
+    """Extract all tasks needed to complete the target task (iterative DFS)"""
     if task_id not in all_tasks:
         return set()
     
     required_tasks = set()
-    visited = set()
+    stack = [task_id]
     
-    def dfs(current_id: str):
-        if current_id in visited or current_id not in all_tasks:
-            return
+    while stack:
+        current_id = stack.pop()
+        if current_id in required_tasks or current_id not in all_tasks:
+            continue
         
-        visited.add(current_id)
         required_tasks.add(current_id)
         
-        # Recursively add all dependencies
-        for dep_id in dependencies.get(current_id, set()):
-            dfs(dep_id)
+        # Queue all dependencies
+        stack.extend(dependencies.get(current_id, ()))
     
-    dfs(task_id)
     return required_tasks
 
 def get_priority_goals(tasks: List[Dict], priority: str) -> List[Dict]:
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for DependencyAnalyzer scope queries
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / ".claude" / "scrum"))
+
+from dependency_analyzer import DependencyAnalyzer
+
+
+class FakeParser:
+    """Stands in for TaskParser with a fixed task list"""
+    
+    def __init__(self, tasks):
+        self.tasks = tasks
+        
+    def get_all_tasks(self):
+        return self.tasks
+
+
+def make_task(task_id: str, scope: list) -> dict:
+    return {
+        'filepath': f'/tasks/sprint-001/{task_id}.md',
+        'metadata': {'task_id': task_id, 'status': 'TODO', 'scope': scope},
+    }
+
+
+class TestScopeImpact(unittest.TestCase):
+    """analyze_scope_impact keeps the plain substring rule for every query"""
+    
+    def setUp(self):
+        self.analyzer = DependencyAnalyzer()
+        self.analyzer.task_dir = Path('/nonexistent')
+        self.analyzer._parser = FakeParser([
+            make_task('T-001', ['libs/codec/x.rs']),
+            make_task('T-002', ['libs/codecs/y.rs']),
+            make_task('T-003', ['services/adapters/mod.rs', 'libs/codecs/z.rs']),
+            make_task('T-004', ['libs']),
+            make_task('T-005', []),
+        ])
+        
+    def matches(self, query: str) -> list:
+        return [(t['task_id'], t['scope_match']) for t in self.analyzer.analyze_scope_impact(query)]
+        
+    def test_fragment_matches_sibling_scopes(self):
+        self.assertEqual(self.matches('codec'), [
+            ('T-001', 'libs/codec/x.rs'),
+            ('T-002', 'libs/codecs/y.rs'),
+            ('T-003', 'libs/codecs/z.rs'),
+        ])
+        
+    def test_path_prefix_matches_sibling_scopes(self):
+        self.assertEqual(self.matches('libs/codec'), [
+            ('T-001', 'libs/codec/x.rs'),
+            ('T-002', 'libs/codecs/y.rs'),
+            ('T-003', 'libs/codecs/z.rs'),
+            ('T-004', 'libs'),
+        ])
+        
+    def test_scope_inside_query(self):
+        self.assertEqual(self.matches('libs/codec/x.rs'), [
+            ('T-001', 'libs/codec/x.rs'),
+            ('T-004', 'libs'),
+        ])
+        
+    def test_short_query(self):
+        self.assertEqual([task_id for task_id, _ in self.matches('rs')], ['T-001', 'T-002', 'T-003'])
+        
+    def test_no_match(self):
+        self.assertEqual(self.matches('frontend'), [])
+
+    def test_null_and_non_string_scopes(self):
+        self.analyzer._parser = FakeParser([
+            make_task('T-001', None),
+            make_task('T-002', [123, 'libs/a.rs', None]),
+            make_task('T-003', ['libs/b.rs']),
+        ])
+        graph, task_map = self.analyzer.build_dependency_graph()
+        self.assertEqual(list(task_map), ['T-001', 'T-002', 'T-003'])
+        self.assertEqual(self.matches('libs'), [('T-002', 'libs/a.rs'), ('T-003', 'libs/b.rs')])
+        self.assertEqual(self.matches('a'), [('T-002', 'libs/a.rs')])
+
+
+if __name__ == '__main__':
+    unittest.main()
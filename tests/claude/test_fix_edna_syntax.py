@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Tests for the org-edna syntax fixer (.claude/tools/fix-edna-syntax.py)
+"""
+
+import importlib.util
+import unittest
+from pathlib import Path
+
+_SCRIPT = Path(__file__).parent.parent.parent / ".claude" / "tools" / "fix-edna-syntax.py"
+_spec = importlib.util.spec_from_file_location("fix_edna_syntax", _SCRIPT)
+fix_edna_syntax = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(fix_edna_syntax)
+
+
+class TestApplyEdnaFixes(unittest.TestCase):
+    """_apply_edna_fixes rewrites to a fixpoint and counts real changes"""
+    
+    def apply(self, text: str):
+        content, fixes = fix_edna_syntax._apply_edna_fixes(text.encode())
+        return content.decode(), fixes
+        
+    def test_blocker_condition_removed(self):
+        self.assertEqual(self.apply(":BLOCKER: ids(BUILD-001) todo?(DONE)\n"),
+                         (":BLOCKER:     ids(BUILD-001)\n", 1))
+        
+    def test_repeated_blocker_conditions_all_removed(self):
+        self.assertEqual(self.apply(":BLOCKER: ids(a) todo?(DONE) todo?(DONE)"),
+                         (":BLOCKER:     ids(a)", 2))
+        
+    def test_children_blocker(self):
+        self.assertEqual(self.apply(":BLOCKER: children todo?(DONE)"),
+                         (":BLOCKER:     children", 1))
+        
+    def test_trigger_already_fixed_terminates_without_counting(self):
+        text = ":TRIGGER:     children todo!(NEXT)\n"
+        self.assertEqual(self.apply(text), (text, 0))
+        
+    def test_trigger_spacing_normalized(self):
+        self.assertEqual(self.apply(":TRIGGER: children todo!(NEXT)"),
+                         (":TRIGGER:     children todo!(NEXT)", 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for TaskMigrator's already-migrated detection
+"""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / ".claude" / "scrum"))
+
+from migrate_tasks import TaskMigrator
+
+
+class TestMigrationDetection(unittest.TestCase):
+    """A task needs migrating only when its frontmatter lacks depends_on"""
+    
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.migrator = TaskMigrator()
+        
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+        
+    def create_task(self, content: str) -> str:
+        filepath = Path(self.test_dir) / "TASK-001.md"
+        filepath.write_text(content)
+        return str(filepath)
+        
+    def test_migrated_frontmatter(self):
+        filepath = self.create_task("---\ntask_id: TASK-001\ndepends_on: []\n---\n# Task\n")
+        self.assertTrue(self.migrator._is_already_migrated_fast(filepath))
+        self.assertEqual(self.migrator._load_for_migration(filepath), (None, True))
+        
+    def test_unmigrated_frontmatter_is_loaded(self):
+        # The parser defaults depends_on, so the old parsed check always
+        # reported files like this one as migrated
+        filepath = self.create_task("---\ntask_id: TASK-001\nstatus: TODO\n---\n# Task\n")
+        self.assertFalse(self.migrator._is_already_migrated_fast(filepath))
+        task, ok = self.migrator._load_for_migration(filepath)
+        self.assertTrue(ok)
+        self.assertEqual(task['metadata']['task_id'], 'TASK-001')
+        
+    def test_depends_on_in_body_does_not_count(self):
+        filepath = self.create_task("---\ntask_id: TASK-001\n---\ndepends_on: [X]\n")
+        self.assertFalse(self.migrator._is_already_migrated_fast(filepath))
+        
+    def test_long_frontmatter(self):
+        # Both the key and the closing delimiter lie past the first read
+        padding = "".join(f"note_{i}: {'x' * 60}\n" for i in range(100))
+        filepath = self.create_task(f"---\ntask_id: TASK-001\n{padding}depends_on: [TASK-000]\n---\n# Task\n")
+        self.assertTrue(self.migrator._is_already_migrated_fast(filepath))
+        self.assertEqual(self.migrator._load_for_migration(filepath), (None, True))
+        
+        filepath = self.create_task(f"---\ntask_id: TASK-001\n{padding}---\n# Task\n")
+        self.assertFalse(self.migrator._is_already_migrated_fast(filepath))
+        task, ok = self.migrator._load_for_migration(filepath)
+        self.assertTrue(ok)
+        self.assertIsNotNone(task)
+        
+    def test_null_depends_on_needs_migrating(self):
+        for value in (" null", " ~", "", "  # none yet"):
+            filepath = self.create_task(f"---\ntask_id: TASK-001\ndepends_on:{value}\nstatus: TODO\n---\n")
+            self.assertFalse(self.migrator._is_already_migrated_fast(filepath), value)
+            task, ok = self.migrator._load_for_migration(filepath)
+            self.assertTrue(ok)
+            self.assertIsNotNone(task)
+            
+    def test_block_sequence_depends_on(self):
+        filepath = self.create_task("---\ntask_id: TASK-001\ndepends_on:\n  - TASK-000\n---\n")
+        self.assertTrue(self.migrator._is_already_migrated_fast(filepath))
+        
+    def test_missing_frontmatter_is_inconclusive(self):
+        filepath = self.create_task("# Task without frontmatter\n")
+        self.assertIsNone(self.migrator._is_already_migrated_fast(filepath))
+
+
+if __name__ == '__main__':
+    unittest.main()
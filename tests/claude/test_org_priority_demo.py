@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Tests for the priority demo's parallel execution sets
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / ".claude" / "tools"))
+
+from org_priority_demo import Task, TaskGraph
+
+
+def make_task(task_id: str, depends: list, state: str = 'TODO', actionable: bool = True) -> Task:
+    return Task(task_id, task_id, state, 'A', depends, [], [], 2, False, actionable)
+
+
+class TestParallelExecutionSets(unittest.TestCase):
+    """get_parallel_execution_sets layers ready tasks by their dependencies"""
+    
+    def parallel_sets(self, tasks: list) -> list:
+        return TaskGraph(tasks).get_parallel_execution_sets(tasks)
+        
+    def test_independent_tasks_share_one_set(self):
+        tasks = [make_task('A', []), make_task('B', []), make_task('C', ['missing'])]
+        self.assertEqual(self.parallel_sets(tasks), [['A', 'B', 'C']])
+        
+    def test_dependencies_produce_later_sets(self):
+        tasks = [
+            make_task('A', []),
+            make_task('B', ['A']),
+            make_task('C', ['A', 'B']),
+            make_task('D', []),
+        ]
+        self.assertEqual(self.parallel_sets(tasks), [['A', 'D'], ['B'], ['C']])
+        
+    def test_done_dependencies_do_not_delay(self):
+        tasks = [make_task('A', [], state='DONE'), make_task('B', ['A'])]
+        self.assertEqual(self.parallel_sets(tasks), [['B']])
+        
+    def test_cycles_are_left_out(self):
+        tasks = [make_task('A', []), make_task('X', ['Y']), make_task('Y', ['X'])]
+        self.assertEqual(self.parallel_sets(tasks), [['A']])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Tests for the org task graph's on-disk block cache (.claude/tools/org-task-graph.py)
+"""
+
+import importlib.util
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_SCRIPT = Path(__file__).parent.parent.parent / ".claude" / "tools" / "org-task-graph.py"
+_spec = importlib.util.spec_from_file_location("org_task_graph", _SCRIPT)
+org_task_graph = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(org_task_graph)
+
+
+ORG = """#+TITLE: Tasks
+
+* TODO [#A] Build pipeline
+:PROPERTIES:
+:ID: BUILD-001
+:EFFORT: 4h
+:END:
+** TODO Write codec
+** NEXT Wire relay
+:PROPERTIES:
+:BLOCKER: ids(BUILD-001)
+:END:
+* DONE Ship protocol
+:PROPERTIES:
+:ID: PROTO-001
+:TRIGGER: ids(BUILD-001)
+:END:
+** DONE Draft spec
+* TODO [#B] Benchmarks
+** TODO Measure latency
+:PROPERTIES:
+:ASSIGNED: alice
+:END:
+"""
+
+
+def snapshot(graph) -> tuple:
+    """Everything a parse produces, in a comparable form"""
+    tasks = {
+        task_id: (task.title, task.state, task.level, task.blockers, task.triggers,
+                  task.children, task.parent, task.priority, task.effort,
+                  task.assigned, task.actionable)
+        for task_id, task in graph.tasks.items()
+    }
+    next_actions = [task.id for task in graph.find_next_actions()]
+    return list(graph.tasks), tasks, graph.root_tasks, next_actions
+
+
+class TestGraphBlockCache(unittest.TestCase):
+    """An incremental parse from the block cache matches a cold parse"""
+    
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.org_file = self.test_dir / "active.org"
+        self.cache_home = self.test_dir / "cache"
+        env = mock.patch.dict(os.environ, {'XDG_CACHE_HOME': str(self.cache_home)})
+        env.start()
+        self.addCleanup(env.stop)
+    
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def write_org(self, text: str) -> None:
+        # A fresh mtime even when the size is unchanged
+        mtime = self.org_file.stat().st_mtime_ns + 10**9 if self.org_file.exists() else None
+        self.org_file.write_text(text)
+        if mtime is not None:
+            os.utime(self.org_file, ns=(mtime, mtime))
+    
+    def parse(self) -> tuple:
+        """Parse through the cache; returns (snapshot, blocks tokenized)"""
+        graph = org_task_graph.OrgTaskGraph()
+        parse_block = graph._parse_block
+        with mock.patch.object(graph, '_parse_block', side_effect=parse_block) as spy:
+            graph.parse_org_file(self.org_file)
+        return snapshot(graph), spy.call_count
+    
+    def cold_parse(self) -> tuple:
+        """Parse with an empty cache directory"""
+        cold_home = tempfile.mkdtemp(dir=self.test_dir)
+        with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': cold_home}):
+            graph = org_task_graph.OrgTaskGraph()
+            graph.parse_org_file(self.org_file)
+        return snapshot(graph)
+    
+    def cache_file(self) -> Path:
+        return org_task_graph._graph_cache_path(self.org_file)
+    
+    def test_unchanged_file_uses_cache(self):
+        self.write_org(ORG)
+        cold, _ = self.parse()
+        warm, parsed = self.parse()
+        self.assertEqual(parsed, 0)
+        self.assertEqual(warm, cold)
+    
+    def test_edit_one_block(self):
+        self.write_org(ORG)
+        self.parse()
+        
+        # An extra heading without an ID shifts every later task_N line
+        edited = ORG.replace("** TODO Write codec\n", "** TODO Write codec\n** TODO Fuzz codec\n")
+        self.write_org(edited)
+        warm, parsed = self.parse()
+        self.assertEqual(parsed, 1)
+        self.assertEqual(warm, self.cold_parse())
+        self.assertEqual(warm[0], ['task_7', 'task_8', 'task_9', 'task_18', 'task_19', 'task_20',
+                                   'BUILD-001', 'PROTO-001'])
+        
+        # Same size, different bytes
+        self.write_org(edited.replace("[#B] Benchmarks", "[#C] Benchmarks"))
+        warm, parsed = self.parse()
+        self.assertEqual(parsed, 1)
+        self.assertEqual(warm, self.cold_parse())
+    
+    def test_unclosed_properties_across_blocks(self):
+        # The drawer under "Wire relay" is still open when the next
+        # top-level heading starts a block
+        unclosed = ORG.replace(":BLOCKER: ids(BUILD-001)\n:END:\n", ":BLOCKER: ids(BUILD-001)\n")
+        self.write_org(unclosed)
+        self.parse()
+        with open(self.cache_file(), 'rb') as f:
+            _, _, layout, _ = pickle.load(f)
+        self.assertEqual([in_properties for _, in_properties in layout], [False, False, True, False])
+        
+        # Closing the drawer changes the state the following block starts in
+        self.write_org(ORG)
+        warm, parsed = self.parse()
+        self.assertEqual(parsed, 2)
+        self.assertEqual(warm, self.cold_parse())
+        
+        # Reopening it: the same two blocks are tokenized again
+        self.write_org(unclosed)
+        warm, parsed = self.parse()
+        self.assertEqual(parsed, 2)
+        self.assertEqual(warm, self.cold_parse())
+        
+        # Editing the block after the open drawer keeps its starting state
+        self.write_org(unclosed.replace("Draft spec", "Review spec"))
+        warm, parsed = self.parse()
+        self.assertEqual(parsed, 1)
+        self.assertEqual(warm, self.cold_parse())
+        
+    def test_corrupt_cache_falls_back(self):
+        self.write_org(ORG)
+        cold, blocks = self.parse()
+        
+        self.cache_file().write_bytes(b"not a pickle")
+        warm, parsed = self.parse()
+        self.assertEqual(parsed, blocks)
+        self.assertEqual(warm, cold)
+        
+        # The fallback parse rewrote a usable cache
+        _, parsed = self.parse()
+        self.assertEqual(parsed, 0)
+    
+    def test_old_cache_version_falls_back(self):
+        self.write_org(ORG)
+        cold, blocks = self.parse()
+        
+        with open(self.cache_file(), 'rb') as f:
+            _, stamp, layout, cached_blocks = pickle.load(f)
+        self.cache_file().write_bytes(pickle.dumps(
+            (org_task_graph._GRAPH_CACHE_VERSION - 1, stamp, layout, cached_blocks)))
+        warm, parsed = self.parse()
+        self.assertEqual(parsed, blocks)
+        self.assertEqual(warm, cold)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for OrgTaskParser dependency validation
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / ".claude" / "tools"))
+
+try:
+    import orgparse  # noqa: F401 -- org_task_parser exits without it
+except ImportError:
+    orgparse = None
+
+if orgparse is not None:
+    from org_task_parser import OrgTaskParser, Task
+
+
+def make_parser(depends: dict) -> 'OrgTaskParser':
+    """Parser holding one TODO task per entry of {task_id: 'dep dep ...'}"""
+    parser = OrgTaskParser()
+    parser.tasks = {
+        task_id: Task(id=task_id, heading=task_id, state='TODO',
+                      properties={'depends': deps} if deps else {})
+        for task_id, deps in depends.items()
+    }
+    return parser
+
+
+@unittest.skipIf(orgparse is None, "orgparse not installed")
+class TestDependencyCycles(unittest.TestCase):
+    """_find_dependency_cycles reports one cycle per DFS root"""
+    
+    def test_no_cycles(self):
+        parser = make_parser({'A': 'B', 'B': 'C', 'C': ''})
+        self.assertEqual(parser._find_dependency_cycles(), [])
+        
+    def test_simple_cycle(self):
+        parser = make_parser({'A': 'B', 'B': 'A'})
+        self.assertEqual(parser._find_dependency_cycles(), [['A', 'B', 'A']])
+        
+    def test_task_depending_on_earlier_cycle(self):
+        # After the A/B cycle, C reaches A again; the recursive walk left A
+        # in its recursion set and raised ValueError from path.index()
+        parser = make_parser({'A': 'B', 'B': 'A', 'C': 'A'})
+        self.assertEqual(parser._find_dependency_cycles(), [['A', 'B', 'A']])
+        
+    def test_unknown_dependencies_ignored(self):
+        parser = make_parser({'A': 'X B', 'B': 'Y'})
+        self.assertEqual(parser._find_dependency_cycles(), [])
+        
+    def test_long_chain(self):
+        # Deeper than the default recursion limit
+        n = 5000
+        parser = make_parser({f'T{i}': f'T{(i + 1) % n}' for i in range(n)})
+        cycles = parser._find_dependency_cycles()
+        self.assertEqual(len(cycles), 1)
+        self.assertEqual(len(cycles[0]), n + 1)
+        
+    def test_validate_reports_cycle(self):
+        parser = make_parser({'A': 'B', 'B': 'A', 'C': 'A'})
+        valid, errors = parser.validate()
+        self.assertFalse(valid)
+        self.assertIn("Dependency cycle detected: A -> B -> A", errors)
+
+
+if __name__ == '__main__':
+    unittest.main()
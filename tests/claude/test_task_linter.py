@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for TaskLinter report aggregation
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / ".claude" / "scrum"))
+
+from task_linter import LintCode, TaskLinter
+
+
+TASKS = {
+    'TASK-001.md': "task_id: TASK-001\nstatus: TODO\npriority: HIGH\nscope: [libs/a.rs]\n",
+    'TASK-002.md': "task_id: TASK-002\nstatus: WAITING\npriority: HIGH\nscope: [libs/b.rs]\n",
+    'TASK-003.md': "task_id: TASK-003\nstatus: DONE\npriority: LOW\n",
+    'bad.md': "task_id: bad id\nstatus: TODO\npriority: LOW\ndepends_on: [1]\nscope: [libs/c.rs]\n",
+    'TASK-004.md': "task_id: TASK-004\nstatus: TODO\npriority: LOW\ndepends_on: [TASK-005]\nscope: [libs/d.rs]\n",
+    'TASK-005.md': "task_id: TASK-005\nstatus: TODO\npriority: LOW\ndepends_on: [TASK-004]\nscope: [libs/e.rs]\n",
+}
+
+
+class TestGenerateReport(unittest.TestCase):
+    """Report counts come from the LintCode of each error and warning"""
+    
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        sprint_dir = Path(self.test_dir) / "tasks" / "sprint-001"
+        sprint_dir.mkdir(parents=True)
+        for name, frontmatter in TASKS.items():
+            (sprint_dir / name).write_text(f"---\n{frontmatter}---\n# Task\n")
+        
+        env = mock.patch.dict(os.environ, {'XDG_CACHE_HOME': str(Path(self.test_dir) / "cache")})
+        env.start()
+        self.addCleanup(env.stop)
+        
+        self.linter = TaskLinter()
+        self.linter.parser.task_dir = Path(self.test_dir) / "tasks"
+    
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def test_report_counts(self):
+        report = self.linter.generate_report(jobs=1)
+        
+        self.assertEqual(report['total_tasks'], 6)
+        self.assertEqual(report['valid_tasks'], 4)
+        self.assertEqual(report['tasks_with_errors'], 2)
+        self.assertEqual(report['invalid_status'], 1)
+        self.assertEqual(report['invalid_format'], 2)
+        self.assertEqual(report['missing_scope'], 1)
+        self.assertEqual(report['missing_dependencies'], 0)
+        self.assertEqual(report['dependency_cycles'], 2)
+    
+    def test_missing_dependency_codes(self):
+        # The parser defaults depends_on, so these codes only come from
+        # metadata built elsewhere
+        results = [
+            (False, [(LintCode.MISSING_DEPENDS, "m"), (LintCode.STATUS_WITHOUT_DEPENDS, "s")], []),
+            (False, [(LintCode.MISSING_STATUS, "m")], [(LintCode.MISSING_SCOPE, "m")]),
+        ]
+        all_tasks = [
+            {'filepath': 'TASK-001.md', 'metadata': {'task_id': 'TASK-001'}},
+            {'filepath': 'TASK-002.md', 'metadata': {'task_id': 'TASK-002'}},
+        ]
+        with mock.patch.object(self.linter, '_lint_many', return_value=iter(results)):
+            report = self.linter._build_report(all_tasks)
+        
+        self.assertEqual(report['missing_dependencies'], 2)
+        self.assertEqual(report['invalid_status'], 1)
+        self.assertEqual(report['missing_scope'], 1)
+        self.assertEqual(report['tasks_with_errors'], 2)
+        self.assertEqual(report['tasks_with_warnings'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()